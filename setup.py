@@ -121,6 +121,8 @@ setup(
             'ptweens = pyramid.scripts.ptweens:main',
             'prequest = pyramid.scripts.prequest:main',
             'pdistreport = pyramid.scripts.pdistreport:main',
+            'pcompress = pyramid.scripts.pcompress:main',
+            'pcachebust = pyramid.scripts.pcachebust:main',
         ],
     },
 )
@@ -0,0 +1,333 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import threading
+from webob.request import DisconnectionError
+
+# the environ key under which the event loop serving a request is stored
+LOOP_KEY = 'pyramid.event_loop'
+
+
+class ASGIApplication:
+    """An ASGI application which serves requests with a
+    :app:`Pyramid` :term:`router`.
+
+    ``router`` is the object returned by
+    :meth:`pyramid.config.Configurator.make_wsgi_app`.  An instance is
+    usually obtained via
+    :meth:`pyramid.config.Configurator.make_asgi_app` and handed to an
+    ASGI server such as ``uvicorn`` or ``hypercorn``.
+
+    Each ``http`` connection scope is translated into a minimal request
+    environment (no WSGI server sits in between).  The request body is
+    received from the server as the application reads ``wsgi.input``, as a
+    WSGI server streams it, and the response body is sent back to the
+    client one ``app_iter`` chunk at a time.  The ``lifespan`` protocol is
+    acknowledged so that servers which require it start normally.
+
+    The :app:`Pyramid` router is synchronous.  Each request is processed by
+    the router's :term:`execution policy` (by default
+    :meth:`pyramid.router.Router.request_context` and
+    :meth:`pyramid.router.Router.invoke_request`) in a thread of
+    ``executor``, an instance of :class:`concurrent.futures.Executor`.  The
+    ``app_iter`` of the response is iterated in the same thread, which
+    hands each chunk to the event loop to be sent, and waits for the event
+    loop to receive the request body as it is read.  When ``executor`` is
+    ``None`` a :class:`concurrent.futures.ThreadPoolExecutor` dedicated to
+    the application is created.  This is the thread pool model of a WSGI
+    server behind an ASGI interface: at most as many requests are processed
+    at once as the executor has threads, and this includes requests handled
+    by views defined as coroutines (see :func:`await_result`).
+
+    A thread of ``executor`` waits for the coroutine views it runs, so
+    ``executor`` must not be an executor that these coroutines wait for in
+    turn, such as the default executor of the event loop used by
+    :func:`asyncio.to_thread` and ``loop.run_in_executor(None, ...)``.
+    Otherwise every thread may end up waiting for work queued behind it, and
+    the application deadlocks once as many requests run at once as the
+    executor has threads.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, router, executor=None):
+        self.router = router
+        self.registry = router.registry
+        if executor is None:
+            # never the default executor of the loop, which coroutine views
+            # may wait for
+            executor = ThreadPoolExecutor(thread_name_prefix='pyramid-asgi')
+        self.executor = executor
+
+    async def __call__(self, scope, receive, send):
+        scope_type = scope['type']
+        if scope_type == 'http':
+            await self.handle_http(scope, receive, send)
+        elif scope_type == 'lifespan':
+            await self.handle_lifespan(scope, receive, send)
+        else:
+            raise ValueError(f'Unsupported ASGI scope type: {scope_type!r}')
+
+    async def handle_lifespan(self, scope, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle_http(self, scope, receive, send):
+        loop = asyncio.get_running_loop()
+        environ = _environ_from_scope(scope, _ReceiveInput(receive, loop))
+        environ[LOOP_KEY] = loop
+        try:
+            messages = await loop.run_in_executor(
+                self.executor, self.serve, environ, send, loop
+            )
+        except DisconnectionError:
+            # the client went away before sending the whole request
+            return
+        # the response was not streamed as its body was complete already
+        for message in messages:
+            await send(message)
+
+    def serve(self, environ, send, loop):
+        """Process the request of ``environ`` in the current thread.
+
+        If the body of the response is a list or tuple, its ASGI messages
+        are returned, to be sent by the event loop.  Otherwise they are
+        sent as the ``app_iter`` is iterated, by calling ``send`` on
+        ``loop``, and an empty list is returned."""
+        started = []
+
+        def start_response(status, headerlist, exc_info=None):
+            started[:] = [status, headerlist]
+
+        app_iter = self.get_app_iter(environ, start_response)
+        try:
+            status, headerlist = started
+            start = _start_message(status, headerlist)
+            if isinstance(app_iter, (list, tuple)):
+                # nothing left to compute; let the event loop send it
+                messages = [start]
+                messages.extend(
+                    _body_message(chunk) for chunk in app_iter if chunk
+                )
+                messages.append(_body_message(b'', False))
+                return messages
+
+            def call(message):
+                asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+            call(start)
+            for chunk in app_iter:
+                if chunk:
+                    call(_body_message(chunk))
+            call(_body_message(b'', False))
+            return []
+        finally:
+            close = getattr(app_iter, 'close', None)
+            if close is not None:
+                close()
+
+    def get_app_iter(self, environ, start_response):
+        router = self.router
+        response = router.execution_policy(environ, router)
+        return response(environ, start_response)
+
+
+def _start_message(status, headerlist):
+    return {
+        'type': 'http.response.start',
+        'status': int(status.split(' ', 1)[0]),
+        'headers': [
+            (name.lower().encode('latin-1'), value.encode('latin-1'))
+            for name, value in headerlist
+        ],
+    }
+
+
+def _body_message(chunk, more_body=True):
+    message = {'type': 'http.response.body', 'body': chunk}
+    if more_body:
+        message['more_body'] = True
+    return message
+
+
+class _ReceiveInput:
+    """The ``wsgi.input`` of a request received by an
+    :class:`ASGIApplication`.  It is read from the thread processing the
+    request, which waits for the ASGI ``receive`` callable to be called on
+    ``loop`` whenever more of the body is needed.  A
+    :class:`webob.request.DisconnectionError` is raised if the client goes
+    away before sending the whole body."""
+
+    def __init__(self, receive, loop):
+        self._receive = receive
+        self._loop = loop
+        self._buffer = bytearray()
+        self._more_body = True
+
+    def _receive_more(self):
+        message = asyncio.run_coroutine_threadsafe(
+            self._receive(), self._loop
+        ).result()
+        if message['type'] == 'http.disconnect':
+            self._more_body = False
+            raise DisconnectionError('The client disconnected')
+        self._buffer += message.get('body', b'')
+        self._more_body = message.get('more_body', False)
+
+    def _take(self, size):
+        buffer = self._buffer
+        data = bytes(buffer[:size])
+        del buffer[:size]
+        return data
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            while self._more_body:
+                self._receive_more()
+            return self._take(len(self._buffer))
+        while self._more_body and len(self._buffer) < size:
+            self._receive_more()
+        return self._take(size)
+
+    def readline(self, size=-1):
+        if size is None or size < 0:
+            size = sys.maxsize
+        while True:
+            end = self._buffer.find(b'\n') + 1
+            if end or not self._more_body or len(self._buffer) >= size:
+                break
+            self._receive_more()
+        if not end:
+            end = len(self._buffer)
+        return self._take(min(end, size))
+
+    def readlines(self, hint=-1):
+        lines = []
+        total = 0
+        for line in self:
+            lines.append(line)
+            total += len(line)
+            if 0 < hint <= total:
+                break
+        return lines
+
+    def __iter__(self):
+        return iter(self.readline, b'')
+
+
+def _environ_from_scope(scope, input):
+    """Return the request environment for an ASGI ``http`` connection
+    ``scope`` whose request body is read from the file-like ``input``.  Only
+    the keys required by :class:`pyramid.request.Request` are populated;
+    the scope itself is available as ``asgi.scope``."""
+    root_path = scope.get('root_path', '')
+    path = scope['path']
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    scheme = scope.get('scheme', 'http')
+    server = scope.get('server') or (
+        'localhost',
+        443 if scheme == 'https' else 80,
+    )
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path.encode('utf-8').decode('latin-1'),
+        'PATH_INFO': path.encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/' + scope.get('http_version', '1.1'),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scheme,
+        'wsgi.input': input,
+        # the input ends with the body even without a Content-Length
+        'wsgi.input_terminated': True,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+        'asgi.scope': scope,
+    }
+    client = scope.get('client')
+    if client:
+        environ['REMOTE_ADDR'] = client[0]
+        environ['REMOTE_PORT'] = str(client[1])
+    for name, value in scope.get('headers', ()):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            key = name
+        else:
+            key = 'HTTP_' + name
+        if key in environ:
+            value = environ[key] + ',' + value
+        environ[key] = value
+    return environ
+
+
+_shared_loop_lock = threading.Lock()
+_shared_loop = None
+_shared_loop_pid = None
+
+
+def _get_shared_loop():
+    # an event loop running in a daemon thread, started on first use and
+    # restarted in a forked child, whose parent's loop thread is gone
+    global _shared_loop, _shared_loop_pid
+    with _shared_loop_lock:
+        pid = os.getpid()
+        if _shared_loop is None or _shared_loop_pid != pid:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name='pyramid-event-loop',
+                daemon=True,
+            )
+            thread.start()
+            _shared_loop, _shared_loop_pid = loop, pid
+        return _shared_loop
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def await_result(request, awaitable):
+    """Wait for ``awaitable`` to complete and return its result.
+
+    This is a bridge blocking the calling thread, not native asynchronous
+    execution.  The awaitable is run on the event loop of the ASGI server
+    handling ``request`` if it was received by a :class:`ASGIApplication`,
+    or else on an event loop shared by every request of the current process
+    and running in a thread of its own, while the thread processing the
+    request waits for its result.  That thread, a WSGI server thread or an
+    executor thread of the :class:`ASGIApplication`, is therefore held for
+    the whole duration of the awaitable, and the number of coroutine views
+    running at once is bounded by the number of such threads.  What the
+    awaitable gains is the ability to perform many I/O operations
+    concurrently, for instance with :func:`asyncio.gather`.
+
+    .. versionadded:: 2.1
+    """
+    environ = getattr(request, 'environ', None) or {}
+    loop = environ.get(LOOP_KEY)
+    if loop is None:
+        loop = _get_shared_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        raise RuntimeError(
+            'Cannot wait for an awaitable from the thread running the '
+            'event loop it is scheduled on'
+        )
+    if not asyncio.iscoroutine(awaitable):
+        awaitable = _await(awaitable)
+    return asyncio.run_coroutine_threadsafe(awaitable, loop).result()
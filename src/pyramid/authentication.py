@@ -2,6 +2,7 @@ import base64
 import binascii
 from codecs import utf_8_decode, utf_8_encode
 from collections import namedtuple
+import functools
 import hashlib
 import re
 import time as time_mod
@@ -13,6 +14,7 @@ from zope.interface import implementer
 from pyramid.authorization import Authenticated, Everyone
 from pyramid.interfaces import IAuthenticationPolicy, IDebugLogger
 from pyramid.util import (
+    LRUCache,
     SimpleSerializer,
     ascii_,
     bytes_,
@@ -573,6 +575,17 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
         Default: ``'Lax'``.  The 'samesite' option of the session cookie. Set
         the value to the string ``'None'`` to turn off the samesite option.
 
+    ``ticket_cache_size``
+
+       Default: ``0``.  The number of parsed auth tickets remembered, so
+       that a ticket received again from the same remote address is neither
+       parsed nor verified again.  Only tickets with a valid signature are
+       remembered, and ``timeout`` and ``reissue_time`` are still checked
+       against the current time on every request.  The cache is available
+       as the ``ticket_cache`` attribute of the cookie helper, a
+       ``pyramid.util.LRUCache`` counting ``hits`` and ``misses``.  If this
+       value is ``0`` no tickets are remembered.  Optional.
+
     .. versionchanged:: 1.4
 
        Added the ``hashalg`` option, defaulting to ``sha512``.
@@ -587,6 +600,10 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
 
        Added the ``samesite`` option and made the default ``'Lax'``.
 
+    .. versionchanged:: 2.1
+
+       Added the ``ticket_cache_size`` option.
+
     Objects of this class implement the interface described by
     :class:`pyramid.interfaces.IAuthenticationPolicy`.
 
@@ -610,6 +627,7 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
         parent_domain=False,
         domain=None,
         samesite='Lax',
+        ticket_cache_size=0,
     ):
         self.cookie = AuthTktCookieHelper(
             secret,
@@ -626,6 +644,7 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
             parent_domain=parent_domain,
             domain=domain,
             samesite=samesite,
+            ticket_cache_size=ticket_cache_size,
         )
         self.callback = callback
         self.debug = debug
@@ -746,7 +765,7 @@ def parse_ticket(secret, ticket, ip, hashalg='md5'):
     with an explanation.
     """
     ticket = text_(ticket).strip('"')
-    digest_size = hashlib.new(hashalg).digest_size * 2
+    digest_size = _new_hash(hashalg).digest_size * 2
     digest = ticket[:digest_size]
     try:
         timestamp = int(ticket[digest_size : digest_size + 8], 16)
@@ -788,7 +807,7 @@ def calculate_digest(
     userid = bytes_(userid, 'utf-8')
     tokens = bytes_(tokens, 'utf-8')
     user_data = bytes_(user_data, 'utf-8')
-    hash_obj = hashlib.new(hashalg)
+    hash_obj = _new_hash(hashalg)
 
     # Check to see if this is an IPv6 address
     if ':' in ip:
@@ -802,11 +821,21 @@ def calculate_digest(
         ip_timestamp + secret + userid + b'\0' + tokens + b'\0' + user_data
     )
     digest = hash_obj.hexdigest()
-    hash_obj2 = hashlib.new(hashalg)
+    hash_obj2 = _new_hash(hashalg)
     hash_obj2.update(bytes_(digest) + secret)
     return hash_obj2.hexdigest()
 
 
+@functools.lru_cache(100)
+def _hash_prototype(hashalg):
+    return hashlib.new(hashalg)
+
+
+def _new_hash(hashalg):
+    # copying an empty hash object is faster than creating one by name
+    return _hash_prototype(hashalg).copy()
+
+
 # this function licensed under the MIT license (stolen from Paste)
 def encode_ip_timestamp(ip, timestamp):
     ip_chars = ''.join(map(chr, map(int, ip.split('.'))))
@@ -959,10 +988,25 @@ class AuthTktCookieHelper:
         Default: ``'Lax'``.  The 'samesite' option of the session cookie. Set
         the value to ``None`` to turn off the samesite option. Optional.
 
+    ``ticket_cache_size``
+
+        Default: ``0``.  The number of parsed auth tickets remembered, so
+        that a ticket received again from the same remote address is
+        neither parsed nor verified again.  Only tickets with a valid
+        signature are remembered, and ``timeout`` and ``reissue_time`` are
+        still checked against the current time on every request.  The cache
+        is available as the ``ticket_cache`` attribute, a
+        ``pyramid.util.LRUCache`` counting ``hits`` and ``misses``.  If this
+        value is ``0`` no tickets are remembered.  Optional.
+
     .. versionchanged:: 2.0
 
         The default ``hashalg`` was changed from ``md5`` to ``sha512``.
 
+    .. versionchanged:: 2.1
+
+        Added the ``ticket_cache_size`` option.
+
     """
 
     parse_ticket = staticmethod(parse_ticket)  # for tests
@@ -999,6 +1043,7 @@ class AuthTktCookieHelper:
         parent_domain=False,
         domain=None,
         samesite='Lax',
+        ticket_cache_size=0,
     ):
         self.cookie_profile = CookieProfile(
             cookie_name=cookie_name,
@@ -1023,6 +1068,27 @@ class AuthTktCookieHelper:
         self.parent_domain = parent_domain
         self.domain = domain
         self.hashalg = hashalg
+        self.ticket_cache = None
+        if ticket_cache_size > 0:
+            self.ticket_cache = LRUCache(ticket_cache_size)
+
+    def _parse_ticket(self, cookie, remote_addr):
+        cache = self.ticket_cache
+        if cache is None:
+            return self.parse_ticket(
+                self.secret, cookie, remote_addr, self.hashalg
+            )
+        key = (cookie, remote_addr)
+        parsed = cache.get(key)
+        if parsed is None:
+            # a ticket is only remembered once its signature is verified
+            timestamp, userid, tokens, user_data = self.parse_ticket(
+                self.secret, cookie, remote_addr, self.hashalg
+            )
+            parsed = (timestamp, userid, tuple(tokens), user_data)
+            cache.put(key, parsed)
+        timestamp, userid, tokens, user_data = parsed
+        return timestamp, userid, list(tokens), user_data
 
     def _get_cookies(self, request, value, max_age=None):
         if self.domain:
@@ -1060,8 +1126,8 @@ class AuthTktCookieHelper:
             remote_addr = '0.0.0.0'
 
         try:
-            timestamp, userid, tokens, user_data = self.parse_ticket(
-                self.secret, cookie, remote_addr, self.hashalg
+            timestamp, userid, tokens, user_data = self._parse_ticket(
+                cookie, remote_addr
             )
         except self.BadTicket:
             return None
@@ -5,6 +5,8 @@ import threading
 import venusian
 from webob.exc import WSGIHTTPException as WebobWSGIHTTPException
 
+from pyramid import threadlocal
+from pyramid.asgi import ASGIApplication
 from pyramid.asset import resolve_asset_spec
 from pyramid.authorization import ACLAuthorizationPolicy
 from pyramid.config.actions import (
@@ -40,8 +42,13 @@ from pyramid.path import DottedNameResolver, caller_package, package_of
 from pyramid.registry import Introspectable, Introspector, Registry
 from pyramid.router import Router
 from pyramid.settings import aslist
-from pyramid.threadlocal import manager
-from pyramid.util import WeakOrderedSet, get_callable_name, object_description
+from pyramid.util import (
+    LRUCache,
+    WeakOrderedSet,
+    get_callable_name,
+    object_description,
+)
+from pyramid.view import _precompute_view_lookups
 
 _marker = object()
 
@@ -251,7 +258,7 @@ class Configurator(
        further configuration with an implicit commit.
     """
 
-    manager = manager  # for testing injection
+    _manager = None  # for testing injection
     venusian = venusian  # for testing injection
     _ainfo = None
     basepath = None
@@ -261,6 +268,17 @@ class Configurator(
     introspectable = Introspectable
     inspect = inspect
 
+    @property
+    def manager(self):
+        # looked up on each use as it may be replaced at configuration time
+        if self._manager is not None:
+            return self._manager
+        return threadlocal.manager
+
+    @manager.setter
+    def manager(self, manager):
+        self._manager = manager
+
     def __init__(
         self,
         registry=None,
@@ -354,7 +372,19 @@ class Configurator(
 
         self._fix_registry()
 
-        self._set_settings(settings)
+        settings = self._set_settings(settings)
+
+        if settings['pyramid.use_contextvars'] and not isinstance(
+            threadlocal.manager, threadlocal.ContextVarManager
+        ):
+            threadlocal.set_manager(
+                threadlocal.ContextVarManager(default=threadlocal.defaults)
+            )
+
+        miss_cache_size = settings['pyramid.view_lookup_miss_cache_size']
+        registry.view_lookup_miss_cache = (
+            LRUCache(miss_cache_size) if miss_cache_size > 0 else None
+        )
 
         if isinstance(debug_logger, str):
             debug_logger = logging.getLogger(debug_logger)
@@ -501,6 +531,9 @@ class Configurator(
 
             def _clear_view_lookup_cache():
                 _registry._view_lookup_cache = {}
+                miss_cache = getattr(_registry, 'view_lookup_miss_cache', None)
+                if miss_cache is not None:
+                    miss_cache.clear()
 
             _registry._clear_view_lookup_cache = _clear_view_lookup_cache
 
@@ -881,13 +914,41 @@ class Configurator(
             package, categories=categories, onerror=onerror, ignore=ignore
         )
 
-    def make_wsgi_app(self):
+    def freeze(self):
+        """Commits any pending configuration statements and freezes the
+        registry of this configurator, making it read-only.
+
+        The views of every combination of route, context and view name known
+        from the configuration are looked up ahead of time, so that serving a
+        request only reads from the view lookup cache.  Views for contexts
+        which are not known ahead of time are cached on first use as usual,
+        but without taking the registry's lock, as the cache is never cleared
+        again.  Any further configuration of the registry, by this or any
+        other configurator, raises a
+        :exc:`pyramid.exceptions.ConfigurationError`.
+
+        .. versionadded:: 2.1
+        """
+        self.commit()
+        registry = self.registry
+        registry._clear_view_lookup_cache()
+        _precompute_view_lookups(registry)
+        registry.frozen = True
+
+    def make_wsgi_app(self, frozen=False):
         """Commits any pending configuration statements, sends a
         :class:`pyramid.events.ApplicationCreated` event to all listeners,
         adds this configuration's registry to
         :attr:`pyramid.config.global_registries`, and returns a
         :app:`Pyramid` WSGI application representing the committed
-        configuration state."""
+        configuration state.
+
+        If ``frozen`` is ``True``, the registry is frozen with
+        :meth:`.freeze` once all listeners have been notified.
+
+        .. versionchanged:: 2.1
+           Added the ``frozen`` argument.
+        """
         self.commit()
         app = Router(self.registry)
 
@@ -904,7 +965,23 @@ class Configurator(
         finally:
             self.end()
 
+        if frozen:
+            self.freeze()
+
         return app
 
+    def make_asgi_app(self, executor=None, frozen=False):
+        """Does everything :meth:`.make_wsgi_app` does but returns the
+        :term:`router` wrapped in a :class:`pyramid.asgi.ASGIApplication`
+        suitable for serving with an ASGI server.  ``executor`` is passed
+        along to the :class:`~pyramid.asgi.ASGIApplication`, which creates
+        a thread pool of its own if it is ``None``.
+
+        .. versionadded:: 2.1
+        """
+        return ASGIApplication(
+            self.make_wsgi_app(frozen=frozen), executor=executor
+        )
+
 
 global_registries = WeakOrderedSet()
@@ -73,6 +73,12 @@ class ActionConfiguratorMixin:
         # autocommit=False, which won't catch unhashable discriminators
         assert hash(discriminator)
 
+        if getattr(self.registry, 'frozen', False):
+            raise ConfigurationError(
+                'The registry has been frozen and cannot be configured '
+                'any further: %r' % (discriminator,)
+            )
+
         if kw is None:
             kw = {}
 
@@ -199,6 +199,8 @@ class FactoriesConfiguratorMixin:
 
             plist = exts.descriptors if property else exts.methods
             plist[name] = callable
+            # request classes derived from the old extensions are stale
+            exts.request_classes = {}
 
         if callable is None:
             self.action(('request extensions', name), None)
@@ -261,3 +263,5 @@ class _RequestExtensions:
     def __init__(self):
         self.descriptors = {}
         self.methods = {}
+        # maps a request class to its subclass carrying the extensions
+        self.request_classes = {}
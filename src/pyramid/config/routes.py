@@ -470,6 +470,11 @@ class RoutesConfiguratorMixin:
                 self.registry.registerUtility(
                     request_iface, IRouteRequest, name=name
                 )
+            # when autocommitting, the route is connected before its
+            # request interface exists
+            route = mapper.get_route(name)
+            if route is not None:
+                route.request_iface = request_iface
 
         def register_connect():
             pvals = predicates.copy()
@@ -496,6 +501,9 @@ class RoutesConfiguratorMixin:
                 pregenerator=pregenerator,
                 static=static,
             )
+            route.request_iface = self.registry.queryUtility(
+                IRouteRequest, name=name
+            )
             intr['object'] = route
             return route
 
@@ -561,7 +569,9 @@ class RoutesConfiguratorMixin:
         this configurator's :term:`registry`."""
         mapper = self.registry.queryUtility(IRoutesMapper)
         if mapper is None:
-            mapper = RoutesMapper()
+            settings = self.registry.settings or {}
+            compiled = settings.get('pyramid.compile_routes', False)
+            mapper = RoutesMapper(compiled=compiled)
             self.registry.registerUtility(mapper, IRoutesMapper)
         return mapper
 
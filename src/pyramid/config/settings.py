@@ -106,6 +106,14 @@ def Settings(d=None, _environ_=os.environ, **kw):
     S('default_locale_name', 'PYRAMID_DEFAULT_LOCALE_NAME', str, 'en')
     S('prevent_http_cache', 'PYRAMID_PREVENT_HTTP_CACHE', asbool)
     S('prevent_cachebust', 'PYRAMID_PREVENT_CACHEBUST', asbool)
+    S('compile_routes', 'PYRAMID_COMPILE_ROUTES', asbool)
+    S('use_contextvars', 'PYRAMID_USE_CONTEXTVARS', asbool)
+    S(
+        'view_lookup_miss_cache_size',
+        'PYRAMID_VIEW_LOOKUP_MISS_CACHE_SIZE',
+        int,
+        0,
+    )
     S('csrf_trusted_origins', 'PYRAMID_CSRF_TRUSTED_ORIGINS', aslist, [])
 
     return d
@@ -52,6 +52,7 @@ from pyramid.static import static_view
 from pyramid.url import parse_url_overrides
 from pyramid.util import (
     WIN,
+    LRUCache,
     TopologicalSorter,
     as_sorted_tuple,
     is_nonstr_iter,
@@ -73,6 +74,9 @@ preserve_view_attrs = preserve_view_attrs  # bw-compat
 requestonly = requestonly  # bw-compat
 view_description = view_description  # bw-compat
 
+# the number of distinct Accept headers whose negotiation a MultiView keeps
+ACCEPT_CACHE_SIZE = 100
+
 
 @implementer(IMultiView)
 class MultiView:
@@ -81,6 +85,9 @@ class MultiView:
         self.media_views = {}
         self.views = []
         self.accepts = []
+        # the offers acceptable to each of the most common Accept headers
+        self.accept_cache = LRUCache(ACCEPT_CACHE_SIZE)
+        self._dispatch = {}
 
     def __discriminator__(self, context, request):
         # used by introspection systems like so:
@@ -92,6 +99,8 @@ class MultiView:
         return view.__discriminator__(context, request)
 
     def add(self, view, order, phash=None, accept=None, accept_order=None):
+        self._dispatch = {}
+        self.accept_cache.clear()
         if phash is not None:
             for i, (s, v, h) in enumerate(list(self.views)):
                 if phash == h:
@@ -120,18 +129,101 @@ class MultiView:
     def get_views(self, request):
         if self.accepts and hasattr(request, 'accept'):
             views = []
-            for offer, _ in request.accept.acceptable_offers(self.accepts):
-                views.extend(self.media_views[offer])
+            for offer in self._get_offers(request):
+                if offer is not None:
+                    views.extend(self.media_views[offer])
             views.extend(self.views)
             return views
         return self.views
 
+    def _get_offers(self, request):
+        # the accept offers acceptable to the request, best first, followed
+        # by None for the views registered without an accept value
+        accepts = self.accepts
+        if not accepts or not hasattr(request, 'accept'):
+            return (None,)
+        # clients send few distinct Accept headers, so negotiate each only
+        # once for the current offers, unless request.accept was set
+        # directly rather than parsed from the header
+        cacheable = 'accept' not in getattr(request, '__dict__', ())
+        if cacheable:
+            header = request.environ.get('HTTP_ACCEPT')
+            cached = self.accept_cache.get(header)
+            if cached is not None and cached[0] is accepts:
+                return cached[1]
+        offers = [
+            offer for offer, _ in request.accept.acceptable_offers(accepts)
+        ]
+        offers.append(None)
+        offers = tuple(offers)
+        if cacheable:
+            self.accept_cache.put(header, (accepts, offers))
+        return offers
+
+    def _get_candidates(self, offer, method):
+        # the dispatch plans of the views registered for ``offer`` whose
+        # request method predicate, if any, accepts ``method``, in the order
+        # in which they are tried; built on first use and reused until a view
+        # is added
+        views = self.views if offer is None else self.media_views[offer]
+        dispatch = self._dispatch
+        entry = dispatch.get((offer, method))
+        if entry is not None and entry[0] is views:
+            return entry[1]
+        entry = dispatch.get(offer)
+        if entry is None or entry[0] is not views:
+            plans = [_dispatch_plan(view) for _, view, _ in views]
+            methods = set()
+            for plan in plans:
+                if plan.methods is not None:
+                    methods.update(plan.methods)
+            entry = dispatch[offer] = (views, plans, methods)
+        _, plans, methods = entry
+        if method not in methods:
+            # share one entry between the methods no view asks for, so that
+            # requests with arbitrary methods cannot grow the index
+            method = None
+            entry = dispatch.get((offer, None))
+            if entry is not None and entry[0] is views:
+                return entry[1]
+        candidates = [
+            plan
+            for plan in plans
+            if plan.methods is None or method in plan.methods
+        ]
+        dispatch[(offer, method)] = (views, candidates)
+        return candidates
+
+    def _matching(self, context, request, trial=False):
+        # yield the dispatch plans of the views whose predicates match the
+        # request, in the order in which the views are tried.  Views whose
+        # predicates are opaque to the index are yielded without checking
+        # them when ``trial`` is true, as calling them checks them anyway
+        method = getattr(request, 'method', None)
+        is_xhr = None
+        for offer in self._get_offers(request):
+            candidates = self._get_candidates(offer, method)
+            if not candidates:
+                continue
+            for plan in candidates:
+                if plan.opaque:
+                    if trial or plan.view.__predicated__(context, request):
+                        yield plan
+                    continue
+                if plan.xhr is not None:
+                    if is_xhr is None:
+                        is_xhr = bool(request.is_xhr)
+                    if is_xhr is not plan.xhr:
+                        continue
+                for predicate in plan.predicates:
+                    if not predicate(context, request):
+                        break
+                else:
+                    yield plan
+
     def match(self, context, request):
-        for order, view, phash in self.get_views(request):
-            if not hasattr(view, '__predicated__'):
-                return view
-            if view.__predicated__(context, request):
-                return view
+        for plan in self._matching(context, request):
+            return plan.view
         raise PredicateMismatch(self.name)
 
     def __permitted__(self, context, request):
@@ -146,14 +238,64 @@ class MultiView:
         return view(context, request)
 
     def __call__(self, context, request):
-        for order, view, phash in self.get_views(request):
+        for plan in self._matching(context, request, trial=True):
             try:
-                return view(context, request)
+                return plan.call(context, request)
             except PredicateMismatch:
+                # raised by a view with opaque predicates, or by the view
+                # itself, which means the next view should be tried
                 continue
         raise PredicateMismatch(self.name)
 
 
+class _DispatchPlan:
+    """How :class:`MultiView` decides whether a ``view`` matches a request.
+
+    ``methods`` and ``xhr`` are the values of the view's request method and
+    xhr predicates (``None`` if it has none), ``predicates`` the rest of its
+    predicates and ``call`` the callable invoked once they all matched.  If
+    ``opaque`` is true the view's predicates could not be inspected and it
+    is matched by calling ``view.__predicated__``.
+    """
+
+    __slots__ = ('view', 'call', 'methods', 'xhr', 'predicates', 'opaque')
+
+    def __init__(
+        self, view, call, methods=None, xhr=None, predicates=(), opaque=False
+    ):
+        self.view = view
+        self.call = call
+        self.methods = methods
+        self.xhr = xhr
+        self.predicates = predicates
+        self.opaque = opaque
+
+
+def _dispatch_plan(view):
+    if not hasattr(view, '__predicated__'):
+        return _DispatchPlan(view, view)
+    preds = getattr(view, '__predicates__', None)
+    if not isinstance(preds, (list, tuple)):
+        return _DispatchPlan(view, view, opaque=True)
+    methods = xhr = None
+    rest = []
+    for predicate in preds:
+        kind = type(predicate)
+        if kind is pyramid.predicates.RequestMethodPredicate:
+            if methods is None:
+                methods = frozenset(predicate.val)
+            else:
+                methods = methods.intersection(predicate.val)
+        elif kind is pyramid.predicates.XHRPredicate and xhr is None:
+            xhr = predicate.val
+        else:
+            rest.append(predicate)
+    # the predicates were all checked by the time the view is called, so
+    # call the view the predicated view deriver wraps, if it is known
+    call = getattr(view, '__predicated_view__', view)
+    return _DispatchPlan(view, call, methods, xhr, tuple(rest))
+
+
 def attr_wrapped_view(view, info):
     accept, order, phash = (
         info.options.get('accept', None),
@@ -166,8 +308,14 @@ def attr_wrapped_view(view, info):
     if (accept is None) and (order == MAX_ORDER) and (phash == DEFAULT_PHASH):
         return view  # defaults
 
-    def attr_view(context, request):
-        return view(context, request)
+    if view is not info.original_view and hasattr(view, '__wraps__'):
+        # a wrapper made by another deriver for this view carries the
+        # attributes itself, saving a call per request
+        attr_view = view
+    else:
+
+        def attr_view(context, request):
+            return view(context, request)
 
     attr_view.__accept__ = accept
     attr_view.__order__ = order
@@ -200,6 +348,7 @@ def predicated_view(view, info):
 
     predicate_wrapper.__predicated__ = checker
     predicate_wrapper.__predicates__ = preds
+    predicate_wrapper.__predicated_view__ = view
     return predicate_wrapper
 
 
@@ -1965,6 +2114,25 @@ class ViewsConfiguratorMixin:
         header. By default, the list is empty and no alternatives will be
         supported.
 
+        The ``metadata_index`` keyword argument, if ``True``, makes the
+        static view remember the size, modification time, content type and
+        a content hash of each file it serves, and send the hash as a strong
+        ``ETag``.  See :class:`pyramid.static.static_view`.  By default,
+        this argument is ``False``.
+
+        The ``memory_cache_size`` keyword argument is the number of bytes
+        of file content the static view may keep in memory, for files no
+        larger than ``memory_cache_max_file_size`` bytes (64KiB by default).
+        See :class:`pyramid.static.static_view`.  By default, it is ``0``
+        and no files are kept in memory.
+
+        The ``hashed_names`` keyword argument, if ``True``, makes the static
+        view serve the paths generated by
+        :class:`pyramid.static.ContentHashCacheBuster`, which include a hash
+        of the content of the file, with headers allowing clients to cache
+        the file indefinitely.  See :class:`pyramid.static.static_view`.  By
+        default, this argument is ``False``.
+
         The ``permission`` keyword argument is used to specify the
         :term:`permission` required by a user to execute the static view.  By
         default, it is the string
@@ -2046,6 +2214,11 @@ class ViewsConfiguratorMixin:
 
            Added the ``content_encodings`` argument.
 
+        .. versionchanged:: 2.1
+
+           Added the ``metadata_index``, ``memory_cache_size``,
+           ``memory_cache_max_file_size`` and ``hashed_names`` arguments.
+
         """
         spec = self._make_spec(path)
         info = self._get_static_info()
@@ -2156,37 +2329,119 @@ class ViewDeriverInfo:
         return self.registry.settings
 
 
+@functools.lru_cache(1000)
+def _resolve_static_spec(spec):
+    return resolve_asset_spec(spec)
+
+
+class _StaticRegistration:
+    # a static view registration indexed by StaticURLInfo, with the parts
+    # of its URL computed once
+    def __init__(self, position, url, spec, route_name):
+        self.position = position
+        self.url = url
+        self.spec = spec
+        self.route_name = route_name
+        if url is not None:
+            self.parsed_url = urlparse(url)
+            self.scheme_urls = {}
+            # whether a quoted subpath may be appended to the url instead
+            # of being joined with it
+            self.appendable = (
+                url.endswith('/')
+                and not self.parsed_url.query
+                and not self.parsed_url.fragment
+                and '/.' not in self.parsed_url.path
+            )
+
+    def url_for_scheme(self, scheme):
+        # the protocol-relative url with a scheme
+        url = self.scheme_urls.get(scheme)
+        if url is None:
+            url = urlunparse(self.parsed_url._replace(scheme=scheme))
+            self.scheme_urls[scheme] = url
+        return url
+
+    def join(self, url, subpath):
+        if (
+            self.appendable
+            and not subpath.startswith(('/', '.'))
+            and '/.' not in subpath
+            and '//' not in subpath
+        ):
+            return url + subpath
+        return urljoin(url, subpath)
+
+
 @implementer(IStaticURLInfo)
 class StaticURLInfo:
     def __init__(self):
-        self.registrations = []
+        self._registrations = []
+        self._index = None
         self.cache_busters = []
 
+    @property
+    def registrations(self):
+        return self._registrations
+
+    @registrations.setter
+    def registrations(self, registrations):
+        self._registrations = registrations
+        self._index = None
+
+    def _build_index(self):
+        # map each spec to its first registration, and list the lengths of
+        # the specs, so that the registrations matching a path are found
+        # with one lookup per length
+        by_spec = {}
+        for position, (url, spec, route_name) in enumerate(
+            self._registrations
+        ):
+            if spec not in by_spec:
+                by_spec[spec] = _StaticRegistration(
+                    position, url, spec, route_name
+                )
+        lengths = sorted({len(spec) for spec in by_spec})
+        return by_spec, lengths
+
+    def _find_registration(self, path):
+        # the first registration whose spec is a prefix of path
+        index = self._index
+        if index is None:
+            index = self._index = self._build_index()
+        by_spec, lengths = index
+        found = None
+        for length in lengths:
+            if length > len(path):
+                break
+            registration = by_spec.get(path[:length])
+            if registration is not None and (
+                found is None or registration.position < found.position
+            ):
+                found = registration
+        return found
+
     def generate(self, path, request, **kw):
-        for url, spec, route_name in self.registrations:
-            if path.startswith(spec):
-                subpath = path[len(spec) :]
-                if WIN:  # pragma: no cover
-                    subpath = subpath.replace('\\', '/')  # windows
-                if self.cache_busters:
-                    subpath, kw = self._bust_asset_path(
-                        request, spec, subpath, kw
-                    )
-                if url is None:
-                    kw['subpath'] = subpath
-                    return request.route_url(route_name, **kw)
-                else:
-                    app_url, qs, anchor = parse_url_overrides(request, kw)
-                    parsed = urlparse(url)
-                    if not parsed.scheme:
-                        url = urlunparse(
-                            parsed._replace(scheme=request.scheme)
-                        )
-                    subpath = quote(subpath)
-                    result = urljoin(url, subpath)
-                    return result + qs + anchor
-
-        raise ValueError('No static URL definition matching %s' % path)
+        registration = self._find_registration(path)
+        if registration is None:
+            raise ValueError('No static URL definition matching %s' % path)
+
+        spec = registration.spec
+        subpath = path[len(spec) :]
+        if WIN:  # pragma: no cover
+            subpath = subpath.replace('\\', '/')  # windows
+        if self.cache_busters:
+            subpath, kw = self.bust_asset_path(request, spec, subpath, kw)
+        if registration.url is None:
+            kw['subpath'] = subpath
+            return request.route_url(registration.route_name, **kw)
+        else:
+            app_url, qs, anchor = parse_url_overrides(request, kw)
+            url = registration.url
+            if not registration.parsed_url.scheme:
+                url = registration.url_for_scheme(request.scheme)
+            result = registration.join(url, quote(subpath))
+            return result + qs + anchor
 
     def add(self, config, name, spec, **extra):
         # This feature only allows for the serving of a directory and
@@ -2221,6 +2476,12 @@ class StaticURLInfo:
             url = None
             cache_max_age = extra.pop('cache_max_age', None)
             content_encodings = extra.pop('content_encodings', [])
+            metadata_index = extra.pop('metadata_index', False)
+            memory_cache_size = extra.pop('memory_cache_size', 0)
+            memory_cache_max_file_size = extra.pop(
+                'memory_cache_max_file_size', 65536
+            )
+            hashed_names = extra.pop('hashed_names', False)
 
             # create a view
             view = static_view(
@@ -2229,6 +2490,10 @@ class StaticURLInfo:
                 use_subpath=True,
                 reload=config.registry.settings['pyramid.reload_assets'],
                 content_encodings=content_encodings,
+                metadata_index=metadata_index,
+                memory_cache_size=memory_cache_size,
+                memory_cache_max_file_size=memory_cache_max_file_size,
+                hashed_names=hashed_names,
             )
 
             # Mutate extra to allow factory, etc to be passed through here.
@@ -2271,6 +2536,7 @@ class StaticURLInfo:
 
             # url, spec, route_name
             registrations.append((url, spec, route_name))
+            self._index = None
 
         intr = config.introspectable(
             'static views', name, 'static view for %r' % name, 'static view'
@@ -2329,9 +2595,12 @@ class StaticURLInfo:
 
         config.action(None, callable=register, introspectables=(intr,))
 
-    def _bust_asset_path(self, request, spec, subpath, kw):
+    def bust_asset_path(self, request, spec, subpath, kw):
+        """Return the ``(subpath, kw)`` of the asset at ``subpath`` of the
+        static asset specification ``spec`` as changed by the cache buster
+        in charge of it, if any."""
         registry = request.registry
-        pkg_name, pkg_subpath = resolve_asset_spec(spec)
+        pkg_name, pkg_subpath = _resolve_static_spec(spec)
         rawspec = None
 
         if pkg_name is not None:
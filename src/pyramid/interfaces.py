@@ -719,6 +719,10 @@ class IStaticURLInfo(Interface):
     def add_cache_buster(config, spec, cache_buster):
         """Add a new cache buster to a particular set of assets"""
 
+    def bust_asset_path(request, spec, subpath, kw):
+        """Return the ``(subpath, kw)`` of an asset of a static asset
+        specification as changed by its cache buster"""
+
 
 class IResponseFactory(Interface):
     """A utility which generates a response"""
@@ -7,10 +7,19 @@ from pyramid.traversal import (
     traversal_path,
 )
 from pyramid.urldispatch import _compile_route
-from pyramid.util import as_sorted_tuple, is_nonstr_iter, object_description
+from pyramid.util import (
+    LRUCache,
+    as_sorted_tuple,
+    is_nonstr_iter,
+    object_description,
+)
 
 _marker = object()
 
+# the number of distinct Accept headers whose negotiation an accept predicate
+# keeps
+ACCEPT_CACHE_SIZE = 100
+
 
 class XHRPredicate:
     def __init__(self, val, config):
@@ -142,6 +151,8 @@ class AcceptPredicate:
         if not is_nonstr_iter(values):
             values = (values,)
         self.values = values
+        # whether each of the most common Accept headers accepts any value
+        self.cache = LRUCache(ACCEPT_CACHE_SIZE)
 
     def text(self):
         return 'accept = {}'.format(', '.join(self.values))
@@ -149,7 +160,15 @@ class AcceptPredicate:
     phash = text
 
     def __call__(self, context, request):
-        return bool(request.accept.acceptable_offers(self.values))
+        if 'accept' in getattr(request, '__dict__', ()):
+            # set directly rather than parsed from the Accept header
+            return bool(request.accept.acceptable_offers(self.values))
+        header = request.environ.get('HTTP_ACCEPT')
+        result = self.cache.get(header)
+        if result is None:
+            result = bool(request.accept.acceptable_offers(self.values))
+            self.cache.put(header, result)
+        return result
 
 
 class ContainmentPredicate:
@@ -43,6 +43,13 @@ class Registry(Components, dict):
 
     _settings = None
 
+    # an optional bounded cache of view lookups which found no view, see
+    # the ``pyramid.view_lookup_miss_cache_size`` setting
+    view_lookup_miss_cache = None
+
+    # set by :meth:`pyramid.config.Configurator.freeze`
+    frozen = False
+
     def __init__(self, package_name=CALLER_PACKAGE, *args, **kw):
         # add a registry-instance-specific lock, which is used when the lookup
         # cache is mutated
@@ -56,6 +63,8 @@ class Registry(Components, dict):
 
     def _clear_view_lookup_cache(self):
         self._view_lookup_cache = {}
+        if self.view_lookup_miss_cache is not None:
+            self.view_lookup_miss_cache.clear()
 
     def __bool__(self):
         # defeat bool determination via dict.__len__
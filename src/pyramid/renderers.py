@@ -1,8 +1,10 @@
+from collections.abc import Iterator
 from functools import partial
+from itertools import chain, islice
 import json
 import os
 import re
-from zope.interface import implementer, providedBy
+from zope.interface import implementedBy, implementer, providedBy
 from zope.interface.registry import Components
 
 from pyramid.csrf import get_csrf_token
@@ -220,17 +222,33 @@ class JSON:
         explained in :ref:`json_serializing_custom_objects` instead
         of replacing the serializer.
 
+    A serializer may also return bytes, as ``orjson.dumps`` does, in which
+    case they become the response body without being decoded.  Passing
+    ``binary=True`` makes the renderer encode a string returned by the
+    serializer as UTF-8, so that the response body is set directly instead of
+    through ``response.text``.  The renderer then returns bytes rather than a
+    string from :func:`pyramid.renderers.render`.
+
+    The adapter used for an object, or its ``__json__`` method, is looked up
+    once for each class of object encountered and then reused for all of its
+    instances, unless an instance directly provides interfaces of its own.
+
     .. versionadded:: 1.4
        Prior to this version, there was no public API for supplying options
        to the underlying serializer without defining a custom renderer.
+
+    .. versionchanged:: 2.1
+       Added the ``binary`` argument.
     """
 
-    def __init__(self, serializer=json.dumps, adapters=(), **kw):
+    def __init__(self, serializer=json.dumps, adapters=(), binary=False, **kw):
         """Any keyword arguments will be passed to the ``serializer``
         function."""
         self.serializer = serializer
+        self.binary = binary
         self.kw = kw
         self.components = Components()
+        self._adapter_cache = {}
         for type, adapter in adapters:
             self.add_adapter(type, adapter)
 
@@ -259,6 +277,7 @@ class JSON:
         self.components.registerAdapter(
             adapter, (type_or_iface,), IJSONAdapter
         )
+        self._adapter_cache.clear()
 
     def __call__(self, info):
         """Returns a plain JSON-encoded string with content-type
@@ -273,25 +292,55 @@ class JSON:
                 if ct == response.default_content_type:
                     response.content_type = 'application/json'
             default = self._make_default(request)
-            return self.serializer(value, default=default, **self.kw)
+            result = self.serializer(value, default=default, **self.kw)
+            if self.binary and isinstance(result, str):
+                result = result.encode('utf-8')
+            return result
 
         return _render
 
     def _make_default(self, request):
+        cache = self._adapter_cache
+
         def default(obj):
-            if hasattr(obj, '__json__'):
-                return obj.__json__(request)
-            obj_iface = providedBy(obj)
-            adapters = self.components.adapters
-            result = adapters.lookup(
-                (obj_iface,), IJSONAdapter, default=_marker
-            )
-            if result is _marker:
-                raise TypeError(f'{obj!r} is not JSON serializable')
-            return result(obj, request)
+            adapter = None
+            if _adapts_as_class(obj):
+                adapter = cache.get(obj.__class__)
+            if adapter is None:
+                adapter = self._find_adapter(obj)
+            return adapter(obj, request)
 
         return default
 
+    def _find_adapter(self, obj):
+        cls = obj.__class__
+        if hasattr(obj, '__json__'):
+            if hasattr(cls, '__json__'):
+                self._adapter_cache[cls] = _call_json
+            return _call_json
+        obj_iface = providedBy(obj)
+        adapters = self.components.adapters
+        result = adapters.lookup((obj_iface,), IJSONAdapter, default=_marker)
+        if result is _marker:
+            raise TypeError(f'{obj!r} is not JSON serializable')
+        if obj_iface is implementedBy(cls):
+            # instances providing nothing beyond their class share its adapter
+            self._adapter_cache[cls] = result
+        return result
+
+
+def _adapts_as_class(obj):
+    # whether obj is adapted as any instance of its class would be, which
+    # is not the case when it has its own __json__ or provides interfaces
+    # beyond those implemented by its class
+    if '__json__' in getattr(obj, '__dict__', ()):
+        return False
+    return providedBy(obj) is implementedBy(obj.__class__)
+
+
+def _call_json(obj, request):
+    return obj.__json__(request)
+
 
 json_renderer_factory = JSON()  # bw compat
 
@@ -387,15 +436,162 @@ class JSONP(JSON):
                         )
 
                     ct = 'application/javascript'
+                    if isinstance(val, bytes):
+                        val = val.decode('utf-8')
                     body = f'/**/{callback}({val});'
                 response = request.response
                 if response.content_type == response.default_content_type:
                     response.content_type = ct
+            if self.binary and isinstance(body, str):
+                body = body.encode('utf-8')
             return body
 
         return _render
 
 
+class StreamingJSON(JSON):
+    """Renderer which, like :class:`pyramid.renderers.JSON`, encodes the
+    value returned by a view as JSON, but which writes it to the
+    ``app_iter`` of the response in chunks of about ``chunk_size`` bytes
+    instead of building the whole document in memory.
+
+    .. code-block:: python
+
+       from pyramid.renderers import StreamingJSON
+
+       config.add_renderer('jsonstream', StreamingJSON())
+
+    Any :term:`iterator` (such as a generator) in the value is encoded as a
+    JSON array, one item after the other, and so are iterators found among
+    the values of a dictionary, at any depth.  A view which returns
+
+    .. code-block:: python
+
+       {'count': count, 'rows': (row.as_dict() for row in query)}
+
+    therefore holds no more than a hundred rows and one chunk of output in
+    memory at a time.  Every other value, as well as each batch of items of
+    an iterator, is encoded at once by the ``serializer``, with adapters and
+    ``__json__`` methods used as by :class:`pyramid.renderers.JSON`; an
+    iterator nested inside such a value is turned into a list first.  The
+    ``indent`` argument of the serializer only affects these values.
+
+    The first chunk is encoded before the view returns, so that errors in
+    the beginning of the document can be handled by :term:`exception view`
+    callables.  The rest is encoded while the response is being sent, when
+    an error can only interrupt it, and after the request may have ended:
+    resources used by the iterators, such as database sessions, must remain
+    usable until then.
+
+    The renderer returns an iterator of bytes, also when used with
+    :func:`pyramid.renderers.render`.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(
+        self, serializer=json.dumps, adapters=(), chunk_size=65536, **kw
+    ):
+        JSON.__init__(self, serializer=serializer, adapters=adapters, **kw)
+        self.chunk_size = chunk_size
+        separators = kw.get('separators')
+        if separators is None:
+            if kw.get('indent') is None:
+                separators = (', ', ': ')
+            else:
+                separators = (',', ': ')
+        self.item_separator, self.key_separator = separators
+
+    def __call__(self, info):
+        """Returns an iterator of JSON-encoded bytes with content-type
+        ``application/json``. The content-type may be overridden by
+        setting ``request.response.content_type``."""
+
+        def _render(value, system):
+            request = system.get('request')
+            if request is not None:
+                response = request.response
+                ct = response.content_type
+                if ct == response.default_content_type:
+                    response.content_type = 'application/json'
+            chunks = self._iter_chunks(value, request)
+            # there is always at least one chunk
+            return chain((next(chunks),), chunks)
+
+        return _render
+
+    def _make_default(self, request):
+        default = JSON._make_default(self, request)
+
+        def stream_default(obj):
+            if isinstance(obj, Iterator):
+                return list(obj)
+            return default(obj)
+
+        return stream_default
+
+    def _iter_chunks(self, value, request):
+        chunk_size = self.chunk_size
+        chunk = []
+        size = 0
+        for piece in self._iterencode(value, self._make_default(request)):
+            if isinstance(piece, bytes):
+                piece = piece.decode('utf-8')
+            chunk.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield ''.join(chunk).encode('utf-8')
+                chunk = []
+                size = 0
+        if chunk:
+            yield ''.join(chunk).encode('utf-8')
+
+    def _iterencode(self, value, default, encode=None):
+        serialize = self.serializer
+        kw = self.kw
+        if encode is None:
+            if serialize is json.dumps:
+                # json.dumps would create a new encoder for every item
+                encode = json.JSONEncoder(default=default, **kw).encode
+            else:
+                encode = partial(serialize, default=default, **kw)
+        if isinstance(value, dict):
+            items = value.items()
+            if kw.get('sort_keys'):
+                items = sorted(items)
+            yield '{'
+            separator = ''
+            for key, item in items:
+                if not isinstance(key, str):
+                    # 1, True and None become "1", "true" and "null"
+                    key = serialize(key, **kw)
+                    if isinstance(key, bytes):
+                        key = key.decode('utf-8')
+                yield separator
+                yield serialize(key, **kw)
+                yield self.key_separator
+                yield from self._iterencode(item, default, encode)
+                separator = self.item_separator
+            yield '}'
+        elif isinstance(value, Iterator):
+            # items are encoded a few at a time, as a list without its
+            # brackets, which is a lot faster than one at a time
+            yield '['
+            separator = ''
+            while True:
+                batch = list(islice(value, 100))
+                if not batch:
+                    break
+                encoded = encode(batch)
+                if isinstance(encoded, bytes):
+                    encoded = encoded.decode('utf-8')
+                yield separator + encoded[1:-1]
+                separator = self.item_separator
+            yield ']'
+        else:
+            yield encode(value)
+
+
 @implementer(IRendererInfo)
 class RendererHelper:
     def __init__(self, name=None, package=None, registry=None):
@@ -455,10 +651,10 @@ class RendererHelper:
                 'get_csrf_token': partial(get_csrf_token, request),
             }
 
-        system_values = BeforeRender(system_values, value)
-
         registry = self.registry
-        registry.notify(system_values)
+        if _has_before_render_subscribers(registry):
+            system_values = BeforeRender(system_values, value)
+            registry.notify(system_values)
         result = renderer(value, system_values)
         return result
 
@@ -498,6 +694,19 @@ class RendererHelper:
         return self.__class__(name=name, package=package, registry=registry)
 
 
+def _has_before_render_subscribers(registry):
+    # a BeforeRender event is only worth creating if someone listens to it
+    if not getattr(registry, 'has_listeners', True):
+        return False
+    adapters = getattr(registry, 'adapters', None)
+    if adapters is None:
+        return True
+    return bool(adapters.subscriptions((_before_render_spec,), None))
+
+
+_before_render_spec = implementedBy(BeforeRender)
+
+
 class NullRendererHelper(RendererHelper):
     """Special renderer helper that has render_* methods which simply return
     the value they are fed rather than converting them to response objects;
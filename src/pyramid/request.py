@@ -325,7 +325,11 @@ def apply_request_extensions(request, extensions=None):
     """
     if extensions is None:
         extensions = request.registry.queryUtility(IRequestExtensions)
-    if extensions is not None:
+    if extensions is None:
+        return
+
+    request_classes = getattr(extensions, 'request_classes', None)
+    if request_classes is None:
         for name, fn in extensions.methods.items():
             method = fn.__get__(request, request.__class__)
             setattr(request, name, method)
@@ -333,6 +337,24 @@ def apply_request_extensions(request, extensions=None):
         InstancePropertyHelper.apply_properties(
             request, extensions.descriptors
         )
+        return
+
+    # the extended class is derived once per request class and reused by
+    # every request rather than being rebuilt for each of them
+    parent = request.__class__
+    newcls = request_classes.get(parent)
+    if newcls is None:
+        attrs = dict(extensions.methods)
+        attrs.update(extensions.descriptors)
+        if attrs:
+            newcls = InstancePropertyHelper.make_class(parent, attrs)
+            # applying the extensions again is a no-op
+            request_classes[newcls] = newcls
+        else:
+            newcls = parent
+        request_classes[parent] = newcls
+    if newcls is not parent:
+        request.__class__ = newcls
 
 
 class RequestLocalCache:
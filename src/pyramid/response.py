@@ -2,8 +2,10 @@ import mimetypes
 from os.path import getmtime, getsize
 import venusian
 from webob import Response as _Response
+from webob.response import AppIterRange
 from zope.interface import implementer
 
+from pyramid.decorator import reify
 from pyramid.interfaces import IResponse, IResponseFactory
 
 _BLOCK_SIZE = 4096 * 64  # 256K
@@ -35,6 +37,15 @@ class FileResponse(Response):
     It's generally safe to leave this set to ``None`` if you're serving a
     binary file.  This argument will be ignored if you also leave
     ``content-type`` as ``None``.
+
+    The file is opened when the response is created, so that an error
+    opening it is raised before the response is started, except to answer
+    a ``HEAD`` request, whose response has no body.  A ``Range`` request is
+    served by seeking to the start of the range.
+
+    .. versionchanged:: 2.1
+       The file is no longer opened for ``HEAD`` requests, and ranges are
+       served without reading the file up to their start.
     """
 
     def __init__(
@@ -53,20 +64,44 @@ class FileResponse(Response):
             content_encoding=content_encoding,
         )
         self.last_modified = getmtime(path)
-        content_length = getsize(path)
-        f = open(path, 'rb')
-        app_iter = None
-        if request is not None:
-            environ = request.environ
-            if 'wsgi.file_wrapper' in environ:
-                app_iter = environ['wsgi.file_wrapper'](f, _BLOCK_SIZE)
-        if app_iter is None:
-            app_iter = FileIter(f, _BLOCK_SIZE)
+        self._set_file(path, request, getsize(path))
+        if cache_max_age is not None:
+            self.cache_expires = cache_max_age
+
+    def _set_file(self, path, request, content_length, f=None):
+        # f is the file at path if it is opened already
+        self._path = path
+        if request is not None and request.method == 'HEAD':
+            # the content of the file is never sent
+            app_iter = _PathFileIter(path, _BLOCK_SIZE)
+        else:
+            if f is None:
+                f = open(path, 'rb')
+            app_iter = None
+            if request is not None:
+                environ = request.environ
+                if 'wsgi.file_wrapper' in environ:
+                    app_iter = environ['wsgi.file_wrapper'](f, _BLOCK_SIZE)
+            if app_iter is None:
+                app_iter = FileIter(f, _BLOCK_SIZE)
+        self._file_app_iter = app_iter
         self.app_iter = app_iter
         # assignment of content_length must come after assignment of app_iter
         self.content_length = content_length
-        if cache_max_age is not None:
-            self.cache_expires = cache_max_age
+
+    def app_iter_range(self, start, stop):
+        app_iter = self._app_iter
+        if app_iter is self._file_app_iter and not hasattr(
+            app_iter, 'app_iter_range'
+        ):
+            # a wsgi.file_wrapper can only send the whole file; a range of it
+            # is read from a file iterator instead
+            close = getattr(app_iter, 'close', None)
+            if close is not None:
+                close()
+            app_iter = FileIter(open(self._path, 'rb'), _BLOCK_SIZE)
+            return app_iter.app_iter_range(start, stop)
+        return super().app_iter_range(start, stop)
 
 
 class FileIter:
@@ -78,6 +113,9 @@ class FileIter:
     ``block_size`` is an optional block size for iteration.
     """
 
+    # the number of bytes left to read, if only a range of the file is sent
+    _remaining = None
+
     def __init__(self, file, block_size=_BLOCK_SIZE):
         self.file = file
         self.block_size = block_size
@@ -86,15 +124,58 @@ class FileIter:
         return self
 
     def __next__(self):
-        val = self.file.read(self.block_size)
+        remaining = self._remaining
+        if remaining is None:
+            val = self.file.read(self.block_size)
+        elif remaining > 0:
+            val = self.file.read(min(self.block_size, remaining))
+            self._remaining = remaining - len(val)
+        else:
+            val = b''
         if not val:
             raise StopIteration
         return val
 
+    def app_iter_range(self, start, stop):
+        """Return an iterator over the bytes of the file from offset
+        ``start`` up to, but not including, ``stop`` (or up to its end if
+        ``stop`` is ``None``).  It is used by :term:`WebOb` to answer
+        ``Range`` requests.
+
+        A seekable file is positioned at ``start`` directly and this
+        iterator is returned; the bytes before ``start`` of any other file
+        are read and discarded.
+
+        .. versionadded:: 2.1
+        """
+        file = self.file
+        seekable = getattr(file, 'seekable', None)
+        if seekable is None or not seekable():
+            return AppIterRange(self, start, stop)
+        file.seek(start)
+        self._remaining = None if stop is None else stop - start
+        return self
+
     def close(self):
         self.file.close()
 
 
+class _PathFileIter(FileIter):
+    # a FileIter which opens the file at ``path`` once it is read from, for
+    # responses to HEAD requests, which are never read from
+    def __init__(self, path, block_size=_BLOCK_SIZE):
+        self.path = path
+        self.block_size = block_size
+
+    @reify
+    def file(self):
+        return open(self.path, 'rb')
+
+    def close(self):
+        if 'file' in self.__dict__:
+            self.file.close()
+
+
 class response_adapter:
     """Decorator activated via a :term:`scan` which treats the function
     being decorated as a :term:`response adapter` for the set of types or
@@ -8,6 +8,7 @@ from pyramid.events import (
 )
 from pyramid.httpexceptions import HTTPNotFound
 from pyramid.interfaces import (
+    VH_ROOT_KEY,
     IDebugLogger,
     IExecutionPolicy,
     IRequest,
@@ -47,6 +48,12 @@ class Router:
             self.handle_request = tweens(self.handle_request, registry)
         self.root_policy = self.root_factory  # b/w compat
         self.registry = registry
+        # when no custom traverser is registered, a matched route which
+        # provides nothing to traverse always yields its root as the context
+        # and the traverser need not be looked up or invoked
+        self.default_traverser = not any(
+            reg.provided is ITraverser for reg in registry.registeredAdapters()
+        )
         settings = registry.settings
         if settings is not None:
             self.debug_notfound = settings['debug_notfound']
@@ -58,6 +65,7 @@ class Router:
 
         request.request_iface = IRequest
         context = None
+        route = None
         routes_mapper = self.routes_mapper
         debug_routematch = self.debug_routematch
         adapters = registry.adapters
@@ -98,9 +106,12 @@ class Router:
                     )
                     logger and logger.debug(msg)
 
-                request.request_iface = registry.queryUtility(
-                    IRouteRequest, name=route.name, default=IRequest
-                )
+                request_iface = getattr(route, 'request_iface', None)
+                if request_iface is None:
+                    request_iface = registry.queryUtility(
+                        IRouteRequest, name=route.name, default=IRequest
+                    )
+                request.request_iface = request_iface
 
                 root_factory = route.factory or self.root_factory
 
@@ -117,10 +128,26 @@ class Router:
         attrs['root'] = root
 
         # We are about to traverse and find a context
-        traverser = adapters.queryAdapter(root, ITraverser)
-        if traverser is None:
-            traverser = ResourceTreeTraverser(root)
-        tdict = traverser(request)
+        if (
+            route is not None
+            and self.default_traverser
+            and _is_plain_match(request)
+        ):
+            # traversing the empty path is a no-op
+            tdict = {
+                'context': root,
+                'view_name': '',
+                'subpath': (),
+                'traversed': (),
+                'virtual_root': root,
+                'virtual_root_path': (),
+                'root': root,
+            }
+        else:
+            traverser = adapters.queryAdapter(root, ITraverser)
+            if traverser is None:
+                traverser = ResourceTreeTraverser(root)
+            tdict = traverser(request)
 
         context, view_name, subpath, traversed, vroot, vroot_path = (
             tdict['context'],
@@ -270,6 +297,17 @@ class Router:
         return response(environ, start_response)
 
 
+def _is_plain_match(request):
+    # True if the default traverser would not traverse past the root
+    matchdict = request.matchdict
+    return (
+        matchdict is not None
+        and 'traverse' not in matchdict
+        and 'subpath' not in matchdict
+        and VH_ROOT_KEY not in request.environ
+    )
+
+
 def default_execution_policy(environ, router):
     with router.request_context(environ) as request:
         return router.invoke_request(request)
@@ -0,0 +1,129 @@
+import argparse
+import mimetypes
+import os
+import sys
+import textwrap
+
+from pyramid.asset import abspath_from_asset_spec
+from pyramid.interfaces import IStaticURLInfo
+from pyramid.paster import bootstrap, setup_logging
+from pyramid.scripts.common import parse_vars
+from pyramid.static import ContentHashCacheBuster
+
+
+def main(argv=sys.argv, quiet=False):
+    command = PCacheBustCommand(argv, quiet)
+    return command.run()
+
+
+class PCacheBustCommand:
+    description = """\
+    Compute the content hashes of the files in every directory served by a
+    static view of a Pyramid application whose URLs are generated by a
+    "pyramid.static.ContentHashCacheBuster" configured with a manifest, and
+    write them to its manifest file.  The application then needs not read
+    any asset to generate their URLs.
+
+    This command accepts one positional argument named "config_uri" which
+    specifies the PasteDeploy config file to use for the application.  The
+    format is "inifile#name". If the name is left off, "main" will be
+    assumed.  Example: "pcachebust myapp.ini#main".
+
+    """
+    script_name = 'pcachebust'
+    parser = argparse.ArgumentParser(
+        description=textwrap.dedent(description),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        'config_uri',
+        nargs='?',
+        default=None,
+        help='The URI to the configuration file.',
+    )
+
+    parser.add_argument(
+        'config_vars',
+        nargs='*',
+        default=(),
+        help="Variables required by the config file. For example, "
+        "`http_port=%%(http_port)s` would expect `http_port=8080` to be "
+        "passed here.",
+    )
+
+    stdout = sys.stdout
+    bootstrap = staticmethod(bootstrap)  # testing
+    setup_logging = staticmethod(setup_logging)  # testing
+
+    def __init__(self, argv, quiet=False):
+        self.quiet = quiet
+        self.args = self.parser.parse_args(argv[1:])
+
+    def out(self, msg):  # pragma: no cover
+        if not self.quiet:
+            print(msg)
+
+    def _get_cache_busters(self, info):
+        # the content hash cache busters with a manifest, each only once
+        cache_busters = []
+        for spec, cachebust, explicit in info.cache_busters:
+            if (
+                isinstance(cachebust, ContentHashCacheBuster)
+                and cachebust.manifest_path is not None
+                and cachebust not in cache_busters
+            ):
+                cache_busters.append(cachebust)
+        return cache_busters
+
+    def _bust_assets(self, info, request):
+        # generate the path of every asset served by a static view, so that
+        # the cache buster in charge of it computes its hash
+        compressed_exts = set(mimetypes.encodings_map)
+        for url, spec, route_name in info.registrations:
+            directory = abspath_from_asset_spec(spec)
+            for dirpath, dirnames, filenames in os.walk(directory):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if os.path.splitext(filename)[1] in compressed_exts:
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    subpath = os.path.relpath(path, directory)
+                    subpath = subpath.replace(os.sep, '/')
+                    info.bust_asset_path(request, spec, subpath, {})
+
+    def run(self):
+        if not self.args.config_uri:
+            self.out('Requires a config file argument')
+            return 2
+        config_uri = self.args.config_uri
+        config_vars = parse_vars(self.args.config_vars)
+        config_vars.setdefault('__script__', self.script_name)
+        self.setup_logging(config_uri, global_conf=config_vars)
+        env = self.bootstrap(config_uri, options=config_vars)
+        try:
+            info = env['registry'].queryUtility(IStaticURLInfo)
+            cache_busters = []
+            if info is not None:
+                cache_busters = self._get_cache_busters(info)
+            if not cache_busters:
+                self.out('No content hash cache busters with a manifest found')
+                return 0
+            for cachebust in cache_busters:
+                # forget the hashes of the previous manifest
+                cachebust.paths.clear()
+            self._bust_assets(info, env['request'])
+        finally:
+            env['closer']()
+
+        for cachebust in cache_busters:
+            cachebust.write_manifest()
+            self.out(
+                '%d paths written to %s'
+                % (len(cachebust.paths), cachebust.manifest_path)
+            )
+        return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main() or 0)
@@ -0,0 +1,278 @@
+import argparse
+import bz2
+from concurrent.futures import ProcessPoolExecutor
+import gzip
+import lzma
+import mimetypes
+import os
+import sys
+import textwrap
+
+from pyramid.asset import abspath_from_asset_spec
+from pyramid.interfaces import IStaticURLInfo
+from pyramid.paster import bootstrap, setup_logging
+from pyramid.scripts.common import parse_vars
+
+# the content encodings which can be produced with the standard library
+COMPRESSORS = {
+    'gzip': lambda data, level: gzip.compress(data, level, mtime=0),
+    'bzip2': lambda data, level: bz2.compress(data, level),
+    'xz': lambda data, level: lzma.compress(data, preset=level),
+}
+
+# the media types of formats which are compressed already, whose files
+# would not get any smaller (SVG images are XML text and do)
+COMPRESSED_TYPES = (
+    'application/gzip',
+    'application/pdf',
+    'application/wasm',
+    'application/x-7z-compressed',
+    'application/x-bzip2',
+    'application/x-rar-compressed',
+    'application/x-xz',
+    'application/zip',
+    'audio/',
+    'font/woff',
+    'image/',
+    'video/',
+)
+
+
+def main(argv=sys.argv, quiet=False):
+    command = PCompressCommand(argv, quiet)
+    return command.run()
+
+
+class PCompressCommand:
+    description = """\
+    Write compressed copies of the files in every directory served by a
+    static view of a Pyramid application (see "add_static_view"), for
+    static views configured with "content_encodings" to serve.  A copy is
+    named after the file with the extension of its encoding appended (e.g.
+    "main.css.gz") and is only kept if it is smaller than the file.  Files
+    whose copies are up to date are skipped, and so are files in formats
+    which are compressed already, such as images other than SVG, audio,
+    video, archives and WOFF fonts, and files too small to be worth
+    compressing.
+
+    This command accepts one positional argument named "config_uri" which
+    specifies the PasteDeploy config file to use for the application.  The
+    format is "inifile#name". If the name is left off, "main" will be
+    assumed.  Example: "pcompress myapp.ini#main".
+
+    """
+    script_name = 'pcompress'
+    parser = argparse.ArgumentParser(
+        description=textwrap.dedent(description),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        '-e',
+        '--encoding',
+        dest='encodings',
+        action='append',
+        choices=sorted(COMPRESSORS),
+        help='A content encoding to write copies in.  May be specified '
+        'more than once.  Default: gzip.',
+    )
+
+    parser.add_argument(
+        '-l',
+        '--level',
+        type=int,
+        default=9,
+        help='The compression level, from 1 to 9.  Default: 9.',
+    )
+
+    parser.add_argument(
+        '-m',
+        '--min-size',
+        type=int,
+        default=256,
+        help='The size in bytes below which files are not compressed.  '
+        'Default: 256.',
+    )
+
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=None,
+        help='The number of processes compressing files.  Default: the '
+        'number of processors.',
+    )
+
+    parser.add_argument(
+        'config_uri',
+        nargs='?',
+        default=None,
+        help='The URI to the configuration file.',
+    )
+
+    parser.add_argument(
+        'config_vars',
+        nargs='*',
+        default=(),
+        help="Variables required by the config file. For example, "
+        "`http_port=%%(http_port)s` would expect `http_port=8080` to be "
+        "passed here.",
+    )
+
+    stdout = sys.stdout
+    bootstrap = staticmethod(bootstrap)  # testing
+    setup_logging = staticmethod(setup_logging)  # testing
+    executor_factory = ProcessPoolExecutor  # testing
+
+    def __init__(self, argv, quiet=False):
+        self.quiet = quiet
+        self.args = self.parser.parse_args(argv[1:])
+
+    def out(self, msg):  # pragma: no cover
+        if not self.quiet:
+            print(msg)
+
+    def _get_directories(self, registry):
+        info = registry.queryUtility(IStaticURLInfo)
+        if info is None:
+            return []
+        directories = []
+        for url, spec, route_name in info.registrations:
+            if route_name is None:
+                # served from elsewhere
+                continue
+            path = abspath_from_asset_spec(spec)
+            if os.path.isdir(path) and path not in directories:
+                directories.append(path)
+        return directories
+
+    def _get_tasks(self, directories, encodings, min_size):
+        # every (path, encoding, extension) whose compressed copy is missing
+        # or out of date, and the number of copies which are up to date;
+        # files smaller than min_size only have their stale copies removed
+        tasks = []
+        fresh = 0
+        for directory in directories:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if is_compressed(filename):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    st = os.stat(path)
+                    mtime = st.st_mtime_ns
+                    small = st.st_size < min_size
+                    for encoding, ext in encodings:
+                        target = path + ext
+                        try:
+                            target_mtime = os.stat(target).st_mtime_ns
+                        except OSError:
+                            target_mtime = None
+                        if target_mtime == mtime:
+                            fresh += 1
+                        elif not small or target_mtime is not None:
+                            tasks.append((path, encoding, ext))
+        return tasks, fresh
+
+    def run(self):
+        if not self.args.config_uri:
+            self.out('Requires a config file argument')
+            return 2
+        level = self.args.level
+        if not 1 <= level <= 9:
+            self.out('The compression level must be between 1 and 9')
+            return 2
+        config_uri = self.args.config_uri
+        config_vars = parse_vars(self.args.config_vars)
+        config_vars.setdefault('__script__', self.script_name)
+        self.setup_logging(config_uri, global_conf=config_vars)
+        env = self.bootstrap(config_uri, options=config_vars)
+        try:
+            directories = self._get_directories(env['registry'])
+        finally:
+            env['closer']()
+        if not directories:
+            self.out('No static view directories found')
+            return 0
+
+        extensions = {}
+        for ext, encoding in mimetypes.encodings_map.items():
+            extensions.setdefault(encoding, ext)
+        encodings = [
+            (encoding, extensions[encoding])
+            for encoding in self.args.encodings or ['gzip']
+        ]
+        tasks, fresh = self._get_tasks(
+            directories, encodings, self.args.min_size
+        )
+
+        written = skipped = 0
+        original_size = compressed_size = 0
+        if tasks:
+            with self.executor_factory(self.args.jobs) as executor:
+                results = executor.map(
+                    compress_file,
+                    *zip(*tasks),
+                    [level] * len(tasks),
+                    chunksize=16,
+                )
+                for (path, encoding, ext), (size, new_size) in zip(
+                    tasks, results
+                ):
+                    if new_size is None:
+                        skipped += 1
+                        continue
+                    written += 1
+                    original_size += size
+                    compressed_size += new_size
+                    self.out(
+                        '%s: %d -> %d bytes' % (path + ext, size, new_size)
+                    )
+
+        self.out(
+            '%d compressed copies written, %d up to date, %d not smaller '
+            'than the original' % (written, fresh, skipped)
+        )
+        self.out(
+            '%d bytes saved (%d bytes compressed to %d)'
+            % (original_size - compressed_size, original_size, compressed_size)
+        )
+        return 0
+
+
+def is_compressed(filename):
+    """Return ``True`` if the file named ``filename`` is a compressed copy
+    or in a format which is compressed already."""
+    if os.path.splitext(filename)[1] in mimetypes.encodings_map:
+        return True
+    content_type = mimetypes.guess_type(filename)[0]
+    if content_type is None or content_type == 'image/svg+xml':
+        return False
+    return content_type.startswith(COMPRESSED_TYPES)
+
+
+def compress_file(path, encoding, ext, level):
+    """Write a copy of the file at ``path`` compressed with the content
+    encoding ``encoding`` to ``path + ext``, with the modification time of
+    the original.  Return the size of the file and of the copy, or ``None``
+    instead of the latter if the copy would not be smaller and was not
+    written (an existing copy is removed)."""
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        data = f.read()
+    compressed = COMPRESSORS[encoding](data, level)
+    target = path + ext
+    if len(compressed) >= len(data):
+        if os.path.exists(target):
+            os.remove(target)
+        return len(data), None
+    tmp = '%s.%d.tmp' % (target, os.getpid())
+    with open(tmp, 'wb') as f:
+        f.write(compressed)
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp, target)
+    return len(data), len(compressed)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main() or 0)
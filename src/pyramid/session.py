@@ -1,14 +1,21 @@
 import binascii
+import copy
+import hashlib
+import marshal
 import os
 import pickle
+import sqlite3
+import struct
+import threading
 import time
 from webob.cookies import JSONSerializer, SignedSerializer
+import zlib
 from zope.deprecation import deprecated
 from zope.interface import implementer
 
 from pyramid.csrf import check_csrf_origin, check_csrf_token
 from pyramid.interfaces import ISession
-from pyramid.util import bytes_, text_
+from pyramid.util import LRUCache, bytes_, text_
 
 
 def manage_accessed(wrapped):
@@ -89,6 +96,228 @@ deprecated(
 JSONSerializer = JSONSerializer  # api
 
 
+class CompactSerializer:
+    """
+    A serializer that dumps the types supported by
+    :class:`pyramid.session.JSONSerializer` to a compact binary encoding,
+    where each value is a type tag followed by its length-prefixed content.
+    As with JSON, tuples are loaded as lists and dictionary keys must be
+    strings.
+
+    Payloads of at least ``compress_threshold`` bytes, and at most
+    ``max_size`` (64 KiB), are compressed with :mod:`zlib` at
+    ``compress_level`` when it makes them shorter.  If
+    ``compress_threshold`` is ``None`` payloads are never compressed.
+
+    It may be used as the ``serializer`` of
+    :func:`pyramid.session.SignedCookieSessionFactory` to store more data in
+    a session cookie.
+
+    .. versionadded:: 2.1
+    """
+
+    # the largest size of the payloads compressed, a compressed payload
+    # expanding beyond it is malformed
+    max_size = 65536
+
+    def __init__(self, compress_threshold=128, compress_level=6):
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def loads(self, bstruct):
+        """Accept bytes and return a Python object."""
+        try:
+            header = bstruct[0]
+            if header == _COMPACT_RAW:
+                data = bstruct
+                pos = 1
+            elif header == _COMPACT_ZLIB:
+                decompressor = zlib.decompressobj()
+                data = decompressor.decompress(bstruct[1:], self.max_size)
+                if decompressor.unconsumed_tail or not decompressor.eof:
+                    raise ValueError('Invalid compressed payload')
+                if decompressor.unused_data:
+                    raise ValueError('Invalid compressed payload')
+                pos = 0
+            else:
+                raise ValueError('Unknown payload format')
+            value, pos = _compact_load(data, pos)
+        except (IndexError, TypeError, zlib.error) as e:
+            raise ValueError('Invalid payload: %s' % e) from e
+        if pos != len(data):
+            raise ValueError('Invalid payload: trailing data')
+        return value
+
+    def dumps(self, appstruct):
+        """Accept a Python object and return bytes."""
+        buf = bytearray()
+        _compact_dump(appstruct, buf)
+        threshold = self.compress_threshold
+        if threshold is not None and threshold <= len(buf) <= self.max_size:
+            data = zlib.compress(buf, self.compress_level)
+            if len(data) < len(buf):
+                return bytes((_COMPACT_ZLIB,)) + data
+        return bytes((_COMPACT_RAW,)) + buf
+
+
+_COMPACT_RAW = 0
+_COMPACT_ZLIB = 1
+
+# type tags of the compact encoding
+(
+    _CT_NONE,
+    _CT_TRUE,
+    _CT_FALSE,
+    _CT_INT,
+    _CT_FLOAT,
+    _CT_STR,
+    _CT_LIST,
+    _CT_DICT,
+) = b'NTFifsld'
+
+_float = struct.Struct('!d')
+
+
+def _compact_dump_length(length, buf):
+    while length >= 0x80:
+        buf.append((length & 0x7F) | 0x80)
+        length >>= 7
+    buf.append(length)
+
+
+def _compact_dump_str(value, buf):
+    data = value.encode('utf-8')
+    length = len(data)
+    if length < 0x80:
+        buf.append(length)
+    else:
+        _compact_dump_length(length, buf)
+    buf += data
+
+
+def _compact_dump(value, buf):
+    if isinstance(value, str):
+        buf.append(_CT_STR)
+        _compact_dump_str(value, buf)
+    elif value is None:
+        buf.append(_CT_NONE)
+    elif value is True:
+        buf.append(_CT_TRUE)
+    elif value is False:
+        buf.append(_CT_FALSE)
+    elif isinstance(value, int):
+        length = value.bit_length() // 8 + 1
+        buf.append(_CT_INT)
+        _compact_dump_length(length, buf)
+        buf += value.to_bytes(length, 'big', signed=True)
+    elif isinstance(value, float):
+        buf.append(_CT_FLOAT)
+        buf += _float.pack(value)
+    elif isinstance(value, dict):
+        buf.append(_CT_DICT)
+        _compact_dump_length(len(value), buf)
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(
+                    'keys must be str, not %s' % type(key).__name__
+                )
+            _compact_dump_str(key, buf)
+            _compact_dump(item, buf)
+    elif isinstance(value, (list, tuple)):
+        buf.append(_CT_LIST)
+        _compact_dump_length(len(value), buf)
+        for item in value:
+            _compact_dump(item, buf)
+    else:
+        raise TypeError(
+            'Object of type %s is not serializable' % type(value).__name__
+        )
+
+
+def _compact_load_length(data, pos):
+    length = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        length |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return length, pos
+        shift += 7
+
+
+def _compact_load_str(data, pos):
+    length = data[pos]
+    if length & 0x80:
+        length, pos = _compact_load_length(data, pos)
+    else:
+        pos += 1
+    end = pos + length
+    if end > len(data):
+        raise ValueError('Invalid payload: truncated string')
+    return str(data[pos:end], 'utf-8'), end
+
+
+def _compact_load(data, pos):
+    # iterative, the containers being loaded are kept on a stack
+    size = len(data)
+    stack = []
+    container = key = None
+    remaining = 0
+    while True:
+        if remaining and type(container) is dict:
+            key, pos = _compact_load_str(data, pos)
+        tag = data[pos]
+        pos += 1
+        if tag == _CT_STR:
+            value, pos = _compact_load_str(data, pos)
+        elif tag == _CT_INT:
+            length = data[pos]
+            if length & 0x80:
+                length, pos = _compact_load_length(data, pos)
+            else:
+                pos += 1
+            end = pos + length
+            if end > size:
+                raise ValueError('Invalid payload: truncated integer')
+            value = int.from_bytes(data[pos:end], 'big', signed=True)
+            pos = end
+        elif tag == _CT_FLOAT:
+            if pos + 8 > size:
+                raise ValueError('Invalid payload: truncated float')
+            value = _float.unpack_from(data, pos)[0]
+            pos += 8
+        elif tag == _CT_NONE:
+            value = None
+        elif tag == _CT_TRUE:
+            value = True
+        elif tag == _CT_FALSE:
+            value = False
+        elif tag == _CT_DICT or tag == _CT_LIST:
+            count, pos = _compact_load_length(data, pos)
+            value = {} if tag == _CT_DICT else []
+            if count:
+                stack.append((container, remaining, key))
+                container = value
+                remaining = count
+                continue
+        else:
+            raise ValueError('Invalid payload: unknown type tag %r' % tag)
+        # add the value to its container, and the containers completed to
+        # their own container
+        while container is not None:
+            if type(container) is dict:
+                container[key] = value
+            else:
+                container.append(value)
+            remaining -= 1
+            if remaining:
+                break
+            value = container
+            container, remaining, key = stack.pop()
+        else:
+            return value, pos
+
+
 def BaseCookieSessionFactory(
     serializer,
     cookie_name='session',
@@ -101,6 +330,8 @@ def BaseCookieSessionFactory(
     timeout=1200,
     reissue_time=0,
     set_on_exception=True,
+    cookie_cache_size=0,
+    skip_unchanged=False,
 ):
     """
     Configure a :term:`session factory` which will provide cookie-based
@@ -180,12 +411,49 @@ def BaseCookieSessionFactory(
       If ``True``, set a session cookie even if an exception occurs
       while rendering a view. Default: ``True``.
 
+    ``cookie_cache_size``
+      The number of session cookie values whose deserialized content is
+      remembered, so that a session whose cookie has not changed since a
+      previous request is not deserialized again.  Each session receives a
+      copy of the remembered content which it may modify freely.  The cache
+      is available as the ``cookie_cache`` attribute of the session class
+      returned, a ``pyramid.util.LRUCache`` counting ``hits`` and
+      ``misses``.  If this value is ``0`` no cookies are remembered.
+      Default: ``0``.
+
+    ``skip_unchanged``
+      If ``True``, a digest of the content of the session cookie received is
+      kept, and the session cookie is only set on the response if the
+      content of the session no longer matches this digest or if the cookie
+      is due to be reissued according to ``reissue_time``.  Requests calling
+      a modifying method of the session which leaves its content as it was,
+      such as ``pop_flash`` on an empty queue, then send no cookie.  Combine
+      it with a ``reissue_time`` greater than ``0`` for requests which only
+      read the session to send no cookie either.  Default: ``False``.
+
     .. versionadded: 1.5a3
 
     .. versionchanged: 1.10
 
        Added the ``samesite`` option and made the default ``'Lax'``.
+
+    .. versionchanged: 2.1
+
+       Added the ``cookie_cache_size`` and ``skip_unchanged`` options.
     """
+    cookie_cache = None
+    if cookie_cache_size > 0:
+        cookie_cache = LRUCache(cookie_cache_size)
+
+    def loads(cookieval):
+        if cookie_cache is None:
+            return serializer.loads(bytes_(cookieval))
+        cached = cookie_cache.get(cookieval)
+        if cached is None:
+            value = serializer.loads(bytes_(cookieval))
+            cached = _CachedCookieValue(value)
+            cookie_cache.put(cookieval, cached)
+        return cached.copy()
 
     @implementer(ISession)
     class CookieSession(dict):
@@ -204,10 +472,14 @@ def BaseCookieSessionFactory(
         _reissue_time = (
             reissue_time if reissue_time is None else int(reissue_time)
         )
+        _skip_unchanged = skip_unchanged
 
         # dirty flag
         _dirty = False
 
+        # digest of the content of the session cookie received
+        _digest = None
+
         def __init__(self, request):
             self.request = request
             now = time.time()
@@ -218,7 +490,7 @@ def BaseCookieSessionFactory(
             cookieval = request.cookies.get(self._cookie_name)
             if cookieval is not None:
                 try:
-                    value = serializer.loads(bytes_(cookieval))
+                    value = loads(cookieval)
                 except ValueError:
                     # the cookie failed to deserialize, dropped
                     value = None
@@ -237,11 +509,20 @@ def BaseCookieSessionFactory(
                     # a numeric type so we'll fail deserialization here
                     state = {}
 
+            expired = False
             if self._timeout is not None:
                 if now - renewed > self._timeout:
                     # expire the session because it was not renewed
                     # before the timeout threshold
                     state = {}
+                    expired = True
+
+            if self._skip_unchanged and not expired:
+                # the digest is only kept when the session holds exactly
+                # the content of the cookie received, or when no cookie
+                # was received at all
+                if cookieval is None or not new:
+                    self._digest = _state_digest(state)
 
             self.created = created
             self.accessed = renewed
@@ -321,8 +602,13 @@ def BaseCookieSessionFactory(
                     exception is not None
                 ):  # dont set a cookie during exceptions
                     return False
+            state = dict(self)
+            if self._digest is not None and not self._reissue_due():
+                if _state_digest(state) == self._digest:
+                    # the cookie received already holds this content
+                    return False
             cookieval = text_(
-                serializer.dumps((self.accessed, self.created, dict(self)))
+                serializer.dumps((self.accessed, self.created, state))
             )
             if len(cookieval) > 4064:
                 raise ValueError(
@@ -341,9 +627,41 @@ def BaseCookieSessionFactory(
             )
             return True
 
+        def _reissue_due(self):
+            if self._reissue_time is None:
+                return False
+            return self.accessed - self.renewed > self._reissue_time
+
+    CookieSession.cookie_cache = cookie_cache
     return CookieSession
 
 
+def _state_digest(state):
+    # a digest of the content of a session, None if it cannot be computed
+    try:
+        return hashlib.sha1(marshal.dumps(state, 2)).digest()
+    except ValueError:
+        return None
+
+
+class _CachedCookieValue:
+    # the deserialized content of a session cookie, kept as marshalled bytes
+    # when possible as they are turned into a new copy faster than by
+    # copy.deepcopy
+    def __init__(self, value):
+        try:
+            self.data = marshal.dumps(value)
+            self.marshalled = True
+        except ValueError:
+            self.data = copy.deepcopy(value)
+            self.marshalled = False
+
+    def copy(self):
+        if self.marshalled:
+            return marshal.loads(self.data)
+        return copy.deepcopy(self.data)
+
+
 def SignedCookieSessionFactory(
     secret,
     cookie_name='session',
@@ -359,6 +677,8 @@ def SignedCookieSessionFactory(
     hashalg='sha512',
     salt='pyramid.session.',
     serializer=None,
+    cookie_cache_size=0,
+    skip_unchanged=False,
 ):
     """
     Configure a :term:`session factory` which will provide signed
@@ -452,6 +772,26 @@ def SignedCookieSessionFactory(
       should be raised for malformed inputs.  If a serializer is not passed,
       the :class:`pyramid.session.JSONSerializer` serializer will be used.
 
+    ``cookie_cache_size``
+      The number of session cookie values whose verified and deserialized
+      content is remembered, so that a session whose cookie has not changed
+      since a previous request is neither verified nor deserialized again.
+      Each session receives a copy of the remembered content which it may
+      modify freely.  The cache is available as the ``cookie_cache``
+      attribute of the session class returned, a
+      ``pyramid.util.LRUCache`` counting ``hits`` and ``misses``.  If
+      this value is ``0`` no cookies are remembered.  Default: ``0``.
+
+    ``skip_unchanged``
+      If ``True``, a digest of the content of the session cookie received is
+      kept, and the session cookie is only set on the response if the
+      content of the session no longer matches this digest or if the cookie
+      is due to be reissued according to ``reissue_time``.  The session is
+      then neither serialized nor signed for requests which leave its
+      content as it was.  Combine it with a ``reissue_time`` greater than
+      ``0`` for requests which only read the session to send no cookie
+      either.  Default: ``False``.
+
     .. warning::
 
         In :app:`Pyramid` 2.0 the default ``serializer`` option changed to
@@ -470,6 +810,10 @@ def SignedCookieSessionFactory(
         Changed the default ``serializer`` to be an instance of
         :class:`pyramid.session.JSONSerializer`.
 
+    .. versionchanged: 2.1
+
+        Added the ``cookie_cache_size`` and ``skip_unchanged`` options.
+
     """
     if serializer is None:
         serializer = JSONSerializer()
@@ -490,9 +834,501 @@ def SignedCookieSessionFactory(
         timeout=timeout,
         reissue_time=reissue_time,
         set_on_exception=set_on_exception,
+        cookie_cache_size=cookie_cache_size,
+        skip_unchanged=skip_unchanged,
     )
 
 
+def manage_loaded(wrapped):
+    """Decorator which causes the state of a server-side session to be
+    loaded from its store before a method is called."""
+
+    def loaded(session, *arg, **kw):
+        if not session._loaded:
+            session._load()
+        return wrapped(session, *arg, **kw)
+
+    loaded.__doc__ = wrapped.__doc__
+    return loaded
+
+
+class MemorySessionStore:
+    """
+    A session store for :func:`pyramid.session.ServerSideSessionFactory`
+    which keeps the state of at most ``maxsize`` sessions in the memory of
+    the current process, discarding the least recently used first.  Sessions
+    are lost when the process exits and are not shared between processes.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, maxsize=10000):
+        self.cache = LRUCache(maxsize)
+
+    def load(self, session_id):
+        return self.cache.get(session_id)
+
+    def save(self, session_id, data):
+        self.cache.put(session_id, data)
+
+    def delete(self, session_id):
+        self.cache.pop(session_id)
+
+
+class FileSessionStore:
+    """
+    A session store for :func:`pyramid.session.ServerSideSessionFactory`
+    which keeps the state of each session in a file of the ``directory``
+    named after the session id.  The directory is created if necessary.
+
+    Files are replaced atomically, so the directory may be shared by
+    several processes.  Files of expired sessions are only removed by
+    :meth:`purge`.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, session_id):
+        return os.path.join(self.directory, session_id)
+
+    def load(self, session_id):
+        try:
+            with open(self._path(session_id), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def save(self, session_id, data):
+        path = self._path(session_id)
+        tmp = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def delete(self, session_id):
+        try:
+            os.remove(self._path(session_id))
+        except FileNotFoundError:
+            pass
+
+    def purge(self, max_age):
+        """Remove the files of the sessions which were not saved during the
+        last ``max_age`` seconds."""
+        threshold = time.time() - max_age
+        for entry in os.scandir(self.directory):
+            if entry.stat().st_mtime < threshold:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+class SQLiteSessionStore:
+    """
+    A session store for :func:`pyramid.session.ServerSideSessionFactory`
+    which keeps the state of sessions in the ``table`` of the SQLite
+    database at ``path``, using the :mod:`sqlite3` module.  The table is
+    created if necessary.  Each thread uses a connection of its own.
+
+    Rows of expired sessions are only removed by :meth:`purge`.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, path, table='pyramid_sessions'):
+        self.path = path
+        self.table = table
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS %s (session_id TEXT PRIMARY KEY, '
+                'data BLOB NOT NULL, saved REAL NOT NULL)' % table
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path)
+        return conn
+
+    def load(self, session_id):
+        row = (
+            self._connect()
+            .execute(
+                'SELECT data FROM %s WHERE session_id = ?' % self.table,
+                (session_id,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return row[0]
+
+    def save(self, session_id, data):
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO %s (session_id, data, saved) '
+                'VALUES (?, ?, ?)' % self.table,
+                (session_id, data, time.time()),
+            )
+
+    def delete(self, session_id):
+        with self._connect() as conn:
+            conn.execute(
+                'DELETE FROM %s WHERE session_id = ?' % self.table,
+                (session_id,),
+            )
+
+    def purge(self, max_age):
+        """Remove the rows of the sessions which were not saved during the
+        last ``max_age`` seconds."""
+        with self._connect() as conn:
+            conn.execute(
+                'DELETE FROM %s WHERE saved < ?' % self.table,
+                (time.time() - max_age,),
+            )
+
+
+def ServerSideSessionFactory(
+    secret,
+    store=None,
+    cookie_name='session',
+    max_age=None,
+    path='/',
+    domain=None,
+    secure=False,
+    httponly=False,
+    samesite='Lax',
+    set_on_exception=True,
+    timeout=1200,
+    reissue_time=120,
+    hashalg='sha512',
+    salt='pyramid.session.id.',
+    serializer=None,
+):
+    """
+    Configure a :term:`session factory` which will provide server-side
+    sessions.  The return value of this function is a :term:`session
+    factory`, which may be provided as the ``session_factory`` argument of a
+    :class:`pyramid.config.Configurator` constructor, or used as the
+    ``session_factory`` argument of the
+    :meth:`pyramid.config.Configurator.set_session_factory` method.
+
+    The session cookie only holds a signed, randomly generated session id.
+    The state of the session is kept in a ``store``, so sessions are not
+    limited in size.  The state is only loaded from the store, and the
+    cookie only verified, when the session is first used during a request,
+    and it is only saved when the session was changed (see
+    :meth:`pyramid.interfaces.ISession.changed`).  Mutable values of a
+    session must therefore be followed by a call to ``changed()`` when
+    they are modified in place.
+
+    Invalidating a session removes its state from the store and starts a
+    new session with a new id.  The session cookie is expired at the end
+    of the request, unless the new session is changed, in which case the
+    cookie refers to the new id.
+
+    Parameters:
+
+    ``secret``
+      A string which is used to sign the session id. The secret should be at
+      least as long as the block size of the selected hash algorithm. For
+      ``sha512`` this would mean a 512 bit (64 character) secret.  It should
+      be unique within the set of secret values provided to Pyramid for
+      its various subsystems (see :ref:`admonishment_against_secret_sharing`).
+
+    ``store``
+      An object with three methods: ``load``, ``save`` and ``delete``.  The
+      ``load`` method should accept a session id and return the bytes last
+      saved for it, or ``None``.  The ``save`` method should accept a
+      session id and bytes to store for it.  The ``delete`` method should
+      accept a session id and discard the bytes stored for it, if any.
+      :class:`pyramid.session.MemorySessionStore`,
+      :class:`pyramid.session.FileSessionStore` and
+      :class:`pyramid.session.SQLiteSessionStore` are provided.  Default: a
+      new :class:`pyramid.session.MemorySessionStore`.
+
+    ``hashalg``
+      The HMAC digest algorithm to use for signing. The algorithm must be
+      supported by the :mod:`hashlib` library. Default: ``'sha512'``.
+
+    ``salt``
+      A namespace to avoid collisions between different uses of a shared
+      secret. Reusing a secret for different parts of an application is
+      strongly discouraged (see :ref:`admonishment_against_secret_sharing`).
+      Default: ``'pyramid.session.id.'``.
+
+    ``cookie_name``
+      The name of the cookie used for sessioning. Default: ``'session'``.
+
+    ``max_age``
+      The maximum age of the cookie used for sessioning (in seconds).
+      Default: ``None`` (browser scope).
+
+    ``path``
+      The path used for the session cookie. Default: ``'/'``.
+
+    ``domain``
+      The domain used for the session cookie.  Default: ``None`` (no domain).
+
+    ``secure``
+      The 'secure' flag of the session cookie. Default: ``False``.
+
+    ``httponly``
+      Hide the cookie from Javascript by setting the 'HttpOnly' flag of the
+      session cookie. Default: ``False``.
+
+    ``samesite``
+      The 'samesite' option of the session cookie. Set the value to ``None``
+      to turn off the samesite option.  Default: ``'Lax'``.
+
+    ``timeout``
+      A number of seconds of inactivity before a session times out. If
+      ``None`` then the session never expires.  An expired session is
+      removed from the store when it is next used.  Default: ``1200``.
+
+    ``reissue_time``
+      The number of seconds that must pass before the session is
+      automatically saved again as the result of accessing it, which
+      extends its lifetime.  The duration is measured as the number of
+      seconds since the session was last saved and 'now'.  If this value is
+      ``0``, the session will be saved and its cookie set again on every
+      request accessing it, which also makes every response setting the
+      cookie uncacheable.  If ``None`` then the session's lifetime will
+      never be extended.  It should be lower than ``timeout``, for instance
+      a tenth of it.  Default: ``120``.
+
+    ``set_on_exception``
+      If ``True``, save the session and set a session cookie even if an
+      exception occurs while rendering a view. Default: ``True``.
+
+    ``serializer``
+      An object with two methods: ``loads`` and ``dumps``.  The ``loads``
+      method should accept bytes and return a Python object.  The ``dumps``
+      method should accept a Python object and return bytes.  A ``ValueError``
+      should be raised for malformed inputs.  It is used to serialize the
+      state of sessions for the store.  If a serializer is not passed, the
+      :class:`pyramid.session.JSONSerializer` serializer will be used.
+
+    .. versionadded:: 2.1
+    """
+    if store is None:
+        store = MemorySessionStore()
+    if serializer is None:
+        serializer = JSONSerializer()
+
+    id_serializer = SignedSerializer(
+        secret, salt, hashalg, serializer=JSONSerializer()
+    )
+
+    @implementer(ISession)
+    class ServerSideSession(dict):
+        """Dictionary-like session object"""
+
+        # configuration parameters
+        _cookie_name = cookie_name
+        _cookie_max_age = max_age if max_age is None else int(max_age)
+        _cookie_path = path
+        _cookie_domain = domain
+        _cookie_secure = secure
+        _cookie_httponly = httponly
+        _cookie_samesite = samesite
+        _cookie_on_exception = set_on_exception
+        _timeout = timeout if timeout is None else int(timeout)
+        _reissue_time = (
+            reissue_time if reissue_time is None else int(reissue_time)
+        )
+
+        # dirty flag
+        _dirty = False
+
+        def __init__(self, request):
+            self.request = request
+            self.session_id = None
+            self._loaded = False
+
+        def _load(self):
+            self._loaded = True
+            now = time.time()
+            self._created = self.accessed = self.renewed = now
+            self._new = True
+            session_id = None
+            cookieval = self.request.cookies.get(self._cookie_name)
+            if cookieval is not None:
+                try:
+                    session_id = id_serializer.loads(bytes_(cookieval))
+                except ValueError:
+                    # the cookie failed to verify, dropped
+                    session_id = None
+            if isinstance(session_id, str) and _valid_session_id(session_id):
+                data = store.load(session_id)
+                if data is not None:
+                    try:
+                        rval, cval, state = serializer.loads(data)
+                        renewed = float(rval)
+                        created = float(cval)
+                        state = dict(state)
+                    except (TypeError, ValueError):
+                        # the state failed to deserialize, dropped
+                        store.delete(session_id)
+                    else:
+                        if (
+                            self._timeout is not None
+                            and now - renewed > self._timeout
+                        ):
+                            # expire the session because it was not renewed
+                            # before the timeout threshold
+                            store.delete(session_id)
+                        else:
+                            self.session_id = session_id
+                            self._created = created
+                            self.accessed = self.renewed = renewed
+                            self._new = False
+                            dict.update(self, state)
+
+        @property
+        @manage_loaded
+        def created(self):
+            return self._created
+
+        @property
+        @manage_loaded
+        def new(self):
+            return self._new
+
+        # ISession methods
+        def changed(self):
+            if not self._dirty:
+                self._dirty = True
+
+                def save_callback(request, response):
+                    self._save(response)
+                    self.request = None  # explicitly break cycle for gc
+
+                self.request.add_response_callback(save_callback)
+
+        @manage_loaded
+        def invalidate(self):
+            if self.session_id is not None:
+                store.delete(self.session_id)
+                self.session_id = None
+            dict.clear(self)
+            self._created = self.accessed = self.renewed = time.time()
+            self._new = True
+            # the cookie still holds the id of the session discarded
+            self.changed()
+
+        # non-modifying dictionary methods
+        get = manage_loaded(manage_accessed(dict.get))
+        __getitem__ = manage_loaded(manage_accessed(dict.__getitem__))
+        items = manage_loaded(manage_accessed(dict.items))
+        values = manage_loaded(manage_accessed(dict.values))
+        keys = manage_loaded(manage_accessed(dict.keys))
+        __contains__ = manage_loaded(manage_accessed(dict.__contains__))
+        __len__ = manage_loaded(manage_accessed(dict.__len__))
+        __iter__ = manage_loaded(manage_accessed(dict.__iter__))
+
+        # modifying dictionary methods
+        clear = manage_loaded(manage_changed(dict.clear))
+        update = manage_loaded(manage_changed(dict.update))
+        setdefault = manage_loaded(manage_changed(dict.setdefault))
+        pop = manage_loaded(manage_changed(dict.pop))
+        popitem = manage_loaded(manage_changed(dict.popitem))
+        __setitem__ = manage_loaded(manage_changed(dict.__setitem__))
+        __delitem__ = manage_loaded(manage_changed(dict.__delitem__))
+
+        # flash API methods
+        @manage_loaded
+        @manage_changed
+        def flash(self, msg, queue='', allow_duplicate=True):
+            storage = self.setdefault('_f_' + queue, [])
+            if allow_duplicate or (msg not in storage):
+                storage.append(msg)
+
+        @manage_loaded
+        @manage_changed
+        def pop_flash(self, queue=''):
+            storage = self.pop('_f_' + queue, [])
+            return storage
+
+        @manage_loaded
+        @manage_accessed
+        def peek_flash(self, queue=''):
+            storage = self.get('_f_' + queue, [])
+            return storage
+
+        # CSRF API methods
+        @manage_loaded
+        @manage_changed
+        def new_csrf_token(self):
+            token = text_(binascii.hexlify(os.urandom(20)))
+            self['_csrft_'] = token
+            return token
+
+        @manage_loaded
+        @manage_accessed
+        def get_csrf_token(self):
+            token = self.get('_csrft_', None)
+            if token is None:
+                token = self.new_csrf_token()
+            return token
+
+        # non-API methods
+        def _save(self, response):
+            if not self._cookie_on_exception:
+                exception = getattr(self.request, 'exception', None)
+                if (
+                    exception is not None
+                ):  # dont save the session during exceptions
+                    return False
+            if not self._loaded:
+                self._load()
+            if self.session_id is None and not dict.__len__(self):
+                # nothing to save, the cookie of a session invalidated or no
+                # longer stored is expired instead
+                if self._cookie_name not in self.request.cookies:
+                    return False
+                response.delete_cookie(
+                    self._cookie_name,
+                    path=self._cookie_path,
+                    domain=self._cookie_domain,
+                )
+                return True
+            if self.session_id is None:
+                self.session_id = _new_session_id()
+            store.save(
+                self.session_id,
+                serializer.dumps((self.accessed, self._created, dict(self))),
+            )
+            response.set_cookie(
+                self._cookie_name,
+                value=text_(id_serializer.dumps(self.session_id)),
+                max_age=self._cookie_max_age,
+                path=self._cookie_path,
+                domain=self._cookie_domain,
+                secure=self._cookie_secure,
+                httponly=self._cookie_httponly,
+                samesite=self._cookie_samesite,
+            )
+            return True
+
+    return ServerSideSession
+
+
+def _new_session_id():
+    return text_(binascii.hexlify(os.urandom(32)))
+
+
+def _valid_session_id(session_id):
+    # ids are made of 64 lowercase hexadecimal digits, which is checked
+    # before using them as keys of stores such as file names
+    return len(session_id) == 64 and not session_id.strip('0123456789abcdef')
+
+
 check_csrf_origin = check_csrf_origin  # api
 deprecated(
     'check_csrf_origin',
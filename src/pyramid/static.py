@@ -1,16 +1,20 @@
 from functools import lru_cache
+import hashlib
 import json
 import mimetypes
 import os
 from os.path import exists, getmtime, getsize, isdir, join, normcase, normpath
 from pkg_resources import resource_exists, resource_filename, resource_isdir
+import posixpath
+import re
 import warnings
 
 from pyramid.asset import abspath_from_asset_spec, resolve_asset_spec
 from pyramid.httpexceptions import HTTPMovedPermanently, HTTPNotFound
 from pyramid.path import caller_package
-from pyramid.response import FileResponse, _guess_type
+from pyramid.response import FileResponse, Response, _guess_type
 from pyramid.traversal import traversal_path_info
+from pyramid.util import LRUCache
 
 
 class static_view:
@@ -61,6 +65,39 @@ class static_view:
     ``Accept-Encoding`` value will be added to the response's ``Vary`` header.
     By default, the list is empty and no alternatives will be supported.
 
+    ``metadata_index`` controls whether the size, modification time, content
+    type and a hash of the content of each file served are remembered.  The
+    hash is sent as a strong ``ETag``, so that conditional requests are
+    answered with ``304 Not Modified`` without accessing the file, and a
+    full response only opens it.  The opened file is checked with
+    ``os.fstat``, and its metadata are updated if it changed, so that a
+    response always describes the content it sends.  If ``reload`` is also
+    ``True`` the file is checked for changes on each request before
+    answering a conditional request as well.  By default, this is
+    ``False``.
+
+    ``memory_cache_size`` is the number of bytes of file content which may
+    be kept in memory, so that files served often are sent without
+    accessing the filesystem.  Only files no larger than
+    ``memory_cache_max_file_size`` bytes (64KiB by default) are kept, each
+    encoding of a file separately, and the least recently served are
+    discarded first.  If ``reload`` is ``True`` the modification time of the
+    file is checked on each request and a changed file is read again.  By
+    default, this is ``0`` and no files are kept in memory.
+
+    ``hashed_names`` controls whether a file may also be requested by a name
+    which includes a hash of its content, as generated by
+    :class:`ContentHashCacheBuster` (e.g. ``css/main.0123456789abcdef.css``
+    for ``css/main.css``).  As the URL of such a file changes with its
+    content, it is served with a ``Cache-Control`` header allowing clients
+    to cache it for a year without revalidating it (``immutable``).  The
+    hash must be a prefix of the hex SHA-256 digest of the content of the
+    file, otherwise the response is a 404, so that a URL is never cached
+    with content it does not name.  The digest of a file is computed when it
+    is first requested by a hashed name, and again when it changes if
+    ``reload`` is ``True``.  A file which actually exists under the
+    requested name is served as usual.  By default, this is ``False``.
+
     .. note::
 
        If the ``root_dir`` is relative to a :term:`package`, or is a
@@ -74,6 +111,11 @@ class static_view:
 
        Added ``reload`` and ``content_encodings`` options.
 
+    .. versionchanged:: 2.1
+
+       Added the ``metadata_index``, ``memory_cache_size``,
+       ``memory_cache_max_file_size`` and ``hashed_names`` options.
+
     """
 
     def __init__(
@@ -85,6 +127,10 @@ class static_view:
         index='index.html',
         reload=False,
         content_encodings=(),
+        metadata_index=False,
+        memory_cache_size=0,
+        memory_cache_max_file_size=65536,
+        hashed_names=False,
     ):
         # package_name is for bw compat; it is preferred to pass in a
         # package-relative path as root_dir
@@ -114,22 +160,62 @@ class static_view:
         self.reload = reload
         self.content_encodings = _compile_content_encodings(content_encodings)
         self.filemap = {}
+        self.metadata = {} if metadata_index else None
+        if memory_cache_size > 0:
+            self.memory_cache = LRUCache(
+                memory_cache_size, getsize=_cached_file_size
+            )
+        else:
+            self.memory_cache = None
+        self.memory_cache_max_file_size = memory_cache_max_file_size
+        # the files too large for the memory cache, unless reload is on
+        self._uncached = set()
+        self.hashed_names = hashed_names
+        # the (mtime, size, digest) of the files requested by hashed names
+        self._hashes = {}
 
     def __call__(self, context, request):
         resource_name = self.get_resource_name(request)
         files = self.get_possible_files(resource_name)
+        cache_max_age = self.cache_max_age
+        immutable = False
+        if not files and self.hashed_names:
+            match = _hashed_name_re.match(resource_name)
+            if match is not None:
+                resource_name = match.group(1) + (match.group(3) or '')
+                files = self.get_possible_files(resource_name)
+                if not self.hash_matches(files, match.group(2)):
+                    raise HTTPNotFound(request.url)
+                cache_max_age = _IMMUTABLE_MAX_AGE
+                immutable = True
         filepath, content_encoding = self.find_best_match(request, files)
         if filepath is None:
             raise HTTPNotFound(request.url)
 
-        content_type, _ = _guess_type(resource_name)
-        response = FileResponse(
-            filepath,
-            request,
-            self.cache_max_age,
-            content_type,
-            content_encoding,
-        )
+        cached = None
+        if self.memory_cache is not None:
+            cached = self.get_cached_file(
+                filepath, resource_name, content_encoding
+            )
+        if cached is not None:
+            response = _CachedFileResponse(cached, cache_max_age)
+        elif self.metadata is not None:
+            response = self.get_indexed_response(
+                request, filepath, resource_name, content_encoding
+            )
+            if cache_max_age is not None:
+                response.cache_expires = cache_max_age
+        else:
+            content_type, _ = _guess_type(resource_name)
+            response = FileResponse(
+                filepath,
+                request,
+                cache_max_age,
+                content_type,
+                content_encoding,
+            )
+        if immutable:
+            response.headers['Cache-Control'] += ', immutable'
         if len(files) > 1:
             _add_vary(response, 'Accept-Encoding')
         return response
@@ -153,7 +239,10 @@ class static_view:
         # normalize asset spec or fs path into resource_path
         if self.package_name:  # package resource
             resource_path = '{}/{}'.format(self.docroot.rstrip('/'), path)
-            if resource_isdir(self.package_name, resource_path):
+            # a path known from the cache of files is not a directory
+            if resource_path not in self.filemap and resource_isdir(
+                self.package_name, resource_path
+            ):
                 if not request.path_url.endswith('/'):
                     raise self.add_slash_redirect(request)
                 resource_path = '{}/{}'.format(
@@ -164,7 +253,7 @@ class static_view:
         else:  # filesystem file
             # os.path.normpath converts / to \ on windows
             resource_path = normcase(normpath(join(self.norm_docroot, path)))
-            if isdir(resource_path):
+            if resource_path not in self.filemap and isdir(resource_path):
                 if not request.path_url.endswith('/'):
                     raise self.add_slash_redirect(request)
                 resource_path = join(resource_path, self.index)
@@ -219,6 +308,99 @@ class static_view:
             self.filemap[resource_name] = result
         return result
 
+    def hash_matches(self, files, token):
+        """Return ``True`` if ``token`` is a prefix of the hex SHA-256
+        digest of the content of the unencoded file among ``files``."""
+        for path, content_encoding in files:
+            if content_encoding is None:
+                break
+        else:
+            return False
+        entry = self._hashes.get(path)
+        try:
+            if entry is None or self.reload:
+                st = os.stat(path)
+                if entry is None or entry[:2] != (st.st_mtime, st.st_size):
+                    entry = (st.st_mtime, st.st_size, _file_hash(path))
+                    self._hashes[path] = entry
+        except OSError:
+            return False
+        return entry[2].startswith(token)
+
+    def get_indexed_response(
+        self, request, path, resource_name, content_encoding
+    ):
+        """Return the response serving the file at ``path`` made from its
+        :class:`FileMetadata`.  A conditional request which the metadata
+        shows to be fresh is answered with ``304 Not Modified`` without
+        opening the file.  Otherwise the file is opened and, if it changed
+        since it was indexed, its metadata is updated first, so that the
+        response always describes the content it sends."""
+        info = self.get_metadata(path, resource_name, content_encoding)
+        response = _IndexedFileResponse(info)
+        if response.is_not_modified(request):
+            response.status = 304
+            return response
+        f = None
+        if request.method != 'HEAD':
+            f = open(path, 'rb')
+            st = os.fstat(f.fileno())
+            if not info.matches(st):
+                info = self.get_metadata(
+                    path, resource_name, content_encoding, st
+                )
+                response = _IndexedFileResponse(info)
+        response._set_file(path, request, info.size, f)
+        return response
+
+    def get_metadata(self, path, resource_name, content_encoding, st=None):
+        """Return the :class:`FileMetadata` of the file at ``path`` from the
+        metadata index, which is updated if the file is not known yet or
+        has changed, according to ``st``, an ``os.stat`` result of the file,
+        or when ``reload`` is ``True``."""
+        info = self.metadata.get(path)
+        if info is not None and not self.reload and st is None:
+            return info
+        if st is None:
+            st = os.stat(path)
+        if info is None or not info.matches(st):
+            content_type, _ = _guess_type(resource_name)
+            info = FileMetadata(path, st, content_type, content_encoding)
+            self.metadata[path] = info
+        return info
+
+    def get_cached_file(self, path, resource_name, content_encoding):
+        """Return the :class:`CachedFile` holding the content of the file at
+        ``path`` from the memory cache, reading it first if necessary, or
+        ``None`` if the file is too large to be kept in memory."""
+        cache = self.memory_cache
+        cached = cache.get(path)
+        if cached is not None and not self.reload:
+            return cached
+        if path in self._uncached:
+            return None
+        if self.metadata is not None:
+            info = self.get_metadata(path, resource_name, content_encoding)
+        else:
+            st = os.stat(path)
+            if cached is not None and cached.matches(st):
+                return cached
+            content_type, _ = _guess_type(resource_name)
+            info = FileMetadata(
+                path, st, content_type, content_encoding, etag=False
+            )
+        if cached is not None and cached.info is info:
+            return cached
+        if info.size > self.memory_cache_max_file_size:
+            if not self.reload:
+                self._uncached.add(path)
+            return None
+        with open(path, 'rb') as f:
+            body = f.read()
+        cached = CachedFile(info, body)
+        cache.put(path, cached)
+        return cached
+
     def find_best_match(self, request, files):
         """Return ``(path | None, encoding)``."""
         # if the client did not specify encodings then assume only the
@@ -254,6 +436,118 @@ class static_view:
         return HTTPMovedPermanently(url)
 
 
+class FileMetadata:
+    """The metadata of a static file kept by the metadata index of a
+    :class:`static_view`: its ``path``, its ``size`` and modification time
+    (``mtime``), the ``content_type`` and ``content_encoding`` of the
+    responses serving it and an ``etag`` computed from its content.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, path, st, content_type, content_encoding, etag=True):
+        self.path = path
+        self.size = st.st_size
+        self.mtime = st.st_mtime
+        self.content_type = content_type
+        self.content_encoding = content_encoding
+        self.etag = _file_etag(path) if etag else None
+
+    def matches(self, st):
+        """Return ``True`` if the ``os.stat`` result ``st`` shows that the
+        file has not changed."""
+        return st.st_mtime == self.mtime and st.st_size == self.size
+
+
+def _file_hash(path, block_size=65536):
+    # the hex SHA-256 digest of the content of a file
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _file_etag(path):
+    return _file_hash(path)[:32]
+
+
+class CachedFile:
+    """The content (``body``) of a static file kept in the memory cache of
+    a :class:`static_view`, along with its :class:`FileMetadata`
+    (``info``).
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, info, body):
+        self.info = info
+        self.body = body
+
+    def matches(self, st):
+        """Return ``True`` if the ``os.stat`` result ``st`` shows that the
+        file has not changed."""
+        return self.info.matches(st)
+
+
+def _cached_file_size(cached):
+    return len(cached.body)
+
+
+class _CachedFileResponse(Response):
+    # a response serving a file from the memory cache of a static view
+    def __init__(self, cached, cache_max_age):
+        info = cached.info
+        super().__init__(
+            body=cached.body,
+            conditional_response=True,
+            content_type=info.content_type,
+            content_encoding=info.content_encoding,
+        )
+        self.last_modified = info.mtime
+        if info.etag is not None:
+            self.etag = info.etag
+        if cache_max_age is not None:
+            self.cache_expires = cache_max_age
+
+
+class _IndexedFileResponse(FileResponse):
+    # a FileResponse made from the FileMetadata of a file, without stat; its
+    # file is set once it is known not to answer with 304 Not Modified
+    def __init__(self, info):
+        Response.__init__(
+            self,
+            conditional_response=True,
+            content_type=info.content_type,
+            content_encoding=info.content_encoding,
+        )
+        self.last_modified = info.mtime
+        if info.etag is not None:
+            self.etag = info.etag
+
+    def is_not_modified(self, request):
+        # the check of webob's conditional_response_app
+        if request.method not in self._safe_methods:
+            return False
+        if request.if_none_match and self.etag:
+            return self.etag in request.if_none_match
+        if request.if_modified_since and self.last_modified:
+            return self.last_modified <= request.if_modified_since
+        return False
+
+
+# the max-age of responses to requests for hashed file names: one year
+_IMMUTABLE_MAX_AGE = 31536000
+
+# a file name with a content hash inserted before its extension
+_hashed_name_re = re.compile(r'^(.+)\.([0-9a-f]{8,64})(\.[^./\\]+)?$')
+
+
+def _hashed_name(subpath, token):
+    base, ext = posixpath.splitext(subpath)
+    return f'{base}.{token}{ext}'
+
+
 def _compile_content_encodings(encodings):
     """
     Convert mimetypes.encodings_map into a dict of
@@ -435,3 +729,107 @@ class ManifestCacheBuster:
     def __call__(self, request, subpath, kw):
         subpath = self.manifest.get(subpath, subpath)
         return (subpath, kw)
+
+
+class ContentHashCacheBuster:
+    """
+    An implementation of :class:`~pyramid.interfaces.ICacheBuster` which
+    inserts a hash of the content of an asset into its path, before its
+    extension.  For example:
+
+    .. code-block:: pycon
+
+       >>> request.static_url('myapp:static/css/main.css')
+       "http://www.example.com/static/css/main.0123456789abcdef.css"
+
+    The hash of an asset is computed the first time a URL is generated for
+    it and is then kept in memory, so that generating URLs does not access
+    the filesystem afterwards.  Assets which cannot be read are left
+    unchanged.  Hashes are kept by path relative to the static asset
+    specification the cache buster is added for, hence each instance should
+    only be added for a single specification.
+
+    Such URLs never refer to different content, so a static view serving
+    these assets may be added with ``hashed_names=True`` (see
+    :meth:`pyramid.config.Configurator.add_static_view`) to serve them with
+    headers allowing clients to cache them indefinitely.
+
+    ``manifest_spec`` is an optional absolute path or :term:`asset
+    specification` of a JSON file holding precomputed paths, in the format
+    read by :class:`ManifestCacheBuster`.  It is loaded if it exists and is
+    written by the ``pcachebust`` command (see
+    :ref:`precomputing_asset_hashes`), so that no asset needs to be read
+    after deployment.  Paths found in the manifest are not checked against
+    the current content of the assets, and a static view added with
+    ``hashed_names=True`` returns a 404 for those of assets which changed
+    since it was written.
+
+    ``hash_length`` is the number of hexadecimal digits of the SHA-256
+    digest of its content included in the path of an asset, between 8 and
+    64.  By default, this is ``16``.
+
+    If ``reload`` is ``True`` the modification time and size of an asset
+    are checked each time a URL is generated for it, and its hash is
+    computed again if it changed, as a static view added with
+    ``hashed_names=True`` and ``reload`` enabled does.  Paths found in the
+    manifest are never checked.  It is usually set to the value of the
+    ``pyramid.reload_assets`` setting, and is not recommended in
+    production.  By default, this is ``False``.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, manifest_spec=None, hash_length=16, reload=False):
+        if not 8 <= hash_length <= 64:
+            raise ValueError('hash_length must be between 8 and 64')
+        self.hash_length = hash_length
+        self.reload = reload
+        self.manifest_path = None
+        self.paths = {}
+        # the (mtime, size) of the assets hashed, if reload is on
+        self._stats = {}
+        if manifest_spec is not None:
+            package_name = caller_package().__name__
+            self.manifest_path = abspath_from_asset_spec(
+                manifest_spec, package_name
+            )
+            if exists(self.manifest_path):
+                with open(self.manifest_path, 'rb') as fp:
+                    self.paths.update(json.loads(fp.read().decode('utf-8')))
+
+    def bust_path(self, subpath, path):
+        """Return ``subpath`` with the hash of the content of the file at the
+        absolute ``path`` inserted, or unchanged if the file cannot be
+        read."""
+        try:
+            token = _file_hash(path)[: self.hash_length]
+        except OSError:
+            return subpath
+        return _hashed_name(subpath, token)
+
+    def write_manifest(self):
+        """Write the paths computed so far to the manifest file."""
+        if self.manifest_path is None:
+            raise ValueError('No manifest_spec was given')
+        content = json.dumps(self.paths, indent=2, sort_keys=True)
+        tmp = '%s.%d.tmp' % (self.manifest_path, os.getpid())
+        with open(tmp, 'w', encoding='utf-8') as fp:
+            fp.write(content + '\n')
+        os.replace(tmp, self.manifest_path)
+
+    def __call__(self, request, subpath, kw):
+        busted = self.paths.get(subpath)
+        if busted is not None and subpath not in self._stats:
+            return (busted, kw)
+        path = abspath_from_asset_spec(kw['rawspec'])
+        if self.reload:
+            try:
+                st = os.stat(path)
+                stat = (st.st_mtime, st.st_size)
+            except OSError:
+                stat = None
+            if busted is not None and self._stats[subpath] == stat:
+                return (busted, kw)
+            self._stats[subpath] = stat
+        busted = self.paths[subpath] = self.bust_path(subpath, path)
+        return (busted, kw)
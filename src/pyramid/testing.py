@@ -4,6 +4,7 @@ import os
 from webob.acceptparse import create_accept_header
 from zope.interface import alsoProvides, implementer
 
+from pyramid import threadlocal
 from pyramid.config import Configurator
 from pyramid.decorator import reify
 from pyramid.i18n import LocalizerRequestMixin
@@ -13,7 +14,7 @@ from pyramid.registry import Registry
 from pyramid.request import CallbackMethodsMixin
 from pyramid.response import _get_response_factory
 from pyramid.security import AuthenticationAPIMixin, SecurityAPIMixin
-from pyramid.threadlocal import get_current_registry, manager
+from pyramid.threadlocal import get_current_registry
 from pyramid.url import URLMethodsMixin
 from pyramid.util import PYPY, InstancePropertyMixin
 from pyramid.view import ViewMethodsMixin
@@ -472,7 +473,7 @@ def setUp(
     by :func:`pyramid.threadlocal.get_current_registry` during the
     execution of the test.
     """
-    manager.clear()
+    threadlocal.manager.clear()
     if registry is None:
         registry = Registry('testing')
     if package is None:
@@ -529,6 +530,7 @@ def tearDown(unhook_zca=True):
             getSiteManager.reset()
         except ImportError:  # pragma: no cover
             have_zca = False
+    manager = threadlocal.manager
     info = manager.pop()
     manager.clear()
     if info is not None:
@@ -1,3 +1,4 @@
+import contextvars
 import threading
 
 from pyramid.registry import global_registry
@@ -32,6 +33,48 @@ class ThreadLocalManager(threading.local):
         self.stack[:] = []
 
 
+class ContextVarManager:
+    """A drop-in replacement for :class:`ThreadLocalManager` which keeps its
+    stack in a :class:`contextvars.ContextVar` instead of a
+    :class:`threading.local`.
+
+    Each thread still sees its own stack, and so does each
+    :mod:`asyncio` task, as a task runs in a copy of the context it was
+    created from.  Requests interleaved on a single event loop thread
+    therefore never observe each other's values.
+    """
+
+    def __init__(self, default=None):
+        self._stack = contextvars.ContextVar('pyramid.threadlocal', default=())
+        self.default = default
+
+    @property
+    def stack(self):
+        return list(self._stack.get())
+
+    def push(self, info):
+        # the stack is immutable so that contexts copied from this one are
+        # unaffected by later pushes and pops
+        self._stack.set(self._stack.get() + (info,))
+
+    set = push  # b/c
+
+    def pop(self):
+        stack = self._stack.get()
+        if stack:
+            self._stack.set(stack[:-1])
+            return stack[-1]
+
+    def get(self):
+        try:
+            return self._stack.get()[-1]
+        except IndexError:
+            return self.default()
+
+    def clear(self):
+        self._stack.set(())
+
+
 def defaults():
     return {'request': None, 'registry': global_registry}
 
@@ -39,6 +82,23 @@ def defaults():
 manager = ThreadLocalManager(default=defaults)
 
 
+def set_manager(new_manager):
+    """Replace the manager which stores the current request and registry
+    (:class:`ThreadLocalManager` by default) with ``new_manager`` and return
+    the previous one.  Values pushed by the current thread are carried over
+    to ``new_manager``; those pushed by other threads are not, so this is
+    best done at startup.  It is usually done via the
+    ``pyramid.use_contextvars`` setting, which installs a
+    :class:`ContextVarManager`.
+    """
+    global manager
+    old_manager = manager
+    for info in old_manager.stack:
+        new_manager.push(info)
+    manager = new_manager
+    return old_manager
+
+
 def get_current_request():
     """
     Return the currently active request or ``None`` if no request
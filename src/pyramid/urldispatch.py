@@ -11,12 +11,17 @@ _marker = object()
 
 @implementer(IRoute)
 class Route:
+    # the IRouteRequest interface of the route, attached by the configurator
+    # when the route is connected so the router need not look it up
+    request_iface = None
+
     def __init__(
         self, name, pattern, factory=None, predicates=(), pregenerator=None
     ):
         self.pattern = pattern
         self.path = pattern  # indefinite b/w compat, not in interface
         self.match, self.generate = _compile_route(pattern)
+        self.literal_prefix, self.is_literal = _literal_prefix(pattern)
         self.name = name
         self.factory = factory
         self.predicates = predicates
@@ -25,12 +30,18 @@ class Route:
 
 @implementer(IRoutesMapper)
 class RoutesMapper:
-    def __init__(self):
+    def __init__(self, compiled=False):
         self.routelist = []
         self.static_routes = []
 
         self.routes = {}
 
+        # when ``compiled`` is true, ``__call__`` consults a segment trie
+        # built from the literal prefix of each route so that only routes
+        # which can possibly match the path have their regex tried
+        self.compiled = compiled
+        self._dispatcher = None
+
     def has_routes(self):
         return bool(self.routelist)
 
@@ -64,6 +75,7 @@ class RoutesMapper:
             self.static_routes.append(route)
 
         self.routes[name] = route
+        self._dispatcher = None
         return route
 
     def generate(self, name, kw):
@@ -80,7 +92,15 @@ class RoutesMapper:
                 e.encoding, e.object, e.start, e.end, e.reason
             )
 
-        for route in self.routelist:
+        if self.compiled:
+            dispatcher = self._dispatcher
+            if dispatcher is None:
+                dispatcher = self._dispatcher = RouteDispatcher(self.routelist)
+            routelist = dispatcher(path)
+        else:
+            routelist = self.routelist
+
+        for route in routelist:
             match = route.match(path)
             if match is not None:
                 preds = route.predicates
@@ -92,6 +112,64 @@ class RoutesMapper:
         return {'route': None, 'match': None}
 
 
+class RouteDispatcher:
+    """Narrow a list of routes down to the ones which can possibly match a
+    path, preserving their declaration order.
+
+    Each route is filed under the trie node named by the complete
+    segments of its literal prefix (the part of the pattern before the
+    first replacement marker), and routes without any replacement markers
+    are filed by their full literal path.  Finding the candidates for a
+    path therefore costs one dictionary lookup per path segment no matter
+    how many routes are registered; only the candidates are then matched
+    against their regular expressions by the :class:`RoutesMapper`."""
+
+    def __init__(self, routelist):
+        self.routelist = list(routelist)
+        self.root = _TrieNode()
+        self.literals = {}
+        for index, route in enumerate(self.routelist):
+            prefix = route.literal_prefix
+            if route.is_literal:
+                self.literals.setdefault(prefix, []).append(index)
+                continue
+            node = self.root
+            # only segments followed by a slash are complete; the last
+            # element is either empty or the start of a dynamic segment
+            for segment in prefix.split('/')[1:-1]:
+                node = node.children.setdefault(segment, _TrieNode())
+            node.indexes.append(index)
+
+    def __call__(self, path):
+        segments = path.split('/')
+        if segments[0]:
+            # every route pattern begins with a slash
+            return []
+        node = self.root
+        indexes = list(node.indexes)
+        for segment in segments[1:-1]:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            indexes.extend(node.indexes)
+        literals = self.literals
+        if literals:
+            indexes.extend(literals.get(path, ()))
+            if path.endswith('\n'):
+                # ``$`` also matches before a trailing newline
+                indexes.extend(literals.get(path[:-1], ()))
+        routelist = self.routelist
+        return [routelist[index] for index in sorted(indexes)]
+
+
+class _TrieNode:
+    __slots__ = ('children', 'indexes')
+
+    def __init__(self):
+        self.children = {}
+        self.indexes = []
+
+
 # stolen from bobo and modified
 old_route_re = re.compile(r'(\:[_a-zA-Z]\w*)')
 star_at_end = re.compile(r'\*(\w*)$')
@@ -108,7 +186,7 @@ def update_pattern(matchobj):
     return '{%s}' % name[1:]
 
 
-def _compile_route(route):
+def _normalize_route(route):
     # This function really wants to consume Unicode patterns natively, but if
     # someone passes us a bytestring, we allow it by converting it to Unicode
     # using the ASCII decoding.  We decode it using ASCII because we don't
@@ -134,6 +212,20 @@ def _compile_route(route):
     if star_at_end.search(route):
         route, remainder = route.rsplit('*', 1)
 
+    return route, remainder
+
+
+def _literal_prefix(route):
+    # Return the literal text a path must begin with to match the route
+    # and whether the route consists of nothing but that literal text.
+    route, remainder = _normalize_route(route)
+    pat = route_re.split(route)
+    return pat[0], len(pat) == 1 and not remainder
+
+
+def _compile_route(route):
+    route, remainder = _normalize_route(route)
+
     pat = route_re.split(route)
 
     # every element in "pat" will be Unicode (regardless of whether the
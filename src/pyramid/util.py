@@ -1,8 +1,10 @@
+from collections import OrderedDict
 from contextlib import contextmanager
 import functools
 from hmac import compare_digest
 import inspect
 import platform
+import threading
 import weakref
 
 from pyramid.path import DottedNameResolver as _DottedNameResolver
@@ -133,6 +135,37 @@ class InstancePropertyHelper:
 
         return name, fn
 
+    @classmethod
+    def make_class(cls, parent, properties):
+        """Return a new subclass of ``parent`` carrying the ``properties``
+        generated from :meth:`.make_property` as class attributes.
+        """
+        attrs = dict(properties)
+        # fix the module name so it appears to still be the parent
+        # e.g. pyramid.request instead of pyramid.util
+        attrs.setdefault('__module__', parent.__module__)
+        newcls = type(parent.__name__, (parent, object), attrs)
+        # We assign __provides__ and __implemented__ below to prevent a
+        # memory leak that results from from the usage of this instance's
+        # eventual use in an adapter lookup.  Adapter lookup results in
+        # ``zope.interface.implementedBy`` being called with the
+        # newly-created class as an argument.  Because the newly-created
+        # class has no interface specification data of its own, lookup
+        # causes new ClassProvides and Implements instances related to our
+        # just-generated class to be created and set into the newly-created
+        # class' __dict__.  We don't want these instances to be created; we
+        # want this new class to behave exactly like it is the parent class
+        # instead.  See GitHub issues #1212, #1529 and #1568 for more
+        # information.
+        for name in ('__implemented__', '__provides__'):
+            # we assign these attributes conditionally to make it possible
+            # to test this class in isolation without having any interfaces
+            # attached to it
+            val = getattr(parent, name, _marker)
+            if val is not _marker:
+                setattr(newcls, name, val)
+        return newcls
+
     @classmethod
     def apply_properties(cls, target, properties):
         """Accept a list or dict of ``properties`` generated from
@@ -140,31 +173,7 @@ class InstancePropertyHelper:
         """
         attrs = dict(properties)
         if attrs:
-            parent = target.__class__
-            # fix the module name so it appears to still be the parent
-            # e.g. pyramid.request instead of pyramid.util
-            attrs.setdefault('__module__', parent.__module__)
-            newcls = type(parent.__name__, (parent, object), attrs)
-            # We assign __provides__ and __implemented__ below to prevent a
-            # memory leak that results from from the usage of this instance's
-            # eventual use in an adapter lookup.  Adapter lookup results in
-            # ``zope.interface.implementedBy`` being called with the
-            # newly-created class as an argument.  Because the newly-created
-            # class has no interface specification data of its own, lookup
-            # causes new ClassProvides and Implements instances related to our
-            # just-generated class to be created and set into the newly-created
-            # class' __dict__.  We don't want these instances to be created; we
-            # want this new class to behave exactly like it is the parent class
-            # instead.  See GitHub issues #1212, #1529 and #1568 for more
-            # information.
-            for name in ('__implemented__', '__provides__'):
-                # we assign these attributes conditionally to make it possible
-                # to test this class in isolation without having any interfaces
-                # attached to it
-                val = getattr(parent, name, _marker)
-                if val is not _marker:
-                    setattr(newcls, name, val)
-            target.__class__ = newcls
+            target.__class__ = cls.make_class(target.__class__, attrs)
 
     @classmethod
     def set_property(cls, target, callable, name=None, reify=False):
@@ -317,6 +326,105 @@ class WeakOrderedSet:
             return self._items[oid]()
 
 
+class LRUCache:
+    """A thread-safe mapping holding at most ``maxsize`` items.
+
+    When a new key is stored in a full cache the least recently used key is
+    discarded.  The number of lookups which found a value (``hits``), which
+    found nothing (``misses``) and the number of keys discarded to make room
+    (``evictions``) are counted.
+
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a') == 1
+        cache.put('c', 3)  # discards 'b'
+        cache.get('b') is None
+
+    If ``getsize`` is passed, it is called with each value stored and
+    ``maxsize`` then bounds the sum of the sizes it returns (available as
+    ``size``) rather than the number of items.  A value larger than
+    ``maxsize`` is not stored.
+    """
+
+    def __init__(self, maxsize, getsize=None):
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        self.maxsize = maxsize
+        self.getsize = getsize
+        self.size = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the value stored for ``key`` or ``default``."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store ``value`` for ``key``, discarding the least recently used
+        key if the cache is full."""
+        getsize = self.getsize
+        if getsize is not None:
+            return self._put_sized(key, value, getsize)
+        with self._lock:
+            data = self._data
+            if key in data:
+                data.move_to_end(key)
+            elif len(data) >= self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+            data[key] = value
+            self.size = len(data)
+
+    def _put_sized(self, key, value, getsize):
+        size = getsize(value)
+        with self._lock:
+            data = self._data
+            if key in data:
+                self.size -= getsize(data.pop(key))
+            if size > self.maxsize:
+                return
+            while data and self.size + size > self.maxsize:
+                self.size -= getsize(data.popitem(last=False)[1])
+                self.evictions += 1
+            data[key] = value
+            self.size += size
+
+    def pop(self, key, default=None):
+        """Discard ``key`` and return its value, or ``default`` if it is not
+        stored."""
+        with self._lock:
+            value = self._data.pop(key, _marker)
+            if value is _marker:
+                return default
+            if self.getsize is not None:
+                self.size -= self.getsize(value)
+            else:
+                self.size = len(self._data)
+            return value
+
+    def clear(self):
+        """Discard every key.  The counters are left untouched."""
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
 def strings_differ(string1, string2):
     """Check whether two strings differ while avoiding timing attacks.
 
@@ -2,8 +2,9 @@ import inspect
 import itertools
 import sys
 import venusian
-from zope.interface import providedBy
+from zope.interface import implementedBy, providedBy
 
+from pyramid import threadlocal
 from pyramid.exceptions import ConfigurationError, PredicateMismatch
 from pyramid.httpexceptions import (
     HTTPNotFound,
@@ -14,12 +15,14 @@ from pyramid.interfaces import (
     IExceptionViewClassifier,
     IMultiView,
     IRequest,
+    IRootFactory,
     IRoutesMapper,
     ISecuredView,
     IView,
     IViewClassifier,
 )
-from pyramid.threadlocal import get_current_registry, manager
+from pyramid.threadlocal import get_current_registry
+from pyramid.traversal import DefaultRootFactory
 from pyramid.util import hide_attrs, reraise as reraise_
 
 _marker = object()
@@ -609,6 +612,21 @@ def _find_views(
     cache = registry._view_lookup_cache
     views = cache.get((request_iface, context_iface, view_name))
     if views is None:
+        # hits are cached without bound, as the number of registered views
+        # is bounded.  misses are only cached in a bounded LRU cache, if one
+        # is configured, so that a flood of missing URLs costs a dict probe
+        # per request without growing memory use
+        miss_cache = getattr(registry, 'view_lookup_miss_cache', None)
+        if miss_cache is not None:
+            miss_key = (
+                request_iface,
+                context_iface,
+                view_name,
+                view_types,
+                view_classifier,
+            )
+            if miss_cache.get(miss_key) is not None:
+                return []
         views = []
         for req_type, ctx_type in itertools.product(
             request_iface.__sro__, context_iface.__sro__
@@ -621,18 +639,132 @@ def _find_views(
                 if view_callable is not None:
                     views.append(view_callable)
         if views:
-            # do not cache view lookup misses.  rationale: dont allow cache to
-            # grow without bound if somebody tries to hit the site with many
-            # missing URLs.  we could use an LRU cache instead, but then
-            # purposeful misses by an attacker would just blow out the cache
-            # anyway. downside: misses will almost always consume more CPU than
-            # hits in steady state.
-            with registry._lock:
+            if getattr(registry, 'frozen', False):
+                # the cache is never cleared once the registry is frozen, so
+                # a single store needs no lock
                 cache[(request_iface, context_iface, view_name)] = views
+            else:
+                with registry._lock:
+                    cache[(request_iface, context_iface, view_name)] = views
+        elif miss_cache is not None:
+            miss_cache.put(miss_key, True)
 
     return views
 
 
+def _precompute_view_lookups(registry):
+    """Fill the view lookup cache of ``registry`` for the lookups a request
+    is expected to make: views for every request interface known to the
+    routes mapper, for the contexts created by root factory classes or views
+    are registered for (including subclasses of context classes other than
+    exceptions), and exception views for every exception class an exception
+    view may be found for."""
+    view_types = (IView, ISecuredView, IMultiView)
+    request_ifaces = {IRequest}
+    factories = [
+        registry.queryUtility(IRootFactory, default=DefaultRootFactory)
+    ]
+    mapper = registry.queryUtility(IRoutesMapper)
+    if mapper is not None:
+        for route in mapper.get_routes():
+            if route.request_iface is not None:
+                request_ifaces.add(route.request_iface)
+            factories.append(route.factory)
+    registered = {IViewClassifier: set(), IExceptionViewClassifier: set()}
+    for reg in registry.registeredAdapters():
+        required = reg.required
+        if (
+            reg.provided in view_types
+            and len(required) == 3
+            and required[0] in registered
+        ):
+            registered[required[0]].add((required[1], required[2], reg.name))
+
+    context_ifaces = {
+        implementedBy(factory)
+        for factory in factories
+        if isinstance(factory, type)
+    }
+    for _, ctx_type, _ in registered[IViewClassifier]:
+        context_ifaces.add(ctx_type)
+        # instances of a subclass of a context class provide the interface
+        # specification of the subclass
+        cls = getattr(ctx_type, 'inherit', None)
+        if isinstance(cls, type):
+            context_ifaces.update(
+                implementedBy(sub)
+                for sub in _subclasses(cls)
+                if not issubclass(sub, BaseException)
+            )
+
+    # exception views are usually registered for an interface or a base
+    # class of the exceptions which are raised
+    exception_contexts = {
+        ctx_type for _, ctx_type, _ in registered[IExceptionViewClassifier]
+    }
+    exception_ifaces = set()
+    for cls in _subclasses(BaseException):
+        spec = implementedBy(cls)
+        if any(spec.isOrExtends(ctx) for ctx in exception_contexts):
+            exception_ifaces.add(spec)
+
+    lookups = (
+        (IViewClassifier, request_ifaces, context_ifaces),
+        (
+            IExceptionViewClassifier,
+            {iface.combined for iface in request_ifaces},
+            exception_ifaces,
+        ),
+    )
+    cache = registry._view_lookup_cache
+    for view_classifier, lookup_request_ifaces, lookup_contexts in lookups:
+        req_types = {
+            req_type for req_type, _, _ in registered[view_classifier]
+        }
+        keys = set()
+        for req_type, ctx_type, view_name in registered[view_classifier]:
+            for request_iface in lookup_request_ifaces:
+                if request_iface.isOrExtends(req_type):
+                    for context_iface in lookup_contexts:
+                        if context_iface.isOrExtends(ctx_type):
+                            keys.add((request_iface, context_iface, view_name))
+        # request interfaces which extend the same registered request types,
+        # such as the combined interfaces of routes without exception views
+        # of their own, find the same views; look those up only once
+        found = {}
+        for request_iface, context_iface, view_name in keys:
+            signature = (
+                tuple(i for i in request_iface.__sro__ if i in req_types),
+                context_iface,
+                view_name,
+            )
+            views = found.get(signature)
+            if views is None:
+                found[signature] = _find_views(
+                    registry,
+                    request_iface,
+                    context_iface,
+                    view_name,
+                    view_classifier=view_classifier,
+                )
+            else:
+                with registry._lock:
+                    cache.setdefault(
+                        (request_iface, context_iface, view_name), views
+                    )
+
+
+def _subclasses(cls):
+    todo = cls.__subclasses__()
+    seen = set()
+    while todo:
+        sub = todo.pop()
+        if sub not in seen:
+            seen.add(sub)
+            todo.extend(sub.__subclasses__())
+    return seen
+
+
 def _call_view(
     registry,
     request,
@@ -759,6 +891,7 @@ class ViewMethodsMixin:
             # https://github.com/Pylons/pyramid/issues/700
             request_iface = attrs.get('request_iface', IRequest)
 
+            manager = threadlocal.manager
             manager.push({'request': request, 'registry': registry})
 
             try:
@@ -2,6 +2,7 @@ import inspect
 from zope.interface import implementer, provider
 
 from pyramid import renderers
+from pyramid.asgi import await_result
 from pyramid.csrf import check_csrf_origin, check_csrf_token
 from pyramid.exceptions import ConfigurationError
 from pyramid.httpexceptions import HTTPForbidden
@@ -193,6 +194,7 @@ def preserve_view_attrs(view, wrapper):
         '__permission__',
         '__predicated__',
         '__predicates__',
+        '__predicated_view__',
         '__accept__',
         '__order__',
         '__text__',
@@ -215,12 +217,34 @@ def mapped_view(view, info):
                 mapper = DefaultViewMapper
 
     mapped_view = mapper(**info.options)(view)
+    if is_coroutine_view(view, info.options.get('attr')):
+        mapped_view = awaited_view(mapped_view)
     return mapped_view
 
 
 mapped_view.options = ('mapper', 'attr')
 
 
+def is_coroutine_view(view, attr=None):
+    if inspect.isclass(view) or attr is not None:
+        view = getattr(view, attr or '__call__', None)
+    elif not inspect.isroutine(view):
+        view = getattr(view, '__call__', None)
+    return inspect.iscoroutinefunction(view)
+
+
+def awaited_view(view):
+    # the coroutine is awaited here so that every other deriver sees the
+    # view's result just as it would for a synchronous view
+    def _awaited_view(context, request):
+        return await_result(request, view(context, request))
+
+    text = getattr(view, '__text__', None)
+    if text is not None:
+        _awaited_view.__text__ = text
+    return _awaited_view
+
+
 def owrapped_view(view, info):
     wrapper_viewname = info.options.get('wrapper')
     viewname = info.options.get('name')
@@ -433,6 +457,10 @@ def rendered_view(view, info):
     if renderer is renderers.null_renderer:
         return view
 
+    # a helper of its own, whose renderer is created by the renderer factory
+    # on first use and then reused by every request
+    view_renderer = renderer.clone()
+
     def rendered_view(context, request):
         result = view(context, request)
         if result.__class__ is Response:  # potential common case
@@ -446,18 +474,18 @@ def rendered_view(view, info):
                 if 'override_renderer' in attrs:
                     # renderer overridden by newrequest event or other
                     renderer_name = attrs.pop('override_renderer')
-                    view_renderer = renderers.RendererHelper(
+                    request_renderer = renderers.RendererHelper(
                         name=renderer_name,
                         package=info.package,
                         registry=info.registry,
                     )
                 else:
-                    view_renderer = renderer.clone()
+                    request_renderer = view_renderer
                 if '__view__' in attrs:
                     view_inst = attrs.pop('__view__')
                 else:
                     view_inst = getattr(view, '__original_view__', view)
-                response = view_renderer.render_view(
+                response = request_renderer.render_view(
                     request, result, view_inst, context
                 )
         return response
@@ -0,0 +1,449 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+import unittest
+
+
+class TestASGIApplication(unittest.TestCase):
+    def setUp(self):
+        from pyramid.config import Configurator
+
+        self.config = Configurator()
+
+    def tearDown(self):
+        import pyramid.config
+
+        pyramid.config.global_registries.empty()
+
+    def _makeOne(self, executor=None):
+        from pyramid.asgi import ASGIApplication
+
+        return ASGIApplication(self.config.make_wsgi_app(), executor=executor)
+
+    def _makeScope(self, **kw):
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': '/',
+            'root_path': '',
+            'query_string': b'',
+            'headers': [(b'host', b'example.com')],
+            'server': ('example.com', 80),
+            'client': ('127.0.0.1', 12345),
+        }
+        scope.update(kw)
+        return scope
+
+    def _call(self, app, scope, messages=None, events=None):
+        if messages is None:
+            messages = [{'type': 'http.request', 'body': b''}]
+        return asyncio.run(_drive(app, scope, messages, events))
+
+    def _responseStart(self, sent):
+        start = sent[0]
+        self.assertEqual(start['type'], 'http.response.start')
+        return start['status'], dict(start['headers'])
+
+    def _responseBody(self, sent):
+        for message in sent[1:]:
+            self.assertEqual(message['type'], 'http.response.body')
+        self.assertFalse(sent[-1].get('more_body', False))
+        return b''.join(message['body'] for message in sent[1:])
+
+    def test_it(self):
+        def hello(request):
+            request.response.text = 'Hello %s' % request.params['name']
+            return request.response
+
+        self.config.add_route('hello', '/hello')
+        self.config.add_view(hello, route_name='hello')
+        app = self._makeOne()
+        scope = self._makeScope(path='/hello', query_string=b'name=world')
+        sent = self._call(app, scope)
+        status, headers = self._responseStart(sent)
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b'content-type'], b'text/html; charset=UTF-8')
+        self.assertEqual(self._responseBody(sent), b'Hello world')
+
+    def test_request_translation(self):
+        requests = []
+
+        def view(request):
+            requests.append(request)
+            request.POST  # the body is read while processing the request
+            return request.response
+
+        self.config.add_route('catchall', '/*path')
+        self.config.add_view(view, route_name='catchall')
+        app = self._makeOne()
+        scope = self._makeScope(
+            method='POST',
+            path='/app/foo/café',
+            root_path='/app',
+            query_string=b'a=1',
+            headers=[
+                (b'host', b'example.com:8080'),
+                (b'content-type', b'application/x-www-form-urlencoded'),
+                (b'content-length', b'3'),
+                (b'x-multi', b'1'),
+                (b'x-multi', b'2'),
+            ],
+        )
+        messages = [
+            {'type': 'http.request', 'body': b'b=', 'more_body': True},
+            {'type': 'http.request', 'body': b'2'},
+        ]
+        self._call(app, scope, messages)
+        request = requests[0]
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(request.script_name, '/app')
+        self.assertEqual(request.path_info, '/foo/café')
+        self.assertEqual(request.GET['a'], '1')
+        self.assertEqual(request.POST['b'], '2')
+        self.assertEqual(request.content_length, 3)
+        self.assertEqual(request.host, 'example.com:8080')
+        self.assertEqual(request.headers['X-Multi'], '1,2')
+        self.assertEqual(request.client_addr, '127.0.0.1')
+        self.assertIs(request.environ['asgi.scope'], scope)
+
+    def test_streams_app_iter(self):
+        closed = []
+
+        class AppIter:
+            def __iter__(self):
+                yield b'a'
+                yield b''
+                yield b'b'
+
+            def close(self):
+                closed.append(True)
+
+        def view(request):
+            request.response.app_iter = AppIter()
+            return request.response
+
+        self.config.add_view(view)
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope())
+        self.assertEqual(
+            [message.get('body') for message in sent[1:]], [b'a', b'b', b'']
+        )
+        self.assertEqual(
+            [message.get('more_body') for message in sent[1:]],
+            [True, True, None],
+        )
+        self.assertEqual(closed, [True])
+
+    def test_head_request(self):
+        def view(request):
+            request.response.text = 'Hello'
+            return request.response
+
+        self.config.add_view(view)
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope(method='HEAD'))
+        status, headers = self._responseStart(sent)
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b'content-length'], b'5')
+        self.assertEqual(self._responseBody(sent), b'')
+
+    def test_not_found(self):
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope(path='/missing'))
+        status, headers = self._responseStart(sent)
+        self.assertEqual(status, 404)
+
+    def test_uses_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def view(request):
+            request.response.text = 'Hello'
+            return request.response
+
+        self.config.add_view(view)
+        with ThreadPoolExecutor(1) as executor:
+            app = self._makeOne(executor=executor)
+            sent = self._call(app, self._makeScope())
+        self.assertEqual(self._responseBody(sent), b'Hello')
+
+    def test_default_executor(self):
+        app = self._makeOne()
+        self.assertIsInstance(app.executor, ThreadPoolExecutor)
+        self.assertIsNot(app.executor, self._makeOne().executor)
+
+    def _serveOffloadingViews(self, count, executor=None):
+        # requests for a coroutine view waiting for the default executor of
+        # the loop, which has fewer threads than there are requests
+        async def view(request):
+            await asyncio.to_thread(time.sleep, 0.01)
+            request.response.text = 'done'
+            return request.response
+
+        self.config.add_view(view)
+        app = self._makeOne(executor=executor)
+
+        async def serve():
+            loop = asyncio.get_running_loop()
+            loop.set_default_executor(ThreadPoolExecutor(2))
+            requests = [
+                _drive(app, self._makeScope(), [{'type': 'http.request'}])
+                for i in range(count)
+            ]
+            return await asyncio.wait_for(asyncio.gather(*requests), 5)
+
+        return asyncio.run(serve())
+
+    def test_coroutine_views_waiting_for_default_executor(self):
+        for sent in self._serveOffloadingViews(4):
+            self.assertEqual(self._responseBody(sent), b'done')
+
+    def test_more_requests_than_executor_threads(self):
+        with ThreadPoolExecutor(2) as executor:
+            for sent in self._serveOffloadingViews(4, executor):
+                self.assertEqual(self._responseBody(sent), b'done')
+
+    def test_body_received_as_read(self):
+        events = []
+
+        def view(request):
+            events.append('view')
+            events.append(request.body_file_raw.read(3))
+            events.append(request.body_file_raw.read())
+            return request.response
+
+        self.config.add_view(view)
+        app = self._makeOne()
+        messages = [
+            {'type': 'http.request', 'body': b'ab', 'more_body': True},
+            {'type': 'http.request', 'body': b'cd', 'more_body': True},
+            {'type': 'http.request', 'body': b'e'},
+        ]
+        sent = self._call(
+            app, self._makeScope(method='POST'), messages, events
+        )
+        self.assertEqual(self._responseStart(sent)[0], 200)
+        self.assertEqual(
+            events,
+            ['view', 'receive', 'receive', b'abc', 'receive', b'de'],
+        )
+
+    def test_body_without_content_length(self):
+        bodies = []
+
+        def view(request):
+            bodies.append(request.body)
+            return request.response
+
+        self.config.add_view(view)
+        app = self._makeOne()
+        messages = [
+            {'type': 'http.request', 'body': b'ab', 'more_body': True},
+            {'type': 'http.request', 'body': b'c'},
+        ]
+        self._call(app, self._makeScope(method='POST'), messages)
+        self.assertEqual(bodies, [b'abc'])
+
+    def test_body_not_read(self):
+        events = []
+
+        def view(request):
+            return request.response
+
+        self.config.add_view(view)
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope(), None, events)
+        self.assertEqual(self._responseStart(sent)[0], 200)
+        self.assertEqual(events, [])
+
+    def test_client_disconnects(self):
+        def view(request):
+            request.body
+
+        self.config.add_view(view)
+        app = self._makeOne()
+        messages = [
+            {'type': 'http.request', 'body': b'a', 'more_body': True},
+            {'type': 'http.disconnect'},
+        ]
+        sent = self._call(app, self._makeScope(method='POST'), messages)
+        self.assertEqual(sent, [])
+
+    def test_lifespan(self):
+        app = self._makeOne()
+        messages = [
+            {'type': 'lifespan.startup'},
+            {'type': 'lifespan.shutdown'},
+        ]
+        sent = self._call(app, {'type': 'lifespan'}, messages)
+        self.assertEqual(
+            sent,
+            [
+                {'type': 'lifespan.startup.complete'},
+                {'type': 'lifespan.shutdown.complete'},
+            ],
+        )
+
+    def test_unsupported_scope(self):
+        app = self._makeOne()
+        self.assertRaises(
+            ValueError, self._call, app, {'type': 'websocket'}, []
+        )
+
+    def test_coroutine_view_awaited_on_server_loop(self):
+        loops = []
+
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        async def view(request):
+            loops.append(asyncio.get_running_loop())
+            results = await asyncio.gather(fetch('a'), fetch('b'))
+            request.response.text = ''.join(results)
+            return request.response
+
+        self.config.add_view(view)
+        app = self._makeOne()
+
+        async def serve():
+            sent = await _drive(
+                app, self._makeScope(), [{'type': 'http.request'}]
+            )
+            return sent, asyncio.get_running_loop()
+
+        sent, loop = asyncio.run(serve())
+        self.assertEqual(self._responseBody(sent), b'ab')
+        self.assertEqual(loops, [loop])
+
+
+class Test_ReceiveInput(unittest.TestCase):
+    def _makeOne(self, *bodies):
+        from pyramid.asgi import _get_shared_loop, _ReceiveInput
+
+        messages = [
+            {'type': 'http.request', 'body': body, 'more_body': True}
+            for body in bodies
+        ]
+        messages[-1]['more_body'] = False
+
+        async def receive():
+            return messages.pop(0)
+
+        return _ReceiveInput(receive, _get_shared_loop())
+
+    def test_read(self):
+        inst = self._makeOne(b'ab', b'', b'cde')
+        self.assertEqual(inst.read(1), b'a')
+        self.assertEqual(inst.read(3), b'bcd')
+        self.assertEqual(inst.read(None), b'e')
+        self.assertEqual(inst.read(), b'')
+        self.assertEqual(inst.read(5), b'')
+
+    def test_readline(self):
+        inst = self._makeOne(b'a', b'b\nc', b'\nd')
+        self.assertEqual(inst.readline(), b'ab\n')
+        self.assertEqual(inst.readline(1), b'c')
+        self.assertEqual(inst.readline(None), b'\n')
+        self.assertEqual(inst.readline(), b'd')
+        self.assertEqual(inst.readline(), b'')
+
+    def test_readlines(self):
+        inst = self._makeOne(b'a\nb\n', b'c\nd')
+        self.assertEqual(inst.readlines(3), [b'a\n', b'b\n'])
+        self.assertEqual(inst.readlines(), [b'c\n', b'd'])
+
+    def test_iter(self):
+        inst = self._makeOne(b'a\nb', b'\n')
+        self.assertEqual(list(inst), [b'a\n', b'b\n'])
+
+    def test_disconnect(self):
+        from webob.request import DisconnectionError
+
+        from pyramid.asgi import _get_shared_loop, _ReceiveInput
+
+        async def receive():
+            return {'type': 'http.disconnect'}
+
+        inst = _ReceiveInput(receive, _get_shared_loop())
+        self.assertRaises(DisconnectionError, inst.read)
+
+
+class Test_await_result(unittest.TestCase):
+    def _callFUT(self, request, awaitable):
+        from pyramid.asgi import await_result
+
+        return await_result(request, awaitable)
+
+    def test_shared_loop(self):
+        from pyramid.asgi import _get_shared_loop
+
+        async def coro():
+            return asyncio.get_running_loop()
+
+        request = DummyRequest()
+        loop = self._callFUT(request, coro())
+        self.assertIs(loop, _get_shared_loop())
+        self.assertIs(self._callFUT(request, coro()), loop)
+
+    def test_request_without_environ(self):
+        async def coro():
+            return 'a'
+
+        self.assertEqual(self._callFUT(None, coro()), 'a')
+
+    def test_non_coroutine_awaitable(self):
+        class Awaitable:
+            def __await__(self):
+                return asyncio.sleep(0, 'b').__await__()
+
+        self.assertEqual(self._callFUT(DummyRequest(), Awaitable()), 'b')
+
+    def test_exception_propagates(self):
+        async def coro():
+            raise ZeroDivisionError
+
+        self.assertRaises(
+            ZeroDivisionError, self._callFUT, DummyRequest(), coro()
+        )
+
+    def test_from_thread_running_loop(self):
+        from pyramid.asgi import LOOP_KEY
+
+        async def coro():  # pragma: no cover
+            pass
+
+        async def main():
+            request = DummyRequest()
+            request.environ[LOOP_KEY] = asyncio.get_running_loop()
+            awaitable = coro()
+            try:
+                self._callFUT(request, awaitable)
+            finally:
+                awaitable.close()
+
+        self.assertRaises(RuntimeError, asyncio.run, main())
+
+
+class DummyRequest:
+    def __init__(self):
+        self.environ = {}
+
+
+async def _drive(app, scope, messages, events=None):
+    # an in-process ASGI server
+    messages = list(messages)
+    sent = []
+
+    async def receive():
+        if events is not None:
+            events.append('receive')
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
@@ -568,6 +568,10 @@ class TestAuthTktAuthenticationPolicy(unittest.TestCase):
         inst = self._getTargetClass()('secret', hashalg='sha512')
         self.assertEqual(inst.cookie.hashalg, 'sha512')
 
+    def test_ticket_cache_size_override(self):
+        inst = self._getTargetClass()('secret', ticket_cache_size=10)
+        self.assertEqual(inst.cookie.ticket_cache.maxsize, 10)
+
     def test_unauthenticated_userid_returns_None(self):
         request = DummyRequest({})
         policy = self._makeOne(None, None)
@@ -883,6 +887,82 @@ class TestAuthTktCookieHelper(unittest.TestCase):
         result = helper.identify(request)
         self.assertEqual(result, None)
 
+    def test_identify_ticket_cache_disabled(self):
+        helper = self._makeOne('secret')
+        self.assertIsNone(helper.ticket_cache)
+
+    def _countParses(self, helper):
+        calls = []
+        parse_ticket = helper.parse_ticket
+
+        def counting_parse_ticket(*arg):
+            calls.append(arg)
+            return parse_ticket(*arg)
+
+        helper.parse_ticket = counting_parse_ticket
+        return calls
+
+    def test_identify_ticket_cache(self):
+        helper = self._makeOne('secret', ticket_cache_size=10)
+        helper.auth_tkt.tokens = ['a', 'b']
+        calls = self._countParses(helper)
+        result = helper.identify(self._makeRequest('ticket'))
+        self.assertEqual(result['tokens'], ['a', 'b'])
+        result['tokens'].append('c')
+        request = self._makeRequest('ticket')
+        result = helper.identify(request)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(result['userid'], 'userid')
+        self.assertEqual(result['tokens'], ['a', 'b'])
+        self.assertEqual(request.environ['REMOTE_USER_TOKENS'], ['a', 'b'])
+        cache = helper.ticket_cache
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_identify_ticket_cache_keyed_on_remote_addr(self):
+        helper = self._makeOne('secret', include_ip=True, ticket_cache_size=10)
+        calls = self._countParses(helper)
+        helper.identify(self._makeRequest('ticket'))
+        helper.identify(self._makeRequest('ticket', ipv6=True))
+        helper.identify(self._makeRequest('ticket'))
+        remote_addrs = [arg[2] for arg in calls]
+        self.assertEqual(remote_addrs, ['1.1.1.1', '::1'])
+
+    def test_identify_ticket_cache_bad_ticket_not_cached(self):
+        helper = self._makeOne('secret', ticket_cache_size=10)
+        helper.auth_tkt.parse_raise = True
+        self.assertIsNone(helper.identify(self._makeRequest('ticket')))
+        self.assertEqual(len(helper.ticket_cache), 0)
+
+    def test_identify_ticket_cache_timeout(self):
+        import time
+
+        helper = self._makeOne('secret', timeout=10, ticket_cache_size=10)
+        now = time.time()
+        helper.auth_tkt.timestamp = now
+        helper.now = now + 1
+        self.assertTrue(helper.identify(self._makeRequest('ticket')))
+        helper.now = now + 11
+        self.assertIsNone(helper.identify(self._makeRequest('ticket')))
+        self.assertEqual(helper.ticket_cache.hits, 1)
+
+    def test_identify_ticket_cache_reissue(self):
+        import time
+
+        helper = self._makeOne(
+            'secret', timeout=100, reissue_time=10, ticket_cache_size=10
+        )
+        now = time.time()
+        helper.auth_tkt.timestamp = now
+        helper.now = now + 1
+        request = self._makeRequest('ticket')
+        self.assertTrue(helper.identify(request))
+        self.assertEqual(len(request.callbacks), 0)
+        helper.now = now + 11
+        request = self._makeRequest('ticket')
+        self.assertTrue(helper.identify(request))
+        self.assertEqual(len(request.callbacks), 1)
+        self.assertEqual(helper.ticket_cache.hits, 1)
+
     def test_identify_cookie_timeout(self):
         helper = self._makeOne('secret', timeout=1)
         self.assertEqual(helper.timeout, 1)
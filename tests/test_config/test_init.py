@@ -92,6 +92,30 @@ class ConfiguratorTests(unittest.TestCase):
         )
         self.assertEqual(manager.popped, False)
 
+    def test_manager_default(self):
+        from pyramid import threadlocal
+        from pyramid.config import Configurator
+
+        config = Configurator()
+        self.assertIs(config.manager, threadlocal.manager)
+
+    def test_use_contextvars(self):
+        from pyramid import threadlocal
+        from pyramid.config import Configurator
+
+        old_manager = threadlocal.manager
+        try:
+            config = Configurator(settings={'pyramid.use_contextvars': 'true'})
+            manager = threadlocal.manager
+            self.assertIsInstance(manager, threadlocal.ContextVarManager)
+            self.assertIs(config.manager, manager)
+            Configurator(settings={'pyramid.use_contextvars': 'true'})
+            self.assertIs(threadlocal.manager, manager)
+            Configurator()
+            self.assertIs(threadlocal.manager, manager)
+        finally:
+            threadlocal.set_manager(old_manager)
+
     def test_begin_with_request(self):
         from pyramid.config import Configurator
 
@@ -486,6 +510,17 @@ class ConfiguratorTests(unittest.TestCase):
         reg._clear_view_lookup_cache()
         self.assertEqual(reg._view_lookup_cache, {})
 
+    def test__fix_registry_clear_view_lookup_cache_clears_miss_cache(self):
+        from pyramid.util import LRUCache
+
+        reg = DummyRegistry()
+        reg.view_lookup_miss_cache = LRUCache(10)
+        reg.view_lookup_miss_cache.put(1, True)
+        config = self._makeOne(reg)
+        config._fix_registry()
+        reg._clear_view_lookup_cache()
+        self.assertEqual(len(reg.view_lookup_miss_cache), 0)
+
     def test_setup_registry_calls_fix_registry(self):
         reg = DummyRegistry()
         config = self._makeOne(reg)
@@ -583,6 +618,18 @@ class ConfiguratorTests(unittest.TestCase):
         self.assertEqual(settings['debug_authorization'], False)
         self.assertEqual(settings['mysetting'], True)
 
+    def test_setup_registry_view_lookup_miss_cache(self):
+        from pyramid.registry import Registry
+
+        reg = Registry()
+        config = self._makeOne(reg)
+        config.setup_registry()
+        self.assertEqual(reg.view_lookup_miss_cache, None)
+        config.setup_registry(
+            settings={'pyramid.view_lookup_miss_cache_size': '100'}
+        )
+        self.assertEqual(reg.view_lookup_miss_cache.maxsize, 100)
+
     def test_setup_registry_debug_logger_None_default(self):
         from pyramid.interfaces import IDebugLogger
         from pyramid.registry import Registry
@@ -851,6 +898,104 @@ test_config.dummy_include2"""
         self.assertTrue(IApplicationCreated.providedBy(subscriber[0]))
         pyramid.config.global_registries.empty()
 
+    def test_make_asgi_app(self):
+        from pyramid.asgi import ASGIApplication
+        import pyramid.config
+        from pyramid.router import Router
+
+        executor = object()
+        config = self._makeOne()
+        app = config.make_asgi_app(executor=executor)
+        self.assertEqual(app.__class__, ASGIApplication)
+        self.assertEqual(app.router.__class__, Router)
+        self.assertEqual(app.registry, config.registry)
+        self.assertIs(app.executor, executor)
+        pyramid.config.global_registries.empty()
+
+    def test_make_wsgi_app_frozen(self):
+        import pyramid.config
+        from pyramid.interfaces import IApplicationCreated
+
+        config = self._makeOne()
+        frozen = []
+        config.add_subscriber(
+            lambda event: frozen.append(config.registry.frozen),
+            IApplicationCreated,
+        )
+        app = config.make_wsgi_app(frozen=True)
+        self.assertEqual(frozen, [False])
+        self.assertTrue(app.registry.frozen)
+        pyramid.config.global_registries.empty()
+
+    def test_make_asgi_app_frozen(self):
+        import pyramid.config
+
+        config = self._makeOne()
+        app = config.make_asgi_app(frozen=True)
+        self.assertTrue(app.registry.frozen)
+        pyramid.config.global_registries.empty()
+
+    def test_freeze_commits_and_precomputes_view_lookups(self):
+        from zope.interface import implementedBy
+
+        from pyramid.interfaces import IRequest, IRouteRequest
+        from pyramid.traversal import DefaultRootFactory
+
+        config = self._makeOne(autocommit=False)
+        config.add_route('home', '/')
+        config.add_view(lambda r: 'OK', route_name='home')
+        config.freeze()
+        registry = config.registry
+        self.assertTrue(registry.frozen)
+        request_iface = registry.getUtility(IRouteRequest, name='home')
+        self.assertTrue(
+            (request_iface, implementedBy(DefaultRootFactory), '')
+            in registry._view_lookup_cache
+        )
+        self.assertFalse(
+            (IRequest, implementedBy(DefaultRootFactory), '')
+            in registry._view_lookup_cache
+        )
+
+    def test_freeze_rejects_further_configuration(self):
+        from pyramid.exceptions import ConfigurationError
+
+        config = self._makeOne(autocommit=True)
+        config.freeze()
+        self.assertRaises(
+            ConfigurationError, config.add_view, lambda r: 'OK', name='late'
+        )
+        other = self._makeOne(registry=config.registry)
+        self.assertRaises(ConfigurationError, other.add_route, 'a', '/a')
+
+    def test_freeze_serves_requests(self):
+        from webob import Request
+
+        import pyramid.config
+        from pyramid.response import Response
+
+        class Root:
+            def __init__(self, request):
+                pass
+
+        class Leaf:
+            pass
+
+        config = self._makeOne(root_factory=Root, autocommit=True)
+        config.add_route('home', '/home')
+        config.add_view(lambda r: Response('home'), route_name='home')
+        config.add_view(lambda r: Response('root'), context=Root)
+        config.add_view(lambda r: Response('leaf'), context=Leaf, name='leaf')
+        app = config.make_wsgi_app(frozen=True)
+        cached = dict(app.registry._view_lookup_cache)
+        self.assertEqual(
+            Request.blank('/home').get_response(app).body, b'home'
+        )
+        self.assertEqual(Request.blank('/').get_response(app).body, b'root')
+        self.assertEqual(Request.blank('/x').get_response(app).status_int, 404)
+        self.assertEqual(app.registry._view_lookup_cache, cached)
+        pyramid.config.global_registries.empty()
+
     def test_include_with_dotted_name(self):
         from tests import test_config
 
@@ -34,6 +34,12 @@ class RoutesConfiguratorMixinTests(unittest.TestCase):
         config = self._makeOne()
         mapper = config.get_routes_mapper()
         self.assertEqual(mapper.routelist, [])
+        self.assertFalse(mapper.compiled)
+
+    def test_get_routes_mapper_compiled(self):
+        config = self._makeOne(settings={'pyramid.compile_routes': 'true'})
+        mapper = config.get_routes_mapper()
+        self.assertTrue(mapper.compiled)
 
     def test_get_routes_mapper_already_registered(self):
         from pyramid.interfaces import IRoutesMapper
@@ -47,7 +53,8 @@ class RoutesConfiguratorMixinTests(unittest.TestCase):
     def test_add_route_defaults(self):
         config = self._makeOne(autocommit=True)
         config.add_route('name', 'path')
-        self._assertRoute(config, 'name', 'path')
+        route = self._assertRoute(config, 'name', 'path')
+        self.assertEqual(route.request_iface.getName(), 'name_IRequest')
 
     def test_add_route_with_route_prefix(self):
         config = self._makeOne(autocommit=True)
@@ -176,6 +176,44 @@ class TestSettings(unittest.TestCase):
         self.assertEqual(result['prevent_cachebust'], True)
         self.assertEqual(result['pyramid.prevent_cachebust'], True)
 
+    def test_compile_routes(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['compile_routes'], False)
+        self.assertEqual(settings['pyramid.compile_routes'], False)
+        result = self._makeOne({'compile_routes': 't'})
+        self.assertEqual(result['compile_routes'], True)
+        self.assertEqual(result['pyramid.compile_routes'], True)
+        result = self._makeOne({'pyramid.compile_routes': '1'})
+        self.assertEqual(result['compile_routes'], True)
+        self.assertEqual(result['pyramid.compile_routes'], True)
+        result = self._makeOne({}, {'PYRAMID_COMPILE_ROUTES': '1'})
+        self.assertEqual(result['compile_routes'], True)
+        self.assertEqual(result['pyramid.compile_routes'], True)
+
+    def test_use_contextvars(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['use_contextvars'], False)
+        self.assertEqual(settings['pyramid.use_contextvars'], False)
+        result = self._makeOne({'use_contextvars': 't'})
+        self.assertEqual(result['use_contextvars'], True)
+        self.assertEqual(result['pyramid.use_contextvars'], True)
+        result = self._makeOne({}, {'PYRAMID_USE_CONTEXTVARS': '1'})
+        self.assertEqual(result['use_contextvars'], True)
+        self.assertEqual(result['pyramid.use_contextvars'], True)
+
+    def test_view_lookup_miss_cache_size(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['view_lookup_miss_cache_size'], 0)
+        self.assertEqual(settings['pyramid.view_lookup_miss_cache_size'], 0)
+        result = self._makeOne({'view_lookup_miss_cache_size': '10'})
+        self.assertEqual(result['view_lookup_miss_cache_size'], 10)
+        self.assertEqual(result['pyramid.view_lookup_miss_cache_size'], 10)
+        result = self._makeOne(
+            {}, {'PYRAMID_VIEW_LOOKUP_MISS_CACHE_SIZE': '20'}
+        )
+        self.assertEqual(result['view_lookup_miss_cache_size'], 20)
+        self.assertEqual(result['pyramid.view_lookup_miss_cache_size'], 20)
+
     def test_reload_templates(self):
         settings = self._makeOne({})
         self.assertEqual(settings['reload_templates'], False)
@@ -1678,6 +1678,28 @@ class TestViewsConfigurationMixin(unittest.TestCase):
         self.assertEqual(wrapper_exc_view, wrapper)
         self.assertEqual(wrapper_exc_view(None, None), 'OK')
 
+    def test_add_view_attrs_set_on_deriver_wrapper(self):
+        from pyramid.config.predicates import DEFAULT_PHASH
+        from pyramid.renderers import null_renderer
+
+        def view(context, request):
+            return 'OK'
+
+        config = self._makeOne(autocommit=True)
+        config.add_view(
+            view=view,
+            request_method='POST',
+            accept='text/html',
+            renderer=null_renderer,
+        )
+        wrapper = self._getViewCallable(config)
+        # the predicate wrapper carries the attributes, without a wrapper
+        # of its own
+        self.assertIs(wrapper.__wraps__, wrapper.__predicated_view__)
+        self.assertEqual(wrapper.__accept__, 'text/html')
+        self.assertNotEqual(wrapper.__phash__, DEFAULT_PHASH)
+        self.assertFalse(hasattr(view, '__accept__'))
+
     def test_add_view_with_request_method_true(self):
         from pyramid.renderers import null_renderer
 
@@ -3335,6 +3357,51 @@ class TestMultiView(unittest.TestCase):
         mv.views = [(99, lambda *arg: None)]
         self.assertEqual(mv.get_views(request), mv.views)
 
+    def test_get_views_caches_negotiation_per_accept_header(self):
+        from pyramid.request import Request
+
+        mv = self._makeOne()
+        html, json = lambda *arg: None, lambda *arg: None
+        mv.add(html, 100, accept='text/html')
+        mv.add(json, 100, accept='application/json')
+        mv.views = [(99, lambda *arg: None, None)]
+        html_first = 'text/html,application/json;q=0.5'
+        for _ in range(3):
+            request = Request.blank('/', headers={'Accept': html_first})
+            self.assertEqual(
+                [view for _, view, _ in mv.get_views(request)],
+                [html, json, mv.views[0][1]],
+            )
+            request = Request.blank('/', headers={'Accept': 'image/png'})
+            self.assertEqual(mv.get_views(request), mv.views)
+        self.assertEqual(mv.accept_cache.misses, 2)
+        self.assertEqual(mv.accept_cache.hits, 4)
+
+    def test_get_views_accept_cache_cleared_by_add(self):
+        from pyramid.request import Request
+
+        mv = self._makeOne()
+        html, json = lambda *arg: None, lambda *arg: None
+        mv.add(html, 100, accept='text/html')
+        request = Request.blank('/', headers={'Accept': 'application/json'})
+        self.assertEqual(mv.get_views(request), [])
+        mv.add(json, 100, accept='application/json')
+        self.assertEqual(mv.get_views(request), [(100, json, None)])
+
+    def test_get_views_accept_cache_is_bounded(self):
+        from pyramid.config.views import ACCEPT_CACHE_SIZE
+        from pyramid.request import Request
+
+        mv = self._makeOne()
+        mv.add(lambda *arg: None, 100, accept='text/html')
+        for i in range(ACCEPT_CACHE_SIZE + 10):
+            request = Request.blank(
+                '/', headers={'Accept': 'text/html;level=%d' % i}
+            )
+            mv.get_views(request)
+        self.assertEqual(len(mv.accept_cache), ACCEPT_CACHE_SIZE)
+        self.assertEqual(mv.accept_cache.evictions, 10)
+
     def test_match_not_found(self):
         from pyramid.httpexceptions import HTTPNotFound
 
@@ -3533,6 +3600,161 @@ class TestMultiView(unittest.TestCase):
         response = mv(context, request)
         self.assertEqual(response, expected_response)
 
+    def _makePredicatedView(self, response, request_method=None, xhr=None):
+        from pyramid.predicates import RequestMethodPredicate, XHRPredicate
+
+        preds = []
+        if request_method is not None:
+            preds.append(RequestMethodPredicate(request_method, None))
+        if xhr is not None:
+            preds.append(XHRPredicate(xhr, None))
+
+        def inner(context, request):
+            return response
+
+        def view(context, request):  # pragma: no cover
+            raise AssertionError('predicates checked twice')
+
+        view.__predicated__ = lambda context, request: all(
+            pred(context, request) for pred in preds
+        )
+        view.__predicates__ = preds
+        view.__predicated_view__ = inner
+        return view
+
+    def test___call__dispatches_on_request_method_and_xhr(self):
+        mv = self._makeOne()
+        get, post, post_xhr = DummyResponse(), DummyResponse(), DummyResponse()
+        mv.views = [
+            (100, self._makePredicatedView(post_xhr, 'POST', True), None),
+            (100, self._makePredicatedView(get, 'GET'), None),
+            (100, self._makePredicatedView(post, 'POST', False), None),
+        ]
+        request = DummyRequest()
+        request.method = 'POST'
+        request.is_xhr = False
+        self.assertIs(mv(None, request), post)
+        request.is_xhr = True
+        self.assertIs(mv(None, request), post_xhr)
+        request.method = 'HEAD'
+        self.assertIs(mv(None, request), get)
+        self.assertIs(mv.match(None, request), mv.views[1][1])
+
+    def test___call__unknown_request_method_shares_index_entry(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        response = DummyResponse()
+        mv.views = [
+            (100, self._makePredicatedView(None, 'GET'), None),
+            (100, self._makePredicatedView(response), None),
+        ]
+        request = DummyRequest()
+        request.method = 'GET'
+        self.assertIs(mv(None, request), None)
+        entries = len(mv._dispatch)
+        for method in ('FOO', 'BAR', 'BAZ'):
+            request.method = method
+            self.assertIs(mv(None, request), response)
+        self.assertEqual(len(mv._dispatch), entries + 1)
+        mv.views = [(100, self._makePredicatedView(None, 'GET'), None)]
+        self.assertRaises(PredicateMismatch, mv, None, request)
+
+    def test___call__rebuilds_index_after_add(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        first, second = DummyResponse(), DummyResponse()
+        request = DummyRequest()
+        request.method = 'GET'
+        mv.add(self._makePredicatedView(first, 'POST'), 100)
+        self.assertRaises(PredicateMismatch, mv, None, request)
+        mv.add(self._makePredicatedView(second, 'GET'), 100)
+        self.assertIs(mv(None, request), second)
+
+    def test___call__custom_predicates_checked_in_order(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        response = DummyResponse()
+        view = self._makePredicatedView(response, 'GET')
+        calls = []
+
+        def custom(context, request):
+            calls.append(request)
+            return request.params.get('ok')
+
+        view.__predicates__.append(custom)
+        mv.views = [(100, view, None)]
+        request = DummyRequest()
+        request.method = 'GET'
+        self.assertRaises(PredicateMismatch, mv, None, request)
+        request.params['ok'] = True
+        self.assertIs(mv(None, request), response)
+        self.assertEqual(len(calls), 2)
+        request.method = 'POST'
+        self.assertRaises(PredicateMismatch, mv, None, request)
+        self.assertEqual(len(calls), 2)
+
+    def test_add_view_selects_same_view_as_sequential_trial(self):
+        from zope.interface import Interface
+
+        from pyramid.interfaces import IMultiView, IViewClassifier
+        from pyramid.request import Request
+
+        config = testing.setUp(autocommit=True)
+        try:
+
+            def make(result):
+                def view(request):
+                    return result
+
+                return view
+
+            expected = {}
+            for accept in ('application/json', 'text/html'):
+                for xhr in (True, False):
+                    for method in ('GET', 'POST', 'PUT'):
+                        result = DummyResponse()
+                        expected[(accept, xhr, method)] = result
+                        config.add_view(
+                            make(result),
+                            request_method=method,
+                            xhr=xhr,
+                            accept=accept,
+                        )
+            mv = config.registry.adapters.lookup(
+                (IViewClassifier, IRequest, Interface), IMultiView, name=''
+            )
+            for (accept, xhr, method), result in expected.items():
+                headers = {'Accept': accept}
+                if xhr:
+                    headers['X-Requested-With'] = 'XMLHttpRequest'
+                request = Request.blank('/', method=method, headers=headers)
+                self.assertIs(mv(None, request), result)
+        finally:
+            testing.tearDown()
+
+    def test___call__opaque_predicates_tried_sequentially(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        response = DummyResponse()
+
+        def view1(context, request):
+            raise PredicateMismatch
+
+        view1.__predicated__ = lambda *arg: False
+
+        def view2(context, request):
+            return response
+
+        view2.__predicated__ = lambda *arg: True
+        mv.views = [(100, view1, None), (99, view2, None)]
+        request = DummyRequest()
+        self.assertIs(mv(None, request), response)
+        self.assertIs(mv.match(None, request), view2)
+
 
 class TestDefaultViewMapper(unittest.TestCase):
     def setUp(self):
@@ -3908,6 +4130,52 @@ class TestStaticURLInfo(unittest.TestCase):
         result = inst.generate('package:path/', request)
         self.assertEqual(result, 'http://example.com/foo/')
 
+    def test_generate_first_registration_wins(self):
+        inst = self._makeOne()
+        inst.registrations = [
+            ('http://example.com/foo/', 'package:path/', None),
+            ('http://example.com/bar/', 'package:path/sub/', None),
+            ('http://example.com/baz/', 'package:path/', None),
+        ]
+        request = self._makeRequest()
+        result = inst.generate('package:path/sub/abc', request)
+        self.assertEqual(result, 'http://example.com/foo/sub/abc')
+
+    def test_generate_index_updated_by_add(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(config, 'http://example.com/foo', 'package:path/sub')
+        request = self._makeRequest()
+        result = inst.generate('package:path/sub/abc', request)
+        self.assertEqual(result, 'http://example.com/foo/abc')
+        inst.add(config, 'http://example.com/foo', 'package:path')
+        result = inst.generate('package:path/sub/abc', request)
+        self.assertEqual(result, 'http://example.com/foo/sub/abc')
+        inst.registrations = [('http://example.com/', 'other:path/', None)]
+        self.assertRaises(
+            ValueError, inst.generate, 'package:path/sub/abc', request
+        )
+
+    def test_generate_protocol_relative_url(self):
+        inst = self._makeOne()
+        inst.registrations = [('//example.com/foo/', 'package:path/', None)]
+        request = self._makeRequest()
+        request.scheme = 'https'
+        result = inst.generate('package:path/abc', request)
+        self.assertEqual(result, 'https://example.com/foo/abc')
+        request.scheme = 'http'
+        result = inst.generate('package:path/abc', request)
+        self.assertEqual(result, 'http://example.com/foo/abc')
+
+    def test_generate_url_joined(self):
+        inst = self._makeOne()
+        inst.registrations = [
+            ('http://example.com/foo/', 'package:path/', None)
+        ]
+        request = self._makeRequest()
+        result = inst.generate('package:path/a//b/../c', request)
+        self.assertEqual(result, 'http://example.com/foo/a/c')
+
     def test_generate_quoting(self):
         from pyramid.interfaces import IStaticURLInfo
 
@@ -4135,6 +4403,26 @@ class TestStaticURLInfo(unittest.TestCase):
         self.assertEqual(config.view_kw['permission'], NO_PERMISSION_REQUIRED)
         self.assertEqual(config.view_kw['view'].__class__, static_view)
 
+    def test_add_viewname_with_static_view_options(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(
+            config,
+            'view',
+            'anotherpackage:path',
+            metadata_index=True,
+            memory_cache_size=1000,
+            memory_cache_max_file_size=10,
+            hashed_names=True,
+        )
+        view = config.view_kw['view']
+        self.assertEqual(view.metadata, {})
+        self.assertEqual(view.memory_cache.maxsize, 1000)
+        self.assertEqual(view.memory_cache_max_file_size, 10)
+        self.assertTrue(view.hashed_names)
+        self.assertNotIn('memory_cache_size', config.route_kw)
+        self.assertNotIn('hashed_names', config.route_kw)
+
     def test_add_viewname_with_route_prefix(self):
         config = DummyConfig()
         config.route_prefix = '/abc'
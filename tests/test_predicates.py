@@ -314,6 +314,51 @@ class TestTraversePredicate(unittest.TestCase):
         self.assertEqual(inst.phash(), '')
 
 
+class TestAcceptPredicate(unittest.TestCase):
+    def _makeOne(self, val):
+        from pyramid.predicates import AcceptPredicate
+
+        return AcceptPredicate(val, None)
+
+    def _makeRequest(self, accept=None):
+        from pyramid.request import Request
+
+        headers = {}
+        if accept is not None:
+            headers['Accept'] = accept
+        return Request.blank('/', headers=headers)
+
+    def test___call___true(self):
+        inst = self._makeOne(['text/html', 'application/json'])
+        self.assertTrue(inst(None, self._makeRequest('application/json')))
+        self.assertTrue(inst(None, self._makeRequest()))
+
+    def test___call___false(self):
+        inst = self._makeOne('text/html')
+        self.assertFalse(inst(None, self._makeRequest('application/json')))
+
+    def test___call___caches_per_header(self):
+        inst = self._makeOne('text/html')
+        for _ in range(3):
+            self.assertTrue(inst(None, self._makeRequest('text/*')))
+            self.assertFalse(inst(None, self._makeRequest('image/png')))
+        self.assertEqual(inst.cache.misses, 2)
+        self.assertEqual(inst.cache.hits, 4)
+
+    def test___call___accept_set_directly_not_cached(self):
+        inst = self._makeOne('text/html')
+        request = Dummy()
+        request.accept = DummyAccept(['text/html'])
+        self.assertTrue(inst(None, request))
+        request.accept = DummyAccept([])
+        self.assertFalse(inst(None, request))
+        self.assertEqual(len(inst.cache), 0)
+
+    def test_text(self):
+        inst = self._makeOne(('text/html', 'text/plain'))
+        self.assertEqual(inst.text(), 'accept = text/html, text/plain')
+
+
 class TestHeaderPredicate(unittest.TestCase):
     def _makeOne(self, val):
         from pyramid.predicates import HeaderPredicate
@@ -549,6 +594,14 @@ class Dummy:
     pass
 
 
+class DummyAccept:
+    def __init__(self, acceptable):
+        self.acceptable = acceptable
+
+    def acceptable_offers(self, offers):
+        return [(offer, 1.0) for offer in offers if offer in self.acceptable]
+
+
 class DummyPredicate:
     def __init__(self, result):
         self.result = result
@@ -25,6 +25,15 @@ class TestRegistry(unittest.TestCase):
         registry._clear_view_lookup_cache()
         self.assertEqual(registry._view_lookup_cache, {})
 
+    def test_clear_view_cache_lookup_clears_miss_cache(self):
+        from pyramid.util import LRUCache
+
+        registry = self._makeOne()
+        registry.view_lookup_miss_cache = LRUCache(10)
+        registry.view_lookup_miss_cache.put(1, True)
+        registry._clear_view_lookup_cache()
+        self.assertEqual(len(registry.view_lookup_miss_cache), 0)
+
     def test_package_name(self):
         package_name = 'testing'
         registry = self._makeOne(package_name)
@@ -1,3 +1,4 @@
+import json
 import unittest
 
 from pyramid import testing
@@ -104,6 +105,287 @@ class TestJSON(unittest.TestCase):
         renderer = self._makeOne()(None)
         self.assertRaises(TypeError, renderer, objects, {})
 
+    def test_binary(self):
+        renderer = self._makeOne(binary=True)(None)
+        result = renderer({'a': '\u00e9'}, {})
+        self.assertEqual(result, b'{"a": "\\u00e9"}')
+
+    def test_binary_ensure_ascii_False(self):
+        renderer = self._makeOne(binary=True, ensure_ascii=False)(None)
+        result = renderer({'a': '\u00e9'}, {})
+        self.assertEqual(result, '{"a": "\u00e9"}'.encode('utf-8'))
+
+    def test_with_bytes_serializer(self):
+        def serializer(obj, **kw):
+            return b'foo'
+
+        request = testing.DummyRequest()
+        renderer = self._makeOne(serializer=serializer)(None)
+        result = renderer({'a': 1}, {'request': request})
+        self.assertEqual(result, b'foo')
+        self.assertEqual(request.response.content_type, 'application/json')
+
+    def test_adapter_cached_per_class(self):
+        from datetime import date
+
+        lookups = []
+
+        def adapter(obj, req):
+            lookups.append(obj)
+            return obj.isoformat()
+
+        renderer = self._makeOne(adapters=((date, adapter),))
+        render = renderer(None)
+        days = [date(2020, 1, 1), date(2020, 1, 2)]
+        result = render(days, {})
+        self.assertEqual(result, '["2020-01-01", "2020-01-02"]')
+        self.assertEqual(lookups, days)
+        self.assertIs(renderer._adapter_cache[date], adapter)
+
+        def adapter2(obj, req):
+            return 'other'
+
+        renderer.add_adapter(date, adapter2)
+        self.assertEqual(renderer._adapter_cache, {})
+        self.assertEqual(render(days, {}), '["other", "other"]')
+
+    def test___json___cached_per_class(self):
+        class MyObject:
+            def __json__(self, req):
+                return 1
+
+        renderer = self._makeOne()
+        result = renderer(None)([MyObject(), MyObject()], {})
+        self.assertEqual(result, '[1, 1]')
+        self.assertIn(MyObject, renderer._adapter_cache)
+
+    def test_instance___json___not_cached(self):
+        class MyObject:
+            pass
+
+        obj = MyObject()
+        obj.__json__ = lambda req: 1
+        renderer = self._makeOne()
+        result = renderer(None)([obj], {})
+        self.assertEqual(result, '[1]')
+        self.assertEqual(renderer._adapter_cache, {})
+        self.assertRaises(TypeError, renderer(None), [MyObject()], {})
+
+    def test_directly_provided_adapter_not_cached(self):
+        from zope.interface import Interface, alsoProvides
+
+        class IFoo(Interface):
+            pass
+
+        class MyObject:
+            pass
+
+        obj = MyObject()
+        alsoProvides(obj, IFoo)
+        renderer = self._makeOne(adapters=((IFoo, lambda o, r: 'foo'),))
+        result = renderer(None)([obj], {})
+        self.assertEqual(result, '["foo"]')
+        self.assertEqual(renderer._adapter_cache, {})
+        self.assertRaises(TypeError, renderer(None), [MyObject()], {})
+
+    def test_instance___json___with_class_adapter_cached(self):
+        class MyObject:
+            pass
+
+        renderer = self._makeOne(adapters=((MyObject, lambda o, r: 'plain'),))
+        render = renderer(None)
+        self.assertEqual(render([MyObject()], {}), '["plain"]')
+        self.assertIn(MyObject, renderer._adapter_cache)
+        obj = MyObject()
+        obj.__json__ = lambda req: 'instance'
+        self.assertEqual(
+            render([obj, MyObject()], {}), '["instance", "plain"]'
+        )
+
+    def test_directly_provided_with_class_adapter_cached(self):
+        from zope.interface import Interface, alsoProvides
+
+        class IFoo(Interface):
+            pass
+
+        class MyObject:
+            pass
+
+        renderer = self._makeOne(
+            adapters=(
+                (MyObject, lambda o, r: 'plain'),
+                (IFoo, lambda o, r: 'fancy'),
+            )
+        )
+        render = renderer(None)
+        self.assertEqual(render([MyObject()], {}), '["plain"]')
+        self.assertIn(MyObject, renderer._adapter_cache)
+        obj = MyObject()
+        alsoProvides(obj, IFoo)
+        self.assertEqual(render([obj, MyObject()], {}), '["fancy", "plain"]')
+
+
+class TestStreamingJSON(unittest.TestCase):
+    def setUp(self):
+        self.config = testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def _makeOne(self, **kw):
+        from pyramid.renderers import StreamingJSON
+
+        return StreamingJSON(**kw)
+
+    def _render(self, value, system=None, **kw):
+        renderer = self._makeOne(**kw)(None)
+        return list(renderer(value, system or {}))
+
+    def test_it(self):
+        result = self._render({'a': 1})
+        self.assertEqual(result, [b'{"a": 1}'])
+
+    def test_scalar(self):
+        self.assertEqual(self._render(5), [b'5'])
+
+    def test_generator(self):
+        result = self._render(i for i in range(3))
+        self.assertEqual(result, [b'[0, 1, 2]'])
+
+    def test_empty_iterator(self):
+        self.assertEqual(self._render(iter(())), [b'[]'])
+
+    def test_many_items(self):
+        result = b''.join(self._render(iter(range(250))))
+        self.assertEqual(json.loads(result), list(range(250)))
+
+    def test_dict_containing_iterators(self):
+        value = {
+            'count': 2,
+            1: {'rows': iter([{'x': iter([1, 2])}, 'b'])},
+            None: [iter([3])],
+        }
+        result = b''.join(self._render(value))
+        self.assertEqual(
+            result,
+            b'{"count": 2, "1": {"rows": [{"x": [1, 2]}, "b"]}, '
+            b'"null": [[3]]}',
+        )
+
+    def test_chunk_size(self):
+        result = self._render(iter(['abcdef'] * 300), chunk_size=1000)
+        self.assertEqual(len(result), 3)
+        self.assertTrue(all(len(chunk) >= 1000 for chunk in result[:-1]))
+        self.assertEqual(json.loads(b''.join(result)), ['abcdef'] * 300)
+
+    def test_lazy(self):
+        consumed = []
+
+        def rows():
+            for i in range(300):
+                consumed.append(i)
+                yield i
+
+        renderer = self._makeOne(chunk_size=20)(None)
+        result = renderer({'rows': rows()}, {})
+        # only the first batch of items was needed for the first chunk
+        self.assertEqual(len(consumed), 100)
+        first = next(result)
+        self.assertTrue(first.startswith(b'{"rows": [0, 1, 2, '))
+        self.assertEqual(len(consumed), 100)
+        body = first + b''.join(result)
+        self.assertEqual(json.loads(body), {'rows': list(range(300))})
+        self.assertEqual(len(consumed), 300)
+
+    def test_first_chunk_errors_raised_by_render(self):
+        renderer = self._makeOne()(None)
+        self.assertRaises(TypeError, renderer, {'a': object()}, {})
+
+    def test_sort_keys_and_separators(self):
+        result = self._render(
+            {'b': iter([1, 2]), 'a': 1},
+            sort_keys=True,
+            separators=(',', ':'),
+        )
+        self.assertEqual(result, [b'{"a":1,"b":[1,2]}'])
+
+    def test_indent(self):
+        result = b''.join(self._render({'a': iter([1, 2])}, indent=2))
+        self.assertEqual(json.loads(result), {'a': [1, 2]})
+
+    def test_with_adapters_and___json__(self):
+        from datetime import date
+
+        request = testing.DummyRequest()
+
+        class MyObject:
+            def __json__(self, req):
+                return req is request
+
+        def adapter(obj, req):
+            return obj.isoformat()
+
+        value = {'rows': iter([MyObject(), date(2020, 1, 1)])}
+        result = self._render(
+            value, {'request': request}, adapters=((date, adapter),)
+        )
+        self.assertEqual(result, [b'{"rows": [true, "2020-01-01"]}'])
+
+    def test_instance_specific_with_class_adapter_cached(self):
+        from zope.interface import Interface, alsoProvides
+
+        class IFoo(Interface):
+            pass
+
+        class MyObject:
+            pass
+
+        renderer = self._makeOne(
+            adapters=(
+                (MyObject, lambda o, r: 'plain'),
+                (IFoo, lambda o, r: 'fancy'),
+            )
+        )(None)
+        fancy = MyObject()
+        alsoProvides(fancy, IFoo)
+        instance = MyObject()
+        instance.__json__ = lambda req: 'instance'
+        value = iter([MyObject(), fancy, instance])
+        result = list(renderer(value, {}))
+        self.assertEqual(result, [b'["plain", "fancy", "instance"]'])
+
+    def test_with_bytes_serializer(self):
+        def serializer(value, **kw):
+            return json.dumps(value, **kw).encode('utf-8')
+
+        result = self._render(
+            {'a': iter(['\u00e9']), 2: 'b'}, serializer=serializer
+        )
+        self.assertEqual(result, [b'{"a": ["\\u00e9"], "2": "b"}'])
+
+    def test_with_request_content_type_notset(self):
+        request = testing.DummyRequest()
+        self._render({'a': 1}, {'request': request})
+        self.assertEqual(request.response.content_type, 'application/json')
+
+    def test_with_request_content_type_set(self):
+        request = testing.DummyRequest()
+        request.response.content_type = 'text/mishmash'
+        self._render({'a': 1}, {'request': request})
+        self.assertEqual(request.response.content_type, 'text/mishmash')
+
+    def test_sets_app_iter(self):
+        from pyramid.renderers import RendererHelper
+
+        self.config.add_renderer('jsonstream', self._makeOne())
+        helper = RendererHelper('jsonstream', registry=self.config.registry)
+        request = testing.DummyRequest()
+        response = helper.render_to_response(
+            {'rows': iter([1])}, {}, request=request
+        )
+        self.assertIsNone(response.content_length)
+        self.assertEqual(b''.join(response.app_iter), b'{"rows": [1]}')
+
 
 class Test_string_renderer_factory(unittest.TestCase):
     def _callFUT(self, name):
@@ -275,6 +557,32 @@ class TestRendererHelper(unittest.TestCase):
         self.assertEqual(reg.event, {})
         self.assertEqual(reg.event.__class__.__name__, 'BeforeRender')
 
+    def test_render_without_BeforeRender_subscribers(self):
+        from pyramid.events import NewRequest
+
+        self._registerRendererFactory()
+        events = []
+        self.config.add_subscriber(events.append, NewRequest)
+        helper = self._makeOne('loo.foo')
+        system = {'a': 1}
+        result = helper.render('value', system)
+        self.assertEqual(result[0], 'value')
+        self.assertIs(result[1], system)
+        self.assertEqual(events, [])
+
+    def test_render_with_BeforeRender_subscriber(self):
+        from pyramid.events import BeforeRender
+
+        self._registerRendererFactory()
+        events = []
+        self.config.add_subscriber(events.append, BeforeRender)
+        helper = self._makeOne('loo.foo')
+        result = helper.render('value', {'a': 1})
+        self.assertEqual(len(events), 1)
+        self.assertIs(result[1], events[0])
+        self.assertEqual(events[0], {'a': 1})
+        self.assertEqual(events[0].rendering_val, 'value')
+
     def test_render_system_values_is_None(self):
         import pyramid.csrf
 
@@ -712,10 +1020,10 @@ class Test_get_renderer(unittest.TestCase):
 
 
 class TestJSONP(unittest.TestCase):
-    def _makeOne(self, param_name='callback'):
+    def _makeOne(self, param_name='callback', **kw):
         from pyramid.renderers import JSONP
 
-        return JSONP(param_name)
+        return JSONP(param_name, **kw)
 
     def test_render_to_jsonp(self):
         renderer_factory = self._makeOne()
@@ -753,6 +1061,25 @@ class TestJSONP(unittest.TestCase):
         result = renderer({'a': '1'}, {})
         self.assertEqual(result, '{"a": "1"}')
 
+    def test_render_to_jsonp_binary(self):
+        renderer_factory = self._makeOne(binary=True)
+        renderer = renderer_factory(None)
+        request = testing.DummyRequest()
+        request.GET['callback'] = 'callback'
+        result = renderer({'a': '1'}, {'request': request})
+        self.assertEqual(result, b'/**/callback({"a": "1"});')
+        del request.GET['callback']
+        result = renderer({'a': '1'}, {'request': request})
+        self.assertEqual(result, b'{"a": "1"}')
+
+    def test_render_to_jsonp_with_bytes_serializer(self):
+        renderer_factory = self._makeOne(serializer=lambda v, **kw: b'1')
+        renderer = renderer_factory(None)
+        request = testing.DummyRequest()
+        request.GET['callback'] = 'callback'
+        result = renderer({'a': '1'}, {'request': request})
+        self.assertEqual(result, '/**/callback(1);')
+
     def test_render_to_jsonp_invalid_callback(self):
         from pyramid.httpexceptions import HTTPBadRequest
 
@@ -537,6 +537,72 @@ class Test_apply_request_extensions(unittest.TestCase):
         self.assertEqual(request.bar, 'bar')
         self.assertEqual(request.foo('abc'), 'abc')
 
+    def _makeExtensions(self, methods=None, descriptors=None):
+        from pyramid.config.factories import _RequestExtensions
+
+        extensions = _RequestExtensions()
+        extensions.methods.update(methods or {})
+        extensions.descriptors.update(descriptors or {})
+        return extensions
+
+    def test_it_caches_request_class(self):
+        extensions = self._makeExtensions(
+            methods={'foo': lambda x, y: y},
+            descriptors={'bar': property(lambda x: 'bar')},
+        )
+        request1 = DummyRequest()
+        request2 = DummyRequest()
+        self._callFUT(request1, extensions=extensions)
+        self._callFUT(request2, extensions=extensions)
+        self.assertIs(request1.__class__, request2.__class__)
+        self.assertTrue(issubclass(request1.__class__, DummyRequest))
+        self.assertNotIn('foo', request1.__dict__)
+        self.assertEqual(request1.bar, 'bar')
+        self.assertEqual(request1.foo('abc'), 'abc')
+        self.assertEqual(request2.foo('def'), 'def')
+
+    def test_it_reapplied_to_extended_request(self):
+        extensions = self._makeExtensions(methods={'foo': lambda x, y: y})
+        request = DummyRequest()
+        self._callFUT(request, extensions=extensions)
+        cls = request.__class__
+        self._callFUT(request, extensions=extensions)
+        self.assertIs(request.__class__, cls)
+
+    def test_it_empty_extensions_keeps_class(self):
+        extensions = self._makeExtensions()
+        request = DummyRequest()
+        self._callFUT(request, extensions=extensions)
+        self.assertIs(request.__class__, DummyRequest)
+
+    def test_it_cached_class_provides_request_interfaces(self):
+        from pyramid.interfaces import IRequest
+        from pyramid.request import Request
+
+        extensions = self._makeExtensions(
+            descriptors={'bar': property(lambda x: 'bar')}
+        )
+        request = Request.blank('/')
+        self._callFUT(request, extensions=extensions)
+        self.assertTrue(IRequest.providedBy(request))
+        self.assertIs(
+            request.__class__.__dict__['__implemented__'],
+            Request.__implemented__,
+        )
+
+    def test_it_with_add_request_method_invalidates_cache(self):
+        from pyramid.interfaces import IRequestExtensions
+
+        self.config.add_request_method(lambda r: 'foo', name='foo')
+        extensions = self.config.registry.getUtility(IRequestExtensions)
+        request = DummyRequest()
+        self._callFUT(request, extensions=extensions)
+        self.config.add_request_method(lambda r: 'bar', name='bar', reify=True)
+        request = DummyRequest()
+        self._callFUT(request, extensions=extensions)
+        self.assertEqual(request.foo(), 'foo')
+        self.assertEqual(request.bar, 'bar')
+
 
 class Test_subclassing_Request(unittest.TestCase):
     def test_subclass(self):
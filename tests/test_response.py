@@ -90,9 +90,123 @@ class TestFileResponse(unittest.TestCase):
             r = self._makeOne(path)
             self.assertEqual(r.content_type, 'foo/bar')
             self.assertEqual(type(r.content_type), str)
+            r.app_iter.close()
         finally:
             response.mimetypes = old_mimetypes
 
+    def _get(self, path, method='GET', **headers):
+        from webob import Request
+
+        request = Request.blank('/', method=method, headers=headers)
+        r = self._makeOne(path, request=request)
+        response = request.get_response(r)
+        return r, response
+
+    def test_file_opened_before_sent(self):
+        from webob import Request
+
+        request = Request.blank('/')
+        r = self._makeOne(self._getPath(), request=request)
+        self.assertFalse(r.app_iter.file.closed)
+        response = request.get_response(r)
+        self.assertEqual(response.body, b'Hello.\n')
+        self.assertTrue(r.app_iter.file.closed)
+
+    def test_unreadable_file_raises_before_sent(self):
+        from webob import Request
+
+        path = os.path.dirname(self._getPath())
+        request = Request.blank('/')
+        self.assertRaises(OSError, self._makeOne, path, request=request)
+
+    def test_HEAD_does_not_open_file(self):
+        r, response = self._get(self._getPath(), method='HEAD')
+        self.assertEqual(response.content_length, 7)
+        self.assertEqual(response.body, b'')
+        self.assertNotIn('file', r.app_iter.__dict__)
+
+    def test_HEAD_range(self):
+        r, response = self._get(
+            self._getPath(), method='HEAD', Range='bytes=1-3'
+        )
+        self.assertEqual(response.status_int, 206)
+        self.assertEqual(response.content_length, 3)
+        self.assertEqual(response.body, b'')
+        self.assertTrue(r.app_iter.file.closed)
+
+    def test_HEAD_with_wsgi_file_wrapper_does_not_open_file(self):
+        from webob import Request
+
+        request = Request.blank('/', method='HEAD')
+        request.environ['wsgi.file_wrapper'] = DummyFileWrapper
+        r = self._makeOne(self._getPath(), request=request)
+        self.assertNotIsInstance(r.app_iter, DummyFileWrapper)
+        request.get_response(r)
+        self.assertNotIn('file', r.app_iter.__dict__)
+
+    def test_not_modified(self):
+        path = self._getPath()
+        r, response = self._get(
+            path,
+            If_Modified_Since=_http_date(os.path.getmtime(path) + 1),
+        )
+        self.assertEqual(response.status_int, 304)
+        self.assertEqual(response.body, b'')
+
+    def test_range(self):
+        r, response = self._get(self._getPath(), Range='bytes=1-3')
+        self.assertEqual(response.status_int, 206)
+        self.assertEqual(response.content_range.start, 1)
+        self.assertEqual(response.content_range.stop, 4)
+        self.assertEqual(response.body, b'ell')
+
+    def test_range_open_ended(self):
+        r, response = self._get(self._getPath(), Range='bytes=4-')
+        self.assertEqual(response.status_int, 206)
+        self.assertEqual(response.body, b'o.\n')
+
+    def test_range_suffix(self):
+        r, response = self._get(self._getPath(), Range='bytes=-2')
+        self.assertEqual(response.status_int, 206)
+        self.assertEqual(response.body, b'.\n')
+
+    def test_range_not_satisfiable(self):
+        r, response = self._get(self._getPath(), Range='bytes=100-')
+        self.assertEqual(response.status_int, 416)
+
+    def test_range_If_Range_matches(self):
+        path = self._getPath()
+        r, response = self._get(
+            path,
+            Range='bytes=0-1',
+            If_Range=_http_date(os.path.getmtime(path)),
+        )
+        self.assertEqual(response.status_int, 206)
+        self.assertEqual(response.body, b'He')
+
+    def test_range_If_Range_does_not_match(self):
+        path = self._getPath()
+        r, response = self._get(
+            path,
+            Range='bytes=0-1',
+            If_Range=_http_date(os.path.getmtime(path) - 3600),
+        )
+        self.assertEqual(response.status_int, 200)
+        self.assertEqual(response.body, b'Hello.\n')
+
+    def test_range_with_wsgi_file_wrapper(self):
+        from webob import Request
+
+        request = Request.blank('/', headers={'Range': 'bytes=2-4'})
+        request.environ['wsgi.file_wrapper'] = DummyFileWrapper
+        r = self._makeOne(self._getPath(), request=request)
+        wrapper = r.app_iter
+        self.assertIsInstance(wrapper, DummyFileWrapper)
+        response = request.get_response(r)
+        self.assertEqual(response.status_int, 206)
+        self.assertEqual(response.body, b'llo')
+        self.assertTrue(wrapper.file.closed)
+
 
 class TestFileIter(unittest.TestCase):
     def _makeOne(self, file, block_size):
@@ -121,6 +235,41 @@ class TestFileIter(unittest.TestCase):
         inst.close()
         self.assertTrue(f.closed)
 
+    def test_app_iter_range(self):
+        f = io.BytesIO(b'abcdefgh')
+        inst = self._makeOne(f, 2)
+        result = inst.app_iter_range(1, 6)
+        self.assertIs(result, inst)
+        self.assertEqual(list(result), [b'bc', b'de', b'f'])
+        self.assertEqual(f.tell(), 6)
+
+    def test_app_iter_range_stop_None(self):
+        f = io.BytesIO(b'abcdefgh')
+        inst = self._makeOne(f, 3)
+        result = inst.app_iter_range(5, None)
+        self.assertEqual(list(result), [b'fgh'])
+
+    def test_app_iter_range_empty(self):
+        f = io.BytesIO(b'abcdefgh')
+        inst = self._makeOne(f, 3)
+        self.assertEqual(list(inst.app_iter_range(2, 2)), [])
+
+    def test_app_iter_range_not_seekable(self):
+        class Unseekable:
+            def __init__(self, data):
+                self.f = io.BytesIO(data)
+
+            def read(self, size):
+                return self.f.read(size)
+
+            def close(self):  # pragma: no cover
+                pass
+
+        inst = self._makeOne(Unseekable(b'abcdefgh'), 3)
+        result = inst.app_iter_range(1, 6)
+        self.assertIsNot(result, inst)
+        self.assertEqual(b''.join(result), b'bcdef')
+
 
 class TestResponseAdapter(unittest.TestCase):
     def setUp(self):
@@ -237,3 +386,21 @@ class DummyVenusian:
 
     def attach(self, wrapped, fn, category=None, depth=None):
         self.attached.append((wrapped, fn, category, depth))
+
+
+class DummyFileWrapper:
+    def __init__(self, file, block_size):
+        self.file = file
+        self.block_size = block_size
+
+    def __iter__(self):
+        return iter(lambda: self.file.read(self.block_size), b'')
+
+    def close(self):
+        self.file.close()
+
+
+def _http_date(timestamp):
+    from email.utils import formatdate
+
+    return formatdate(timestamp, usegmt=True)
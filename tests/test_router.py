@@ -813,6 +813,98 @@ class TestRouter(unittest.TestCase):
         )
         self.assertTrue("predicates: 'predicate'" in logger.messages[0])
 
+    def test_call_route_matches_skips_default_traverser(self):
+        from pyramid.interfaces import IViewClassifier
+
+        self._registerRouteRequest('foo')
+        self._connectRoute('foo', 'archives/:action/:article')
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        environ = self._makeEnviron(PATH_INFO='/archives/action1/article1')
+        self._registerView(view, '', IViewClassifier, None, None)
+        rootfactory = self._registerRootFactory(DummyContext())
+        router = self._makeOne()
+        self.assertTrue(router.default_traverser)
+        self._mockFinishRequest(router)
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        request = view.request
+        self.assertEqual(request.root, rootfactory.root)
+        self.assertEqual(request.context, rootfactory.root)
+        self.assertEqual(request.view_name, '')
+        self.assertEqual(request.subpath, ())
+        self.assertEqual(request.traversed, ())
+        self.assertEqual(request.virtual_root, rootfactory.root)
+        self.assertEqual(request.virtual_root_path, ())
+
+    def test_call_route_matches_with_traverse_uses_default_traverser(self):
+        from pyramid.interfaces import IViewClassifier
+
+        self._registerRouteRequest('foo')
+        self._connectRoute('foo', 'archives/*traverse')
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        environ = self._makeEnviron(PATH_INFO='/archives/a/b')
+        self._registerView(view, 'a', IViewClassifier, None, None)
+        context = DummyContext()
+        self._registerRootFactory(context)
+        router = self._makeOne()
+        self._mockFinishRequest(router)
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        request = view.request
+        self.assertEqual(request.context, context)
+        self.assertEqual(request.view_name, 'a')
+        self.assertEqual(request.subpath, ('b',))
+
+    def test_call_route_matches_with_vroot_uses_default_traverser(self):
+        from pyramid.interfaces import IViewClassifier
+
+        self._registerRouteRequest('foo')
+        self._connectRoute('foo', 'archives/:action')
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        environ = self._makeEnviron(
+            PATH_INFO='/archives/action1', HTTP_X_VHM_ROOT='/a'
+        )
+        self._registerView(view, 'a', IViewClassifier, None, None)
+        self._registerRootFactory(DummyContext())
+        router = self._makeOne()
+        self._mockFinishRequest(router)
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        request = view.request
+        self.assertEqual(request.view_name, 'a')
+        self.assertEqual(request.virtual_root_path, ('a',))
+
+    def test_call_route_matches_uses_route_request_iface(self):
+        from zope.interface import Interface
+
+        from pyramid.interfaces import IViewClassifier
+
+        class IFoo(Interface):
+            pass
+
+        route = self._connectRoute('foo', 'archives/:action/:article')
+        route.request_iface = IFoo
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        environ = self._makeEnviron(PATH_INFO='/archives/action1/article1')
+        self._registerView(view, '', IViewClassifier, IFoo, None)
+        self._registerRootFactory(DummyContext())
+        router = self._makeOne()
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        self.assertEqual(view.request.request_iface, IFoo)
+
     def test_call_route_match_miss_debug_routematch(self):
         from pyramid.httpexceptions import HTTPNotFound
 
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from . import dummy
+
+
+class DummyRegistry:
+    def __init__(self, info):
+        self.info = info
+
+    def queryUtility(self, iface, default=None, name=''):
+        from pyramid.interfaces import IStaticURLInfo
+
+        if iface is IStaticURLInfo:
+            return self.info
+        return default
+
+
+class TestPCacheBustCommand(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.static = os.path.join(self.tmpdir, 'static')
+        os.makedirs(os.path.join(self.static, 'css'))
+        self._write('css/main.css', b'body {}')
+        self._write('css/main.css.gz', b'compressed')
+        self._write('app.js', b'app()')
+        self.manifest_path = os.path.join(self.tmpdir, 'manifest.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, name, data):
+        with open(os.path.join(self.static, name), 'wb') as f:
+            f.write(data)
+
+    def _token(self, data):
+        return hashlib.sha256(data).hexdigest()[:16]
+
+    def _getTargetClass(self):
+        from pyramid.scripts.pcachebust import PCacheBustCommand
+
+        return PCacheBustCommand
+
+    def _makeInfo(self, cachebust):
+        from pyramid.config.views import StaticURLInfo
+
+        info = StaticURLInfo()
+        spec = self.static + os.sep
+        info.registrations.append((None, spec, '__static/'))
+        if cachebust is not None:
+            info.cache_busters.append((spec, cachebust, False))
+        return info
+
+    def _makeOne(self, info):
+        cmd = self._getTargetClass()(['pcachebust', 'myapp.ini'])
+        cmd.bootstrap = dummy.DummyBootstrap(registry=DummyRegistry(info))
+        cmd.setup_logging = dummy.dummy_setup_logging()
+        self.out = []
+        cmd.out = self.out.append
+        return cmd
+
+    def test_no_config_uri(self):
+        cmd = self._getTargetClass()(['pcachebust'])
+        L = []
+        cmd.out = L.append
+        self.assertEqual(cmd.run(), 2)
+        self.assertEqual(L, ['Requires a config file argument'])
+
+    def test_no_static_views(self):
+        cmd = self._makeOne(None)
+        self.assertEqual(cmd.run(), 0)
+        self.assertEqual(
+            self.out, ['No content hash cache busters with a manifest found']
+        )
+
+    def test_no_manifest(self):
+        from pyramid.static import ContentHashCacheBuster
+
+        cmd = self._makeOne(self._makeInfo(ContentHashCacheBuster()))
+        self.assertEqual(cmd.run(), 0)
+        self.assertEqual(
+            self.out, ['No content hash cache busters with a manifest found']
+        )
+
+    def test_other_cache_buster(self):
+        from pyramid.static import QueryStringConstantCacheBuster
+
+        info = self._makeInfo(QueryStringConstantCacheBuster('x'))
+        cmd = self._makeOne(info)
+        self.assertEqual(cmd.run(), 0)
+        self.assertEqual(
+            self.out, ['No content hash cache busters with a manifest found']
+        )
+
+    def test_it(self):
+        from pyramid.static import ContentHashCacheBuster
+
+        with open(self.manifest_path, 'w') as f:
+            json.dump({'css/main.css': 'css/main.stale.css'}, f)
+        cachebust = ContentHashCacheBuster(self.manifest_path)
+        info = self._makeInfo(cachebust)
+        # the same cache buster added for a second specification
+        info.cache_busters.append(('myapp:static/', cachebust, False))
+        cmd = self._makeOne(info)
+        self.assertEqual(cmd.run(), 0)
+        self.assertTrue(cmd.bootstrap.closer.called)
+        expected = {
+            'app.js': 'app.%s.js' % self._token(b'app()'),
+            'css/main.css': 'css/main.%s.css' % self._token(b'body {}'),
+        }
+        self.assertEqual(cachebust.paths, expected)
+        with open(self.manifest_path) as f:
+            self.assertEqual(json.load(f), expected)
+        self.assertEqual(
+            self.out, ['2 paths written to %s' % self.manifest_path]
+        )
+
+
+class Test_main(unittest.TestCase):
+    def _callFUT(self, argv):
+        from pyramid.scripts.pcachebust import main
+
+        return main(argv, quiet=True)
+
+    def test_it(self):
+        result = self._callFUT(['pcachebust'])
+        self.assertEqual(result, 2)
@@ -0,0 +1,274 @@
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+
+from . import dummy
+
+
+class DummyExecutor:
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def map(self, fn, *iterables, chunksize=1):
+        return map(fn, *iterables)
+
+
+class DummyStaticURLInfo:
+    def __init__(self, registrations):
+        self.registrations = registrations
+
+
+class DummyRegistry:
+    def __init__(self, info):
+        self.info = info
+
+    def queryUtility(self, iface, default=None):
+        return self.info
+
+
+class TestPCompressCommand(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.static = os.path.join(self.tmpdir, 'static')
+        os.makedirs(os.path.join(self.static, 'css'))
+        self._write('css/main.css', b'body { color: red }\n' * 100)
+        self._write('tiny.txt', b'x')
+        self._write('already.js.gz', b'not compressed again')
+        self._write('logo.png', b'\x89PNG' + b'\x00' * 1000)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, name, data):
+        with open(os.path.join(self.static, name), 'wb') as f:
+            f.write(data)
+
+    def _getTargetClass(self):
+        from pyramid.scripts.pcompress import PCompressCommand
+
+        return PCompressCommand
+
+    def _makeOne(self, *args, registrations=None):
+        if registrations is None:
+            registrations = [(None, self.static + os.sep, '__static/')]
+        registry = DummyRegistry(DummyStaticURLInfo(registrations))
+        cmd = self._getTargetClass()(['pcompress', 'myapp.ini'] + list(args))
+        cmd.bootstrap = dummy.DummyBootstrap(registry=registry)
+        cmd.setup_logging = dummy.dummy_setup_logging()
+        cmd.executor_factory = DummyExecutor
+        self.out = []
+        cmd.out = self.out.append
+        return cmd
+
+    def test_no_config_uri(self):
+        cmd = self._getTargetClass()(['pcompress'])
+        L = []
+        cmd.out = L.append
+        self.assertEqual(cmd.run(), 2)
+        self.assertEqual(L, ['Requires a config file argument'])
+
+    def test_bad_level(self):
+        cmd = self._makeOne('--level', '10')
+        self.assertEqual(cmd.run(), 2)
+
+    def test_no_static_views(self):
+        cmd = self._makeOne()
+        cmd.bootstrap = dummy.DummyBootstrap()
+        self.assertEqual(cmd.run(), 0)
+        self.assertEqual(self.out, ['No static view directories found'])
+
+    def test_url_registrations_ignored(self):
+        cmd = self._makeOne(
+            registrations=[('http://cdn/', self.static + os.sep, None)]
+        )
+        self.assertEqual(cmd.run(), 0)
+        self.assertEqual(self.out, ['No static view directories found'])
+
+    def test_compress(self):
+        self._write('random.bin', os.urandom(300))
+        cmd = self._makeOne()
+        self.assertEqual(cmd.run(), 0)
+        css = os.path.join(self.static, 'css', 'main.css')
+        with open(css + '.gz', 'rb') as f:
+            self.assertEqual(
+                gzip.decompress(f.read()), b'body { color: red }\n' * 100
+            )
+        self.assertEqual(
+            os.stat(css + '.gz').st_mtime_ns, os.stat(css).st_mtime_ns
+        )
+        # not smaller
+        self.assertFalse(
+            os.path.exists(os.path.join(self.static, 'random.bin.gz'))
+        )
+        # too small
+        self.assertFalse(
+            os.path.exists(os.path.join(self.static, 'tiny.txt.gz'))
+        )
+        # compressed files are not compressed again
+        self.assertFalse(
+            os.path.exists(os.path.join(self.static, 'already.js.gz.gz'))
+        )
+        # nor are files in compressed formats
+        self.assertFalse(
+            os.path.exists(os.path.join(self.static, 'logo.png.gz'))
+        )
+        size = os.path.getsize(css + '.gz')
+        self.assertEqual(self.out[0], f'{css}.gz: 2000 -> {size} bytes')
+        self.assertEqual(
+            self.out[1],
+            '1 compressed copies written, 0 up to date, 1 not smaller than '
+            'the original',
+        )
+        self.assertEqual(
+            self.out[2],
+            f'{2000 - size} bytes saved (2000 bytes compressed to {size})',
+        )
+
+    def test_skip_up_to_date(self):
+        self._makeOne().run()
+        cmd = self._makeOne()
+        self.assertEqual(cmd.run(), 0)
+        self.assertEqual(
+            self.out[0],
+            '0 compressed copies written, 1 up to date, 0 not smaller than '
+            'the original',
+        )
+        # a changed file is compressed again
+        css = os.path.join(self.static, 'css', 'main.css')
+        st = os.stat(css)
+        os.utime(css, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        cmd = self._makeOne()
+        cmd.run()
+        self.assertTrue(self.out[0].startswith(css + '.gz: '))
+        self.assertEqual(
+            self.out[1],
+            '1 compressed copies written, 0 up to date, 0 not smaller than '
+            'the original',
+        )
+
+    def _getTasks(self, cmd):
+        encodings = [('gzip', '.gz')]
+        return cmd._get_tasks([self.static], encodings, cmd.args.min_size)
+
+    def test_small_files_skipped(self):
+        tiny = os.path.join(self.static, 'tiny.txt')
+        self._write('empty.keep', b'')
+        self._write('short.txt', b'short text ' * 20)
+        for i in range(2):
+            cmd = self._makeOne()
+            cmd.run()
+            tasks, fresh = self._getTasks(cmd)
+            self.assertEqual(tasks, [])
+            self.assertEqual(fresh, 1)
+        self.assertFalse(os.path.exists(tiny + '.gz'))
+        # unless the minimum size is lowered
+        cmd = self._makeOne('--min-size', '0')
+        tasks, fresh = self._getTasks(cmd)
+        self.assertIn((tiny, 'gzip', '.gz'), tasks)
+
+    def test_stale_copy_of_small_file_removed(self):
+        tiny = os.path.join(self.static, 'tiny.txt')
+        self._write('tiny.txt.gz', b'stale')
+        cmd = self._makeOne()
+        self.assertIn((tiny, 'gzip', '.gz'), self._getTasks(cmd)[0])
+        cmd.run()
+        self.assertFalse(os.path.exists(tiny + '.gz'))
+
+    def test_multiple_encodings(self):
+        cmd = self._makeOne('-e', 'gzip', '-e', 'xz', '-l', '1', '-j', '2')
+        self.assertEqual(cmd.run(), 0)
+        css = os.path.join(self.static, 'css', 'main.css')
+        with open(css + '.xz', 'rb') as f:
+            self.assertEqual(
+                lzma.decompress(f.read()), b'body { color: red }\n' * 100
+            )
+        self.assertTrue(os.path.exists(css + '.gz'))
+        self.assertEqual(
+            self.out[-2],
+            '2 compressed copies written, 0 up to date, 0 not smaller than '
+            'the original',
+        )
+
+
+class Test_is_compressed(unittest.TestCase):
+    def _callFUT(self, filename):
+        from pyramid.scripts.pcompress import is_compressed
+
+        return is_compressed(filename)
+
+    def test_compressed_copy(self):
+        self.assertTrue(self._callFUT('main.css.gz'))
+        self.assertTrue(self._callFUT('main.css.br'))
+
+    def test_compressed_formats(self):
+        for filename in ('a.png', 'a.jpg', 'a.woff2', 'a.mp4', 'a.zip'):
+            self.assertTrue(self._callFUT(filename), filename)
+
+    def test_compressible_formats(self):
+        for filename in (
+            'a.css',
+            'a.js',
+            'a.svg',
+            'a.ttf',
+            'a.html',
+            'LICENSE',
+        ):
+            self.assertFalse(self._callFUT(filename), filename)
+
+
+class Test_compress_file(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'foo.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _callFUT(self, *args):
+        from pyramid.scripts.pcompress import compress_file
+
+        return compress_file(*args)
+
+    def test_removes_stale_copy_not_smaller(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'a')
+        with open(self.path + '.bz2', 'wb') as f:
+            f.write(b'stale')
+        result = self._callFUT(self.path, 'bzip2', '.bz2', 9)
+        self.assertEqual(result, (1, None))
+        self.assertFalse(os.path.exists(self.path + '.bz2'))
+
+    def test_bzip2(self):
+        import bz2
+
+        with open(self.path, 'wb') as f:
+            f.write(b'a' * 1000)
+        size, new_size = self._callFUT(self.path, 'bzip2', '.bz2', 9)
+        self.assertEqual(size, 1000)
+        with open(self.path + '.bz2', 'rb') as f:
+            data = f.read()
+        self.assertEqual(len(data), new_size)
+        self.assertEqual(bz2.decompress(data), b'a' * 1000)
+        self.assertEqual(
+            sorted(os.listdir(self.tmpdir)), ['foo.txt', 'foo.txt.bz2']
+        )
+
+
+class Test_main(unittest.TestCase):
+    def _callFUT(self, argv):
+        from pyramid.scripts.pcompress import main
+
+        return main(argv, quiet=True)
+
+    def test_it(self):
+        result = self._callFUT(['pcompress'])
+        self.assertEqual(result, 2)
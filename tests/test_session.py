@@ -84,6 +84,141 @@ class SharedCookieSessionTests:
             ValueError, self._makeOne, request, timeout='Invalid value'
         )
 
+    def test_cookie_cache_disabled(self):
+        request = testing.DummyRequest()
+        session = self._makeOne(request)
+        self.assertIsNone(session.cookie_cache)
+
+    def test_cookie_cache(self):
+        import time
+
+        cookieval = self._serialize((time.time(), 0, {'state': [1]}))
+        request = testing.DummyRequest()
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, cookie_cache_size=10)
+        cache = session.cookie_cache
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        session['state'].append(2)
+        session = type(session)(request)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(dict(session), {'state': [1]})
+
+    def test_cookie_cache_bad_cookie_not_cached(self):
+        request = testing.DummyRequest()
+        request.cookies['session'] = 'abc'
+        session = self._makeOne(request, cookie_cache_size=10)
+        self.assertEqual(dict(session), {})
+        self.assertEqual(len(session.cookie_cache), 0)
+
+    def test_skip_unchanged_disabled(self):
+        import time
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, reissue_time=None)
+        self.assertEqual(session.pop_flash(), [])
+        self.assertTrue(session._dirty)
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        self.assertEqual(response.headerlist[-1][0], 'Set-Cookie')
+
+    def test_skip_unchanged_unchanged(self):
+        import time
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, reissue_time=120, skip_unchanged=True)
+        self.assertEqual(session.pop_flash(), [])
+        self.assertTrue(session._dirty)
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), False)
+        self.assertNotIn('Set-Cookie', response.headers)
+
+    def test_skip_unchanged_changed(self):
+        import time
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, reissue_time=120, skip_unchanged=True)
+        session['state'] = 2
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        self.assertEqual(response.headerlist[-1][0], 'Set-Cookie')
+
+    def test_skip_unchanged_reissue_due(self):
+        import time
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time() - 200, 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, reissue_time=120, skip_unchanged=True)
+        self.assertEqual(session['state'], 1)
+        self.assertTrue(session._dirty)
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        self.assertEqual(response.headerlist[-1][0], 'Set-Cookie')
+
+    def test_skip_unchanged_no_cookie(self):
+        import webob
+
+        request = testing.DummyRequest()
+        session = self._makeOne(request, skip_unchanged=True)
+        self.assertEqual(session.pop_flash(), [])
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), False)
+        session['state'] = 1
+        self.assertEqual(session._set_cookie(response), True)
+        self.assertEqual(response.headerlist[-1][0], 'Set-Cookie')
+
+    def test_skip_unchanged_expired_cookie(self):
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((0, 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(
+            request, reissue_time=None, skip_unchanged=True
+        )
+        self.assertEqual(session.pop_flash(), [])
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        self.assertEqual(response.headerlist[-1][0], 'Set-Cookie')
+
+    def test_skip_unchanged_expired_cookie_same_content_set_again(self):
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((0, 0, {'userid': 'fred'}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(
+            request, reissue_time=None, skip_unchanged=True
+        )
+        self.assertEqual(dict(session), {})
+        session['userid'] = 'fred'
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        self.assertEqual(response.headerlist[-1][0], 'Set-Cookie')
+
+    def test_skip_unchanged_bad_cookie(self):
+        import webob
+
+        request = testing.DummyRequest()
+        request.cookies['session'] = 'abc'
+        session = self._makeOne(
+            request, reissue_time=None, skip_unchanged=True
+        )
+        self.assertEqual(session.pop_flash(), [])
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        self.assertEqual(response.headerlist[-1][0], 'Set-Cookie')
+
     def test_changed(self):
         request = testing.DummyRequest()
         session = self._makeOne(request)
@@ -354,6 +489,55 @@ class TestBaseCookieSession(SharedCookieSessionTests, unittest.TestCase):
             ValueError, self._makeOne, request, max_age='invalid value'
         )
 
+    def test_cookie_cache_unmarshallable_value(self):
+        import time
+
+        from pyramid.session import BaseCookieSessionFactory
+
+        class State(dict):
+            pass
+
+        state = State(state=[1])
+
+        class Serializer:
+            def loads(self, value):
+                return (time.time(), 0, state)
+
+        request = testing.DummyRequest()
+        request.cookies['session'] = 'abc'
+        factory = BaseCookieSessionFactory(Serializer(), cookie_cache_size=1)
+        session = factory(request)
+        session['state'].append(2)
+        session = factory(request)
+        self.assertEqual(dict(session), {'state': [1]})
+        self.assertEqual(session.cookie_cache.hits, 1)
+
+    def test_skip_unchanged_unmarshallable_value(self):
+        import time
+        import webob
+
+        from pyramid.session import BaseCookieSessionFactory
+
+        class State(dict):
+            pass
+
+        class Serializer:
+            def loads(self, value):
+                return (time.time(), 0, State(state=1))
+
+            def dumps(self, value):
+                return b'abc'
+
+        request = testing.DummyRequest()
+        request.cookies['session'] = 'abc'
+        factory = BaseCookieSessionFactory(
+            Serializer(), reissue_time=None, skip_unchanged=True
+        )
+        session = factory(request)
+        self.assertEqual(session.pop_flash(), [])
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+
 
 class TestSignedCookieSession(SharedCookieSessionTests, unittest.TestCase):
     def _makeOne(self, request, **kw):
@@ -508,6 +692,441 @@ class TestSignedCookieSession(SharedCookieSessionTests, unittest.TestCase):
         self.assertTrue('Set-Cookie' in dict(response.headerlist))
 
 
+class TestServerSideSession(unittest.TestCase):
+    session_id = 'a' * 64
+
+    def setUp(self):
+        from pyramid.session import MemorySessionStore
+
+        self.store = MemorySessionStore()
+
+    def _makeOne(self, request, **kw):
+        from pyramid.session import ServerSideSessionFactory
+
+        kw.setdefault('store', self.store)
+        return ServerSideSessionFactory('secret', **kw)(request)
+
+    def _makeRequest(self, session_id=session_id):
+        from webob.cookies import SignedSerializer
+
+        request = testing.DummyRequest()
+        if session_id is not None:
+            serializer = SignedSerializer(
+                'secret', 'pyramid.session.id.', 'sha512'
+            )
+            cookieval = serializer.dumps(session_id).decode('utf-8')
+            request.cookies['session'] = cookieval
+        return request
+
+    def _save(self, value, session_id=session_id):
+        self.store.save(session_id, json.dumps(value).encode('utf-8'))
+
+    def _load(self, session_id=session_id):
+        data = self.store.load(session_id)
+        if data is not None:
+            return json.loads(data.decode('utf-8'))
+
+    def _respond(self, request):
+        import webob
+
+        response = webob.Response()
+        for callback in request.response_callbacks:
+            callback(request, response)
+        return response
+
+    def test_instance_conforms(self):
+        from zope.interface.verify import verifyObject
+
+        from pyramid.interfaces import ISession
+
+        session = self._makeOne(self._makeRequest(None))
+        verifyObject(ISession, session)
+
+    def test_default_store(self):
+        from pyramid.session import ServerSideSessionFactory
+
+        request = self._makeRequest(None)
+        session = ServerSideSessionFactory('secret')(request)
+        session['a'] = 1
+        self._respond(request)
+        self.assertEqual(session.new, True)
+
+    def test_no_cookie(self):
+        session = self._makeOne(self._makeRequest(None))
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertIsNone(session.session_id)
+
+    def test_lazy_load(self):
+        import time
+
+        self._save((time.time(), 1, {'state': 1}))
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        self.assertFalse(session._loaded)
+        self.store.cache.hits = 0
+        self.assertEqual(session['state'], 1)
+        self.assertTrue(session._loaded)
+        self.assertEqual(session.created, 1)
+        self.assertFalse(session.new)
+        self.assertEqual(session.session_id, self.session_id)
+        session.get('state')
+        self.assertEqual(self.store.cache.hits, 1)
+
+    def test_unused_session_not_loaded(self):
+        request = self._makeRequest()
+        self._makeOne(request)
+        self.assertEqual(self.store.cache.misses, 0)
+        self.assertEqual(len(request.response_callbacks), 0)
+
+    def test_bad_cookie(self):
+        request = self._makeRequest(None)
+        request.cookies['session'] = 'abc'
+        session = self._makeOne(request)
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+
+    def test_cookie_signed_with_other_secret(self):
+        from pyramid.session import ServerSideSessionFactory
+
+        self._save((0, 0, {'state': 1}))
+        request = self._makeRequest()
+        session = ServerSideSessionFactory('other', store=self.store)(request)
+        self.assertEqual(dict(session), {})
+
+    def test_invalid_session_id(self):
+        self._save((0, 0, {'state': 1}), '../' * 10)
+        session = self._makeOne(self._makeRequest('../' * 10), timeout=None)
+        self.assertEqual(dict(session), {})
+        session = self._makeOne(self._makeRequest(1), timeout=None)
+        self.assertEqual(dict(session), {})
+
+    def test_unknown_session_id(self):
+        session = self._makeOne(self._makeRequest())
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertIsNone(session.session_id)
+
+    def test_bad_state(self):
+        self.store.save(self.session_id, b'abc')
+        session = self._makeOne(self._makeRequest())
+        self.assertEqual(dict(session), {})
+        self.assertIsNone(self.store.load(self.session_id))
+
+    def test_bad_state_not_tuple(self):
+        self._save('abc')
+        session = self._makeOne(self._makeRequest())
+        self.assertEqual(dict(session), {})
+
+    def test_timeout(self):
+        import time
+
+        self._save((time.time() - 5, 0, {'state': 1}))
+        session = self._makeOne(self._makeRequest(), timeout=1)
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertIsNone(self.store.load(self.session_id))
+
+    def test_timeout_never(self):
+        self._save((0, 0, {'state': 1}))
+        session = self._makeOne(self._makeRequest(), timeout=None)
+        self.assertEqual(dict(session), {'state': 1})
+
+    def test_changed_saves_state(self):
+        import time
+
+        self._save((time.time(), 1, {'state': 1}))
+        request = self._makeRequest()
+        session = self._makeOne(request, reissue_time=None)
+        session['state'] = 2
+        self.assertEqual(len(request.response_callbacks), 1)
+        response = self._respond(request)
+        self.assertIn('Set-Cookie', response.headers)
+        accessed, created, state = self._load()
+        self.assertEqual(created, 1)
+        self.assertEqual(state, {'state': 2})
+        self.assertIsNone(session.request)
+
+    def test_unchanged_not_saved(self):
+        import time
+
+        self._save((time.time(), 1, {'state': 1}))
+        request = self._makeRequest()
+        session = self._makeOne(request, reissue_time=None)
+        self.assertEqual(session['state'], 1)
+        self.assertEqual(len(request.response_callbacks), 0)
+
+    def test_changed_in_place(self):
+        import time
+
+        self._save((time.time(), 1, {'state': [1]}))
+        request = self._makeRequest()
+        session = self._makeOne(request, reissue_time=None)
+        session['state'].append(2)
+        session.changed()
+        self._respond(request)
+        self.assertEqual(self._load()[2], {'state': [1, 2]})
+
+    def test_changed_before_load(self):
+        import time
+
+        self._save((time.time(), 1, {'state': 1}))
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        session.changed()
+        self._respond(request)
+        self.assertEqual(self._load()[2], {'state': 1})
+
+    def test_reissue_triggered(self):
+        import time
+
+        self._save((time.time() - 2, 0, {'state': 1}))
+        request = self._makeRequest()
+        session = self._makeOne(request, reissue_time=1)
+        self.assertEqual(session['state'], 1)
+        self.assertTrue(session._dirty)
+
+    def test_new_session_id(self):
+        request = self._makeRequest(None)
+        session = self._makeOne(request)
+        session['a'] = 1
+        response = self._respond(request)
+        session_id = session.session_id
+        self.assertEqual(len(session_id), 64)
+        self.assertEqual(self._load(session_id)[2], {'a': 1})
+
+        # the cookie refers to the new session
+        request = self._makeRequest(None)
+        request.cookies['session'] = response.headers['Set-Cookie'].split(';')[
+            0
+        ][len('session=') :]
+        session = self._makeOne(request)
+        self.assertEqual(session['a'], 1)
+        self.assertEqual(session.session_id, session_id)
+
+    def test_invalidate(self):
+        import time
+
+        self._save((time.time(), 1, {'state': 1}))
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        self.assertEqual(session.invalidate(), None)
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertIsNone(session.session_id)
+        self.assertIsNone(self._load())
+        session['a'] = 1
+        self._respond(request)
+        self.assertNotEqual(session.session_id, self.session_id)
+
+    def test_invalidate_expires_cookie(self):
+        import time
+
+        self._save((time.time(), 1, {'state': 1}))
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        session.invalidate()
+        response = self._respond(request)
+        cookieval = response.headers['Set-Cookie']
+        self.assertTrue(cookieval.startswith('session=;'))
+        self.assertIn('Max-Age=0', cookieval)
+        self.assertIsNone(session.session_id)
+        self.assertEqual(len(self.store.cache), 0)
+
+    def test_invalidate_without_cookie(self):
+        request = self._makeRequest(None)
+        session = self._makeOne(request)
+        session.invalidate()
+        response = self._respond(request)
+        self.assertNotIn('Set-Cookie', response.headers)
+        self.assertEqual(len(self.store.cache), 0)
+
+    def test_read_only_not_saved_by_default(self):
+        import time
+
+        self._save((time.time() - 60, 1, {'state': 1}))
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        self.assertEqual(session['state'], 1)
+        self.assertEqual(len(request.response_callbacks), 0)
+
+    def test_no_save_with_exception(self):
+        request = self._makeRequest(None)
+        request.exception = True
+        session = self._makeOne(request, set_on_exception=False)
+        session['a'] = 1
+        response = self._respond(request)
+        self.assertNotIn('Set-Cookie', response.headers)
+        self.assertEqual(len(self.store.cache), 0)
+
+    def test_save_with_exception(self):
+        request = self._makeRequest(None)
+        request.exception = True
+        session = self._makeOne(request)
+        session['a'] = 1
+        response = self._respond(request)
+        self.assertIn('Set-Cookie', response.headers)
+
+    def test_cookie_options(self):
+        request = self._makeRequest(None)
+        session = self._makeOne(
+            request,
+            cookie_name='abc',
+            max_age=10,
+            path='/foo',
+            domain='localhost',
+            secure=True,
+            httponly=True,
+        )
+        session['abc'] = 'x'
+        response = self._respond(request)
+        cookieval = response.headers['Set-Cookie']
+        self.assertTrue(cookieval.startswith('abc='))
+        for option in (
+            'Max-Age=10',
+            'Domain=localhost',
+            'Path=/foo',
+            'secure',
+            'HttpOnly',
+            'SameSite=Lax',
+        ):
+            self.assertIn(option, cookieval)
+
+    def test_large_session(self):
+        request = self._makeRequest(None)
+        session = self._makeOne(request)
+        session['abc'] = 'x' * 100000
+        response = self._respond(request)
+        self.assertLess(len(response.headers['Set-Cookie']), 400)
+
+    def test_flash(self):
+        request = self._makeRequest(None)
+        session = self._makeOne(request)
+        session.flash('msg1')
+        session.flash('msg1', allow_duplicate=False)
+        self.assertEqual(session.peek_flash(), ['msg1'])
+        self.assertEqual(session.pop_flash(), ['msg1'])
+        self.assertEqual(session.pop_flash(), [])
+
+    def test_csrf_token(self):
+        request = self._makeRequest(None)
+        session = self._makeOne(request)
+        token = session.get_csrf_token()
+        self.assertEqual(token, session['_csrft_'])
+        self.assertEqual(session.get_csrf_token(), token)
+        self.assertNotEqual(session.new_csrf_token(), token)
+
+
+class TestMemorySessionStore(unittest.TestCase):
+    def _makeOne(self, **kw):
+        from pyramid.session import MemorySessionStore
+
+        return MemorySessionStore(**kw)
+
+    def test_it(self):
+        store = self._makeOne(maxsize=1)
+        self.assertIsNone(store.load('a'))
+        store.save('a', b'1')
+        self.assertEqual(store.load('a'), b'1')
+        store.save('b', b'2')
+        self.assertIsNone(store.load('a'))
+        store.delete('b')
+        store.delete('b')
+        self.assertIsNone(store.load('b'))
+
+
+class TestFileSessionStore(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.tmpdir)
+
+    def _makeOne(self, directory):
+        from pyramid.session import FileSessionStore
+
+        return FileSessionStore(directory)
+
+    def test_it(self):
+        import os
+
+        store = self._makeOne(os.path.join(self.tmpdir, 'sessions'))
+        self.assertIsNone(store.load('a'))
+        store.save('a', b'1')
+        store.save('a', b'2')
+        self.assertEqual(store.load('a'), b'2')
+        self.assertEqual(os.listdir(store.directory), ['a'])
+        store.delete('a')
+        store.delete('a')
+        self.assertIsNone(store.load('a'))
+
+    def test_purge(self):
+        import os
+
+        store = self._makeOne(self.tmpdir)
+        store.save('a', b'1')
+        store.save('b', b'1')
+        os.utime(os.path.join(self.tmpdir, 'a'), (0, 0))
+        store.purge(60)
+        self.assertIsNone(store.load('a'))
+        self.assertEqual(store.load('b'), b'1')
+
+
+class TestSQLiteSessionStore(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.tmpdir)
+
+    def _makeOne(self, **kw):
+        import os
+
+        from pyramid.session import SQLiteSessionStore
+
+        return SQLiteSessionStore(os.path.join(self.tmpdir, 'db'), **kw)
+
+    def test_it(self):
+        store = self._makeOne()
+        self.assertIsNone(store.load('a'))
+        store.save('a', b'1')
+        store.save('a', b'2')
+        self.assertEqual(store.load('a'), b'2')
+        # shared with other instances
+        self.assertEqual(self._makeOne().load('a'), b'2')
+        store.delete('a')
+        self.assertIsNone(store.load('a'))
+
+    def test_connection_per_thread(self):
+        import threading
+
+        store = self._makeOne(table='other')
+        store.save('a', b'1')
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(store.load('a'))
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(result, [b'1'])
+
+    def test_purge(self):
+        store = self._makeOne()
+        store.save('a', b'1')
+        store.purge(60)
+        self.assertEqual(store.load('a'), b'1')
+        store.purge(-1)
+        self.assertIsNone(store.load('a'))
+
+
 class Test_manage_accessed(unittest.TestCase):
     def _makeOne(self, wrapped):
         from pyramid.session import manage_accessed
@@ -604,6 +1223,149 @@ class TestPickleSerializer(unittest.TestCase):
         self.assertIsInstance(result, bytes)
 
 
+class TestCompactSerializer(unittest.TestCase):
+    def _makeOne(self, **kw):
+        from pyramid.session import CompactSerializer
+
+        return CompactSerializer(**kw)
+
+    def test_dumps(self):
+        serializer = self._makeOne()
+        result = serializer.dumps({'a': [1, None]})
+        self.assertEqual(result, b'\x00d\x01\x01al\x02i\x01\x01N')
+        self.assertIsInstance(result, bytes)
+
+    def test_roundtrip(self):
+        serializer = self._makeOne()
+        values = [
+            None,
+            True,
+            False,
+            0,
+            -1,
+            128,
+            -(2**100),
+            2**1100,
+            1.5,
+            '',
+            '\u00e9t\u00e9' * 100,
+            [],
+            {},
+            [1, [2, [3, {}]], 'x'],
+            {'a': {'b': [None, False]}, 'c': 'd' * 200},
+        ]
+        for value in values:
+            self.assertEqual(serializer.loads(serializer.dumps(value)), value)
+
+    def test_tuples_loaded_as_lists(self):
+        serializer = self._makeOne()
+        result = serializer.loads(serializer.dumps((1.5, 2.5, {'a': (1,)})))
+        self.assertEqual(result, [1.5, 2.5, {'a': [1]}])
+
+    def test_dumps_compressed(self):
+        serializer = self._makeOne(compress_threshold=16)
+        value = {'_f_': ['The document was saved.'] * 10}
+        result = serializer.dumps(value)
+        self.assertEqual(result[:1], b'\x01')
+        self.assertLess(len(result), 60)
+        self.assertEqual(serializer.loads(result), value)
+
+    def test_dumps_below_threshold_not_compressed(self):
+        serializer = self._makeOne(compress_threshold=1000)
+        result = serializer.dumps({'_f_': ['The document was saved.'] * 10})
+        self.assertEqual(result[:1], b'\x00')
+
+    def test_dumps_compression_disabled(self):
+        serializer = self._makeOne(compress_threshold=None)
+        result = serializer.dumps({'_f_': ['The document was saved.'] * 10})
+        self.assertEqual(result[:1], b'\x00')
+
+    def test_dumps_incompressible_not_compressed(self):
+        serializer = self._makeOne(compress_threshold=1)
+        self.assertEqual(serializer.dumps('abc'), b'\x00s\x03abc')
+
+    def test_dumps_larger_than_max_size_not_compressed(self):
+        serializer = self._makeOne(compress_threshold=1)
+        serializer.max_size = 100
+        value = 'x' * 200
+        result = serializer.dumps(value)
+        self.assertEqual(result[:1], b'\x00')
+        self.assertEqual(serializer.loads(result), value)
+
+    def test_dumps_unsupported_type(self):
+        serializer = self._makeOne()
+        self.assertRaises(TypeError, serializer.dumps, {'a': object()})
+
+    def test_dumps_non_str_key(self):
+        serializer = self._makeOne()
+        self.assertRaises(TypeError, serializer.dumps, {1: 'a'})
+
+    def test_loads_raises_ValueError_on_invalid_data(self):
+        serializer = self._makeOne()
+        invalid = [
+            b'',
+            b'\x00',
+            b'\x02N',
+            b'\x00X',
+            b'\x00s\x05ab',
+            b'\x00s\x01\xff',
+            b'\x00i\x02\x01',
+            b'\x00f\x00\x00',
+            b'\x00l\x02N',
+            b'\x00d\x01\x05ab',
+            b'\x00NN',
+            b'\x01not zlib',
+        ]
+        for cstruct in invalid:
+            self.assertRaises(ValueError, serializer.loads, cstruct)
+
+    def test_loads_raises_ValueError_on_invalid_compressed_data(self):
+        import zlib
+
+        serializer = self._makeOne()
+        data = zlib.compress(b'N')
+        self.assertRaises(ValueError, serializer.loads, b'\x01' + data[:-1])
+        self.assertRaises(ValueError, serializer.loads, b'\x01' + data + b'N')
+
+    def test_loads_raises_ValueError_on_decompression_bomb(self):
+        import zlib
+
+        serializer = self._makeOne()
+        serializer.max_size = 100
+        cstruct = b'\x01' + zlib.compress(b's\x80\x01' + b'x' * 128)
+        self.assertRaises(ValueError, serializer.loads, cstruct)
+
+    def test_loads_deeply_nested(self):
+        serializer = self._makeOne()
+        cstruct = b'\x00' + b'l\x01' * 10000 + b'N'
+        result = serializer.loads(cstruct)
+        for i in range(10000):
+            result = result[0]
+        self.assertIsNone(result)
+
+    def test_session_factory(self):
+        import time
+        import webob
+
+        from pyramid.session import SignedCookieSessionFactory
+
+        factory = SignedCookieSessionFactory(
+            'secret', serializer=self._makeOne()
+        )
+        request = testing.DummyRequest()
+        session = factory(request)
+        session.flash('The document was saved.')
+        response = webob.Response()
+        self.assertTrue(session._set_cookie(response))
+        cookie = response.headers['Set-Cookie'].split(';')[0]
+        request = testing.DummyRequest()
+        request.cookies['session'] = cookie.split('=', 1)[1]
+        session = factory(request)
+        self.assertFalse(session.new)
+        self.assertLessEqual(session.accessed, time.time())
+        self.assertEqual(session.pop_flash(), ['The document was saved.'])
+
+
 class Dummy:
     pass
 
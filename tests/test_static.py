@@ -1,5 +1,8 @@
 import datetime
+import hashlib
 import os.path
+import shutil
+import tempfile
 import unittest
 
 here = os.path.dirname(__file__)
@@ -562,6 +565,490 @@ class Test_static_view_content_encodings(unittest.TestCase):
         self.assertIsNot(result1, result2)
 
 
+class Test_static_view_metadata_index(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'foo.css')
+        self._write(b'body {}')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, data, mtime=1000000):
+        with open(self.path, 'wb') as f:
+            f.write(data)
+        os.utime(self.path, (mtime, mtime))
+
+    def _makeOne(self, **kw):
+        from pyramid.static import static_view
+
+        return static_view(self.tmpdir, metadata_index=True, **kw)
+
+    def _makeRequest(self, kw=None):
+        from pyramid.request import Request
+
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '6543',
+            'PATH_INFO': '/foo.css',
+            'SCRIPT_NAME': '',
+            'REQUEST_METHOD': 'GET',
+        }
+        if kw is not None:
+            environ.update(kw)
+        return Request(environ=environ)
+
+    def _etag(self, data):
+        return hashlib.sha256(data).hexdigest()[:32]
+
+    def test_response(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne()
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertIsInstance(response, FileResponse)
+        self.assertEqual(response.body, b'body {}')
+        self.assertEqual(response.content_type, 'text/css')
+        self.assertEqual(response.content_length, 7)
+        self.assertEqual(response.etag, self._etag(b'body {}'))
+        self.assertEqual(response.headers['ETag'], '"%s"' % response.etag)
+        self.assertEqual(response.last_modified.timestamp(), 1000000)
+        self.assertEqual(response.cache_control.max_age, 3600)
+        info = inst.metadata[self.path]
+        self.assertEqual(info.path, self.path)
+        self.assertEqual(info.size, 7)
+        self.assertEqual(info.content_encoding, None)
+
+    def _serve(self, inst, request):
+        start_response = DummyStartResponse()
+        response = inst(DummyContext(), request)
+        app_iter = response(request.environ, start_response)
+        try:
+            return start_response.status, b''.join(app_iter)
+        finally:
+            close = getattr(app_iter, 'close', None)
+            if close is not None:
+                close()
+
+    def test_not_modified_without_opening_file(self):
+        inst = self._makeOne()
+        inst(DummyContext(), self._makeRequest()).app_iter.close()
+        # the file is not needed anymore to answer a conditional request
+        os.unlink(self.path)
+        request = self._makeRequest(
+            {'HTTP_IF_NONE_MATCH': '"%s"' % self._etag(b'body {}')}
+        )
+        status, body = self._serve(inst, request)
+        self.assertEqual(status, '304 Not Modified')
+        self.assertEqual(body, b'')
+        request = self._makeRequest(
+            {'HTTP_IF_MODIFIED_SINCE': 'Mon, 12 Jan 1970 13:46:40 GMT'}
+        )
+        status, body = self._serve(inst, request)
+        self.assertEqual(status, '304 Not Modified')
+
+    def test_modified(self):
+        inst = self._makeOne()
+        request = self._makeRequest({'HTTP_IF_NONE_MATCH': '"other"'})
+        self.assertEqual(self._serve(inst, request), ('200 OK', b'body {}'))
+        request = self._makeRequest(
+            {'HTTP_IF_MODIFIED_SINCE': 'Sun, 11 Jan 1970 13:46:40 GMT'}
+        )
+        self.assertEqual(self._serve(inst, request), ('200 OK', b'body {}'))
+
+    def test_conditional_unsafe_method(self):
+        inst = self._makeOne()
+        request = self._makeRequest(
+            {
+                'REQUEST_METHOD': 'POST',
+                'HTTP_IF_NONE_MATCH': '"%s"' % self._etag(b'body {}'),
+            }
+        )
+        self.assertEqual(self._serve(inst, request), ('200 OK', b'body {}'))
+
+    def test_head_without_opening_file(self):
+        inst = self._makeOne()
+        request = self._makeRequest({'REQUEST_METHOD': 'HEAD'})
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.content_length, 7)
+        self.assertNotIn('file', response.app_iter.__dict__)
+
+    def test_removed_file_raises_before_response(self):
+        inst = self._makeOne()
+        inst(DummyContext(), self._makeRequest()).app_iter.close()
+        os.unlink(self.path)
+        self.assertRaises(
+            FileNotFoundError, inst, DummyContext(), self._makeRequest()
+        )
+
+    def test_changed_file_without_reload(self):
+        inst = self._makeOne()
+        inst(DummyContext(), self._makeRequest()).app_iter.close()
+        info = inst.metadata[self.path]
+        self._write(b'body { color: red }', mtime=2000000)
+        # the index is not checked, but the response serves the file it
+        # opened and updates the index
+        response = inst(DummyContext(), self._makeRequest())
+        app_iter = response.app_iter
+        self.assertEqual(response.body, b'body { color: red }')
+        app_iter.close()
+        self.assertEqual(response.content_length, 19)
+        self.assertEqual(response.etag, self._etag(b'body { color: red }'))
+        self.assertEqual(response.last_modified.timestamp(), 2000000)
+        self.assertIsNot(inst.metadata[self.path], info)
+        self.assertEqual(inst.metadata[self.path].size, 19)
+
+    def test_metadata_refreshed_with_reload(self):
+        inst = self._makeOne(reload=True)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.etag, self._etag(b'body {}'))
+        response.app_iter.close()
+        info = inst.metadata[self.path]
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertIs(inst.metadata[self.path], info)
+        response.app_iter.close()
+        self._write(b'body { color: red }', mtime=2000000)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.etag, self._etag(b'body { color: red }'))
+        self.assertEqual(response.body, b'body { color: red }')
+
+    def test_content_encodings(self):
+        import gzip
+
+        data = gzip.compress(b'body {}' * 100)
+        with open(self.path + '.gz', 'wb') as f:
+            f.write(data)
+        self._write(b'body {}' * 100)
+        inst = self._makeOne(content_encodings=['gzip'])
+        request = self._makeRequest({'HTTP_ACCEPT_ENCODING': 'gzip'})
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.content_encoding, 'gzip')
+        self.assertEqual(response.content_type, 'text/css')
+        self.assertEqual(response.etag, self._etag(data))
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.body, data)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(response.etag, self._etag(b'body {}' * 100))
+        response.app_iter.close()
+
+
+class Test_static_view_memory_cache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'foo.css')
+        self._write(self.path, b'body {}')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, path, data, mtime=1000000):
+        with open(path, 'wb') as f:
+            f.write(data)
+        os.utime(path, (mtime, mtime))
+
+    def _makeOne(self, **kw):
+        from pyramid.static import static_view
+
+        kw.setdefault('memory_cache_size', 1000)
+        return static_view(self.tmpdir, **kw)
+
+    def _makeRequest(self, kw=None, path='/foo.css'):
+        from pyramid.request import Request
+
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '6543',
+            'PATH_INFO': path,
+            'SCRIPT_NAME': '',
+            'REQUEST_METHOD': 'GET',
+        }
+        if kw is not None:
+            environ.update(kw)
+        return Request(environ=environ)
+
+    def test_disabled_by_default(self):
+        from pyramid.static import static_view
+
+        inst = static_view(self.tmpdir)
+        self.assertIsNone(inst.memory_cache)
+
+    def test_served_from_memory(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne()
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertNotIsInstance(response, FileResponse)
+        self.assertEqual(response.body, b'body {}')
+        self.assertEqual(response.content_type, 'text/css')
+        self.assertEqual(response.last_modified.timestamp(), 1000000)
+        self.assertEqual(response.cache_control.max_age, 3600)
+        self.assertIsNone(response.etag)
+        os.unlink(self.path)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.body, b'body {}')
+        self.assertEqual(inst.memory_cache.hits, 1)
+
+    def test_conditional_and_range_requests(self):
+        inst = self._makeOne()
+        inst(DummyContext(), self._makeRequest())
+        request = self._makeRequest(
+            {'HTTP_IF_MODIFIED_SINCE': 'Mon, 12 Jan 1970 13:46:40 GMT'}
+        )
+        response = request.get_response(inst(DummyContext(), request))
+        self.assertEqual(response.status_int, 304)
+        request = self._makeRequest({'HTTP_RANGE': 'bytes=0-3'})
+        response = request.get_response(inst(DummyContext(), request))
+        self.assertEqual(response.status_int, 206)
+        self.assertEqual(response.body, b'body')
+
+    def test_with_metadata_index(self):
+        inst = self._makeOne(metadata_index=True)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.etag, inst.metadata[self.path].etag)
+        self.assertIs(
+            inst.memory_cache.get(self.path).info, inst.metadata[self.path]
+        )
+
+    def test_large_file_not_cached(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne(memory_cache_max_file_size=5)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertIsInstance(response, FileResponse)
+        self.assertEqual(response.body, b'body {}')
+        self.assertEqual(len(inst.memory_cache), 0)
+        self.assertIn(self.path, inst._uncached)
+
+    def test_least_recently_used_discarded(self):
+        bar = os.path.join(self.tmpdir, 'bar.css')
+        self._write(bar, b'b' * 600)
+        self._write(self.path, b'f' * 600)
+        inst = self._makeOne()
+        inst(DummyContext(), self._makeRequest())
+        inst(DummyContext(), self._makeRequest(path='/bar.css'))
+        self.assertNotIn(self.path, inst.memory_cache)
+        self.assertIn(bar, inst.memory_cache)
+        self.assertEqual(inst.memory_cache.evictions, 1)
+
+    def test_content_encodings(self):
+        import gzip
+
+        data = gzip.compress(b'body {}' * 100)
+        self._write(self.path + '.gz', data)
+        self._write(self.path, b'body {}' * 100)
+        inst = self._makeOne(content_encodings=['gzip'])
+        request = self._makeRequest({'HTTP_ACCEPT_ENCODING': 'gzip'})
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.content_encoding, 'gzip')
+        self.assertEqual(response.content_type, 'text/css')
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.body, data)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(response.body, b'body {}' * 100)
+        self.assertEqual(len(inst.memory_cache), 2)
+
+    def test_not_reread_without_reload(self):
+        inst = self._makeOne()
+        inst(DummyContext(), self._makeRequest())
+        self._write(self.path, b'body { color: red }', mtime=2000000)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.body, b'body {}')
+
+    def test_reread_with_reload(self):
+        inst = self._makeOne(reload=True)
+        inst(DummyContext(), self._makeRequest())
+        cached = inst.memory_cache.get(self.path)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertIs(inst.memory_cache.get(self.path), cached)
+        self._write(self.path, b'body { color: red }', mtime=2000000)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.body, b'body { color: red }')
+        self.assertEqual(response.last_modified.timestamp(), 2000000)
+
+    def test_reread_with_reload_and_metadata_index(self):
+        inst = self._makeOne(reload=True, metadata_index=True)
+        inst(DummyContext(), self._makeRequest())
+        cached = inst.memory_cache.get(self.path)
+        inst(DummyContext(), self._makeRequest())
+        self.assertIs(inst.memory_cache.get(self.path), cached)
+        self._write(self.path, b'body { color: red }', mtime=2000000)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.body, b'body { color: red }')
+        self.assertEqual(response.etag, inst.metadata[self.path].etag)
+
+    def test_large_file_with_reload_checked_again(self):
+        self._write(self.path, b'x' * 20)
+        inst = self._makeOne(reload=True, memory_cache_max_file_size=10)
+        inst(DummyContext(), self._makeRequest()).app_iter.close()
+        self.assertEqual(len(inst.memory_cache), 0)
+        self.assertEqual(inst._uncached, set())
+        self._write(self.path, b'x' * 5, mtime=2000000)
+        response = inst(DummyContext(), self._makeRequest())
+        self.assertEqual(response.body, b'x' * 5)
+        self.assertEqual(len(inst.memory_cache), 1)
+
+
+class Test_static_view_hashed_names(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.tmpdir, 'css'))
+        self._write('css/main.css', b'body {}')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, name, data):
+        with open(os.path.join(self.tmpdir, name), 'wb') as f:
+            f.write(data)
+
+    def _hash(self, data):
+        return hashlib.sha256(data).hexdigest()[:16]
+
+    def _makeOne(self, **kw):
+        from pyramid.static import static_view
+
+        kw.setdefault('hashed_names', True)
+        return static_view(self.tmpdir, **kw)
+
+    def _makeRequest(self, path, kw=None):
+        from pyramid.request import Request
+
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '6543',
+            'PATH_INFO': path,
+            'SCRIPT_NAME': '',
+            'REQUEST_METHOD': 'GET',
+        }
+        if kw is not None:
+            environ.update(kw)
+        return Request(environ=environ)
+
+    def test_disabled_by_default(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        inst = self._makeOne(hashed_names=False)
+        request = self._makeRequest('/css/main.0123456789abcdef.css')
+        self.assertRaises(HTTPNotFound, inst, None, request)
+
+    def test_hashed_name(self):
+        inst = self._makeOne()
+        token = self._hash(b'body {}')
+        request = self._makeRequest('/css/main.%s.css' % token)
+        response = inst(None, request)
+        self.assertEqual(response.body, b'body {}')
+        self.assertEqual(response.content_type, 'text/css')
+        self.assertEqual(
+            response.headers['Cache-Control'], 'max-age=31536000, immutable'
+        )
+
+    def test_hashed_name_without_extension(self):
+        self._write('LICENSE', b'MIT')
+        inst = self._makeOne()
+        token = self._hash(b'MIT')
+        response = inst(None, self._makeRequest('/LICENSE.%s' % token))
+        self.assertEqual(response.body, b'MIT')
+
+    def test_hash_mismatch(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        inst = self._makeOne()
+        request = self._makeRequest('/css/main.0123456789abcdef.css')
+        self.assertRaises(HTTPNotFound, inst, None, request)
+
+    def test_hash_of_changed_file(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        inst = self._makeOne(reload=True)
+        old_token = self._hash(b'body {}')
+        response = inst(
+            None, self._makeRequest('/css/main.%s.css' % old_token)
+        )
+        response.app_iter.close()
+        self._write('css/main.css', b'body { color: red }')
+        token = self._hash(b'body { color: red }')
+        response = inst(None, self._makeRequest('/css/main.%s.css' % token))
+        app_iter = response.app_iter
+        self.assertEqual(response.body, b'body { color: red }')
+        app_iter.close()
+        request = self._makeRequest('/css/main.%s.css' % old_token)
+        self.assertRaises(HTTPNotFound, inst, None, request)
+
+    def test_hash_of_removed_file(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        inst = self._makeOne()
+        # the files found for the name are kept
+        inst(None, self._makeRequest('/css/main.css')).app_iter.close()
+        os.remove(os.path.join(self.tmpdir, 'css', 'main.css'))
+        token = self._hash(b'body {}')
+        request = self._makeRequest('/css/main.%s.css' % token)
+        self.assertRaises(HTTPNotFound, inst, None, request)
+
+    def test_hash_without_unencoded_file(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        self._write('css/other.css.gz', b'gz')
+        inst = self._makeOne(content_encodings=['gzip'])
+        request = self._makeRequest(
+            '/css/other.0123456789abcdef.css', {'HTTP_ACCEPT_ENCODING': 'gzip'}
+        )
+        self.assertRaises(HTTPNotFound, inst, None, request)
+
+    def test_plain_name(self):
+        inst = self._makeOne(cache_max_age=600)
+        response = inst(None, self._makeRequest('/css/main.css'))
+        self.assertEqual(response.body, b'body {}')
+        self.assertEqual(response.headers['Cache-Control'], 'max-age=600')
+
+    def test_existing_file_with_hashed_name(self):
+        self._write('css/main.0123456789abcdef.css', b'other {}')
+        inst = self._makeOne(cache_max_age=600)
+        request = self._makeRequest('/css/main.0123456789abcdef.css')
+        response = inst(None, request)
+        self.assertEqual(response.body, b'other {}')
+        self.assertEqual(response.headers['Cache-Control'], 'max-age=600')
+
+    def test_not_a_hashed_name(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        inst = self._makeOne()
+        request = self._makeRequest('/css/main.notahash.css')
+        self.assertRaises(HTTPNotFound, inst, None, request)
+
+    def test_missing_file(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        inst = self._makeOne()
+        request = self._makeRequest('/css/other.0123456789abcdef.css')
+        self.assertRaises(HTTPNotFound, inst, None, request)
+
+    def test_with_content_encodings_and_memory_cache(self):
+        self._write('css/main.css.gz', b'gz')
+        inst = self._makeOne(
+            content_encodings=['gzip'], memory_cache_size=1000
+        )
+        request = self._makeRequest(
+            '/css/main.%s.css' % self._hash(b'body {}'),
+            {'HTTP_ACCEPT_ENCODING': 'gzip'},
+        )
+        response = inst(None, request)
+        self.assertEqual(response.body, b'gz')
+        self.assertEqual(response.content_encoding, 'gzip')
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+        self.assertEqual(
+            response.headers['Cache-Control'], 'max-age=31536000, immutable'
+        )
+
+
 class TestQueryStringConstantCacheBuster(unittest.TestCase):
     def _makeOne(self, param=None):
         from pyramid.static import QueryStringConstantCacheBuster as cls
@@ -667,6 +1154,142 @@ class TestManifestCacheBuster(unittest.TestCase):
         self.assertEqual(inst.manifest, {})
 
 
+class TestContentHashCacheBuster(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'main.css')
+        with open(self.path, 'wb') as f:
+            f.write(b'body {}')
+        self.token = hashlib.sha256(b'body {}').hexdigest()[:16]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _makeOne(self, *arg, **kw):
+        from pyramid.static import ContentHashCacheBuster as cls
+
+        return cls(*arg, **kw)
+
+    def test_it(self):
+        fut = self._makeOne()
+        kw = {'rawspec': self.path}
+        self.assertEqual(
+            fut('foo', 'css/main.css', kw), (f'css/main.{self.token}.css', kw)
+        )
+        self.assertEqual(
+            fut.paths, {'css/main.css': f'css/main.{self.token}.css'}
+        )
+
+    def test_hash_is_cached(self):
+        fut = self._makeOne()
+        fut('foo', 'main.css', {'rawspec': self.path})
+        os.unlink(self.path)
+        self.assertEqual(
+            fut('foo', 'main.css', {'rawspec': self.path}),
+            (f'main.{self.token}.css', {'rawspec': self.path}),
+        )
+
+    def test_reload(self):
+        fut = self._makeOne(reload=True)
+        kw = {'rawspec': self.path}
+        fut('foo', 'main.css', kw)
+        os.unlink(self.path)
+        self.assertEqual(fut('foo', 'main.css', kw), ('main.css', kw))
+        self.assertEqual(fut('foo', 'main.css', kw), ('main.css', kw))
+        with open(self.path, 'wb') as f:
+            f.write(b'body {}')
+        self.assertEqual(
+            fut('foo', 'main.css', kw), (f'main.{self.token}.css', kw)
+        )
+
+    def test_reload_edited_asset_served_by_hashed_name(self):
+        from pyramid.request import Request
+        from pyramid.static import static_view
+
+        fut = self._makeOne(reload=True)
+        view = static_view(self.tmpdir, hashed_names=True, reload=True)
+        kw = {'rawspec': self.path}
+
+        def serve():
+            subpath, _ = fut('foo', 'main.css', kw)
+            self.assertIs(fut('foo', 'main.css', kw)[0], subpath)
+            response = view(None, Request.blank('/' + subpath))
+            app_iter = response.app_iter
+            try:
+                return response.body
+            finally:
+                app_iter.close()
+
+        self.assertEqual(serve(), b'body {}')
+        with open(self.path, 'wb') as f:
+            f.write(b'body { color: red }')
+        self.assertEqual(serve(), b'body { color: red }')
+
+    def test_reload_does_not_check_manifest(self):
+        manifest = os.path.join(self.tmpdir, 'manifest.json')
+        with open(manifest, 'w') as f:
+            f.write('{"main.css": "main.0123456789abcdef.css"}')
+        fut = self._makeOne(manifest, reload=True)
+        kw = {'rawspec': self.path}
+        self.assertEqual(
+            fut('foo', 'main.css', kw), ('main.0123456789abcdef.css', kw)
+        )
+
+    def test_hash_length(self):
+        fut = self._makeOne(hash_length=8)
+        subpath, kw = fut('foo', 'main.css', {'rawspec': self.path})
+        self.assertEqual(subpath, f'main.{self.token[:8]}.css')
+
+    def test_invalid_hash_length(self):
+        self.assertRaises(ValueError, self._makeOne, hash_length=7)
+        self.assertRaises(ValueError, self._makeOne, hash_length=65)
+
+    def test_with_asset_spec(self):
+        fut = self._makeOne()
+        kw = {'rawspec': 'tests:fixtures/static/index.html'}
+        with open(os.path.join(here, 'fixtures/static/index.html'), 'rb') as f:
+            token = hashlib.sha256(f.read()).hexdigest()[:16]
+        self.assertEqual(
+            fut('foo', 'index.html', kw), (f'index.{token}.html', kw)
+        )
+
+    def test_unreadable_asset(self):
+        fut = self._makeOne()
+        kw = {'rawspec': self.tmpdir}
+        self.assertEqual(fut('foo', 'subdir/', kw), ('subdir/', kw))
+        kw = {'rawspec': os.path.join(self.tmpdir, 'missing.css')}
+        self.assertEqual(fut('foo', 'missing.css', kw), ('missing.css', kw))
+
+    def test_missing_manifest(self):
+        manifest_path = os.path.join(self.tmpdir, 'manifest.json')
+        fut = self._makeOne(manifest_path)
+        self.assertEqual(fut.manifest_path, manifest_path)
+        self.assertEqual(fut.paths, {})
+
+    def test_manifest(self):
+        fut = self._makeOne('tests:fixtures/manifest.json')
+        self.assertEqual(
+            fut('foo', 'css/main.css', {}), ('css/main-test.css', {})
+        )
+
+    def test_write_manifest(self):
+        manifest_path = os.path.join(self.tmpdir, 'manifest.json')
+        fut = self._makeOne(manifest_path)
+        fut('foo', 'main.css', {'rawspec': self.path})
+        fut.write_manifest()
+        fut = self._makeOne(manifest_path)
+        self.assertEqual(fut.paths, {'main.css': f'main.{self.token}.css'})
+        os.unlink(self.path)
+        self.assertEqual(
+            fut('foo', 'main.css', {}), (f'main.{self.token}.css', {})
+        )
+        self.assertEqual(os.listdir(self.tmpdir), ['manifest.json'])
+
+    def test_write_manifest_without_manifest_spec(self):
+        fut = self._makeOne()
+        self.assertRaises(ValueError, fut.write_manifest)
+
+
 class DummyContext:
     pass
 
@@ -50,6 +50,127 @@ class TestThreadLocalManager(unittest.TestCase):
         self.assertEqual(local.get(), 1)
 
 
+class TestContextVarManager(TestThreadLocalManager):
+    def _getTargetClass(self):
+        from pyramid.threadlocal import ContextVarManager
+
+        return ContextVarManager
+
+    def test_stack_is_a_copy(self):
+        local = self._makeOne()
+        local.push(True)
+        local.stack.append(False)
+        self.assertEqual(local.stack, [True])
+
+    def test_threads_do_not_share_stack(self):
+        import threading
+
+        local = self._makeOne()
+        local.push('main')
+        seen = []
+
+        def run():
+            seen.append(local.get())
+            local.push('thread')
+            seen.append(local.get())
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [1, 'thread'])
+        self.assertEqual(local.get(), 'main')
+
+    def test_interleaved_tasks_do_not_share_stack(self):
+        import asyncio
+
+        local = self._makeOne()
+        seen = []
+
+        async def handle(name, started, other_started):
+            local.push(name)
+            started.set()
+            await other_started.wait()
+            seen.append((name, local.get()))
+            local.pop()
+
+        async def main():
+            a_started = asyncio.Event()
+            b_started = asyncio.Event()
+            await asyncio.gather(
+                handle('a', a_started, b_started),
+                handle('b', b_started, a_started),
+            )
+
+        asyncio.run(main())
+        self.assertEqual(sorted(seen), [('a', 'a'), ('b', 'b')])
+        self.assertEqual(local.get(), 1)
+
+
+class Test_set_manager(unittest.TestCase):
+    def _callFUT(self, new_manager):
+        from pyramid.threadlocal import set_manager
+
+        return set_manager(new_manager)
+
+    def test_it(self):
+        from pyramid import threadlocal
+
+        old_manager = threadlocal.manager
+        new_manager = threadlocal.ContextVarManager(
+            default=threadlocal.defaults
+        )
+        request = object()
+        old_manager.push({'request': request, 'registry': None})
+        try:
+            result = self._callFUT(new_manager)
+            self.assertIs(result, old_manager)
+            self.assertIs(threadlocal.manager, new_manager)
+            self.assertIs(threadlocal.get_current_request(), request)
+            new_manager.pop()
+            self.assertIsNone(threadlocal.get_current_request())
+        finally:
+            self._callFUT(old_manager)
+            old_manager.pop()
+        self.assertIs(threadlocal.manager, old_manager)
+
+    def test_interleaved_requests(self):
+        import asyncio
+
+        from pyramid import threadlocal
+
+        new_manager = threadlocal.ContextVarManager(
+            default=threadlocal.defaults
+        )
+        old_manager = self._callFUT(new_manager)
+        seen = []
+
+        async def handle(request, started, other_started):
+            with threadlocal.RequestContext(request):
+                started.set()
+                await other_started.wait()
+                seen.append((request, threadlocal.get_current_request()))
+                seen.append(
+                    (request.registry, threadlocal.get_current_registry())
+                )
+
+        async def main():
+            a_started = asyncio.Event()
+            b_started = asyncio.Event()
+            await asyncio.gather(
+                handle(DummyRequest(), a_started, b_started),
+                handle(DummyRequest(), b_started, a_started),
+            )
+
+        try:
+            asyncio.run(main())
+        finally:
+            self._callFUT(old_manager)
+        self.assertEqual(len(seen), 4)
+        for expected, actual in seen:
+            self.assertIs(expected, actual)
+        self.assertIsNone(threadlocal.get_current_request())
+
+
 class TestGetCurrentRequest(unittest.TestCase):
     def _callFUT(self):
         from pyramid.threadlocal import get_current_request
@@ -104,3 +225,8 @@ class GetCurrentRegistryWithoutTestingRegistry(unittest.TestCase):
         from pyramid.registry import global_registry
 
         self.assertEqual(self._callFUT(), global_registry)
+
+
+class DummyRequest:
+    def __init__(self):
+        self.registry = object()
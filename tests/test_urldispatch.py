@@ -306,6 +306,152 @@ class RoutesMapperTests(unittest.TestCase):
         self.assertEqual(mapper.generate('abc', {}), 123)
 
 
+class CompiledRoutesMapperTests(RoutesMapperTests):
+    def _makeOne(self):
+        klass = self._getTargetClass()
+        return klass(compiled=True)
+
+    def test_compiled_respects_declaration_order(self):
+        mapper = self._makeOne()
+        mapper.connect('catchall', '/{path:.*}')
+        mapper.connect('foo', '/foo/{id}')
+        request = self._getRequest(path_info='/foo/1')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['catchall'])
+
+    def test_compiled_literal_before_dynamic(self):
+        mapper = self._makeOne()
+        mapper.connect('dynamic', '/foo/{id}')
+        mapper.connect('literal', '/foo/bar')
+        request = self._getRequest(path_info='/foo/bar')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['dynamic'])
+
+    def test_compiled_predicate_fallthrough(self):
+        mapper = self._makeOne()
+        mapper.connect('a', '/foo/bar', predicates=[lambda *arg: False])
+        mapper.connect('b', '/foo/{id}', predicates=[lambda *arg: False])
+        mapper.connect('c', '/{path:.*}')
+        request = self._getRequest(path_info='/foo/bar')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['c'])
+        self.assertEqual(result['match'], {'path': 'foo/bar'})
+
+    def test_compiled_partial_segment_prefix(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/ba{rest}')
+        request = self._getRequest(path_info='/foo/baz')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['foo'])
+        self.assertEqual(result['match'], {'rest': 'z'})
+        request = self._getRequest(path_info='/foo/qux')
+        result = mapper(request)
+        self.assertEqual(result['route'], None)
+
+    def test_compiled_star_remainder(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/*subpath')
+        request = self._getRequest(path_info='/foo/a/b')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['foo'])
+        self.assertEqual(result['match'], {'subpath': ('a', 'b')})
+
+    def test_compiled_literal_with_trailing_newline(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo')
+        request = self._getRequest(path_info='/foo\n')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['foo'])
+
+    def test_compiled_path_without_leading_slash(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/{path:.*}')
+        request = self._getRequest(path_info='foo')
+        result = mapper(request)
+        self.assertEqual(result['route'], None)
+
+    def test_compiled_rebuilt_after_connect(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/{id}')
+        request = self._getRequest(path_info='/bar/1')
+        self.assertEqual(mapper(request)['route'], None)
+        mapper.connect('bar', '/bar/{id}')
+        self.assertEqual(mapper(request)['route'], mapper.routes['bar'])
+
+    def test_compiled_large_table_matches_candidates_only(self):
+        mapper = self._makeOne()
+        for i in range(2000):
+            mapper.connect('route%d' % i, '/section%d/{id}/edit' % i)
+        tried = []
+        for route in mapper.get_routes():
+            route.match = _recording_matcher(route.match, tried)
+        request = self._getRequest(path_info='/section1999/1/edit')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['route1999'])
+        self.assertEqual(tried, ['/section1999/1/edit'])
+
+
+def _recording_matcher(match, tried):
+    def matcher(path):
+        tried.append(path)
+        return match(path)
+
+    return matcher
+
+
+class TestRouteDispatcher(unittest.TestCase):
+    def _makeOne(self, *patterns):
+        from pyramid.urldispatch import Route, RouteDispatcher
+
+        routes = [Route(pattern, pattern) for pattern in patterns]
+        return RouteDispatcher(routes)
+
+    def _names(self, dispatcher, path):
+        return [route.name for route in dispatcher(path)]
+
+    def test_root_routes_always_candidates(self):
+        dispatcher = self._makeOne('/{a}', '/foo/{b}')
+        self.assertEqual(self._names(dispatcher, '/bar'), ['/{a}'])
+        self.assertEqual(
+            self._names(dispatcher, '/foo/x'), ['/{a}', '/foo/{b}']
+        )
+
+    def test_candidates_in_declaration_order(self):
+        dispatcher = self._makeOne('/foo/bar/{a}', '/foo/{b}', '/foo/bar/baz')
+        self.assertEqual(
+            self._names(dispatcher, '/foo/bar/baz'),
+            ['/foo/bar/{a}', '/foo/{b}', '/foo/bar/baz'],
+        )
+
+    def test_literal_routes_require_exact_path(self):
+        dispatcher = self._makeOne('/foo', '/foo/')
+        self.assertEqual(self._names(dispatcher, '/foo'), ['/foo'])
+        self.assertEqual(self._names(dispatcher, '/foo/'), ['/foo/'])
+        self.assertEqual(self._names(dispatcher, '/foo/bar'), [])
+
+
+class TestLiteralPrefix(unittest.TestCase):
+    def _callFUT(self, pattern):
+        from pyramid.urldispatch import _literal_prefix
+
+        return _literal_prefix(pattern)
+
+    def test_literal(self):
+        self.assertEqual(self._callFUT('foo/bar'), ('/foo/bar', True))
+
+    def test_dynamic(self):
+        self.assertEqual(self._callFUT('/foo/{bar}'), ('/foo/', False))
+
+    def test_oldstyle(self):
+        self.assertEqual(self._callFUT('/foo/:bar'), ('/foo/', False))
+
+    def test_star(self):
+        self.assertEqual(self._callFUT('/foo/*bar'), ('/foo/', False))
+
+    def test_empty_star(self):
+        self.assertEqual(self._callFUT('/foo/*'), ('/foo/', True))
+
+
 class TestCompileRoute(unittest.TestCase):
     def _callFUT(self, pattern):
         from pyramid.urldispatch import _compile_route
@@ -172,6 +172,15 @@ class Test_InstancePropertyHelper(unittest.TestCase):
         self.assertEqual(1, foo.x)
         self.assertEqual(2, foo.y)
 
+    def test_make_class(self):
+        helper = self._getTargetClass()
+        x = helper.make_property(lambda _: 1, name='x', reify=True)
+        newcls = helper.make_class(Dummy, [x])
+        self.assertTrue(issubclass(newcls, Dummy))
+        self.assertEqual(newcls.__name__, 'Dummy')
+        self.assertEqual(newcls.__module__, Dummy.__module__)
+        self.assertEqual(1, newcls().x)
+
     def test_make_property_unicode(self):
         from pyramid.exceptions import ConfigurationError
 
@@ -423,6 +432,100 @@ class Test_WeakOrderedSet(unittest.TestCase):
         self.assertEqual(wos.last, None)
 
 
+class TestLRUCache(unittest.TestCase):
+    def _makeOne(self, maxsize, getsize=None):
+        from pyramid.util import LRUCache
+
+        return LRUCache(maxsize, getsize)
+
+    def test_ctor_invalid_maxsize(self):
+        self.assertRaises(ValueError, self._makeOne, 0)
+
+    def test_get_miss(self):
+        cache = self._makeOne(2)
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('a', 1), 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_put_and_get(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue('a' in cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_put_evicts_least_recently_used(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertFalse('b' in cache)
+        self.assertTrue('a' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_put_existing_key_does_not_evict(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 3)
+        self.assertEqual(cache.get('a'), 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_clear(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 1)
+
+    def test_pop(self):
+        cache = self._makeOne(2)
+        cache.put('a', 1)
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertEqual(cache.pop('a', 2), 2)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+    def test_pop_getsize(self):
+        cache = self._makeOne(10, len)
+        cache.put('a', b'1234')
+        cache.put('b', b'12')
+        self.assertEqual(cache.pop('a'), b'1234')
+        self.assertEqual(cache.size, 2)
+
+    def test_getsize(self):
+        cache = self._makeOne(10, len)
+        cache.put('a', b'1234')
+        cache.put('b', b'1234')
+        self.assertEqual(cache.size, 8)
+        cache.get('a')
+        cache.put('c', b'12345')
+        self.assertFalse('b' in cache)
+        self.assertEqual(cache.size, 9)
+        self.assertEqual(cache.evictions, 1)
+        cache.put('c', b'1')
+        self.assertEqual(cache.size, 5)
+        self.assertEqual(cache.evictions, 1)
+        cache.clear()
+        self.assertEqual(cache.size, 0)
+
+    def test_getsize_value_too_large(self):
+        cache = self._makeOne(10, len)
+        cache.put('a', b'1234')
+        cache.put('b', b'12345678901')
+        self.assertFalse('b' in cache)
+        self.assertEqual(cache.size, 4)
+        cache.put('a', b'12345678901')
+        self.assertFalse('a' in cache)
+        self.assertEqual(cache.size, 0)
+
+
 class Test_strings_differ(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from pyramid.util import strings_differ
@@ -488,6 +488,153 @@ class RenderViewTests(BaseTest, unittest.TestCase):
         self.assertEqual(s, b'anotherview')
 
 
+class Test_find_views(BaseTest, unittest.TestCase):
+    def _callFUT(self, registry, view_name, context_iface=None):
+        from pyramid.view import _find_views
+
+        if context_iface is None:
+            context_iface = IContext
+        return _find_views(registry, IRequest, context_iface, view_name)
+
+    def _makeRegistry(self, miss_cache_size=None):
+        from pyramid.registry import Registry
+        from pyramid.util import LRUCache
+
+        registry = Registry()
+        if miss_cache_size is not None:
+            registry.view_lookup_miss_cache = LRUCache(miss_cache_size)
+        return registry
+
+    def test_hit_is_cached(self):
+        registry = self._makeRegistry()
+        view = make_view('OK')
+        self._registerView(registry, view, 'registered')
+        self.assertEqual(self._callFUT(registry, 'registered'), [view])
+        self.assertEqual(
+            registry._view_lookup_cache,
+            {(IRequest, IContext, 'registered'): [view]},
+        )
+
+    def test_miss_not_cached_without_miss_cache(self):
+        registry = self._makeRegistry()
+        self.assertEqual(self._callFUT(registry, 'missing'), [])
+        self.assertEqual(registry._view_lookup_cache, {})
+
+    def test_miss_cached_in_miss_cache(self):
+        registry = self._makeRegistry(10)
+        registered = []
+        adapters = registry.adapters
+        original = adapters.registered
+
+        def counting(*arg, **kw):
+            registered.append(arg)
+            return original(*arg, **kw)
+
+        adapters.registered = counting
+        try:
+            self.assertEqual(self._callFUT(registry, 'missing'), [])
+            searches = len(registered)
+            self.assertTrue(searches)
+            self.assertEqual(self._callFUT(registry, 'missing'), [])
+            self.assertEqual(len(registered), searches)
+        finally:
+            del adapters.registered
+        miss_cache = registry.view_lookup_miss_cache
+        self.assertEqual(len(miss_cache), 1)
+        self.assertEqual(miss_cache.hits, 1)
+        self.assertEqual(miss_cache.misses, 1)
+        self.assertEqual(registry._view_lookup_cache, {})
+
+    def test_miss_cache_is_bounded(self):
+        registry = self._makeRegistry(2)
+        for name in ('a', 'b', 'c', 'd'):
+            self.assertEqual(self._callFUT(registry, name), [])
+        miss_cache = registry.view_lookup_miss_cache
+        self.assertEqual(len(miss_cache), 2)
+        self.assertEqual(miss_cache.evictions, 2)
+
+    def test_miss_cache_does_not_shadow_other_view_types(self):
+        from pyramid.interfaces import IView
+        from pyramid.view import _find_views
+
+        registry = self._makeRegistry(10)
+        view = make_view('OK')
+        self._registerView(registry, view, 'name')
+        self.assertEqual(
+            _find_views(
+                registry, IRequest, IContext, 'name', view_types=(Interface,)
+            ),
+            [],
+        )
+        registry._view_lookup_cache.clear()
+        self.assertEqual(
+            _find_views(
+                registry, IRequest, IContext, 'name', view_types=(IView,)
+            ),
+            [view],
+        )
+
+    def test_miss_cache_cleared_by_view_registration(self):
+        from pyramid.util import LRUCache
+
+        config = self.config
+        registry = config.registry
+        registry.view_lookup_miss_cache = LRUCache(10)
+        self.assertEqual(self._callFUT(registry, 'late'), [])
+        view = make_view('OK')
+        config.add_view(view, name='late', context=IContext)
+        config.commit()
+        views = self._callFUT(registry, 'late')
+        self.assertEqual(len(views), 1)
+        self.assertEqual(len(registry.view_lookup_miss_cache), 0)
+
+
+class Test_precompute_view_lookups(unittest.TestCase):
+    def setUp(self):
+        from pyramid.config import Configurator
+
+        self.config = Configurator()
+
+    def _callFUT(self):
+        from pyramid.view import _precompute_view_lookups
+
+        self.config.commit()
+        _precompute_view_lookups(self.config.registry)
+        return self.config.registry._view_lookup_cache
+
+    def test_subclass_of_context_class(self):
+        from zope.interface import implementedBy
+
+        class Base:
+            pass
+
+        class Sub(Base):
+            pass
+
+        view = make_view('OK')
+        self.config.add_view(view, context=Base, name='edit')
+        cache = self._callFUT()
+        views = cache[(IRequest, implementedBy(Sub), 'edit')]
+        self.assertEqual(len(views), 1)
+        self.assertFalse((IRequest, implementedBy(Sub), '') in cache)
+
+    def test_exception_views_of_routes_share_lookups(self):
+        from zope.interface import implementedBy
+
+        from pyramid.httpexceptions import HTTPNotFound
+        from pyramid.interfaces import IRouteRequest
+
+        self.config.add_route('a', '/a')
+        self.config.add_route('b', '/b')
+        cache = self._callFUT()
+        registry = self.config.registry
+        a = registry.getUtility(IRouteRequest, name='a').combined
+        b = registry.getUtility(IRouteRequest, name='b').combined
+        spec = implementedBy(HTTPNotFound)
+        self.assertTrue(cache[(a, spec, '')])
+        self.assertIs(cache[(a, spec, '')], cache[(b, spec, '')])
+
+
 class TestViewConfigDecorator(unittest.TestCase):
     def setUp(self):
         testing.setUp()
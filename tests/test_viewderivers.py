@@ -126,6 +126,95 @@ class TestDeriveView(unittest.TestCase):
         response = result(None, None)
         self.assertEqual(response, r)
 
+    def test_coroutine_function_returns_true_Response(self):
+        from pyramid.response import Response
+
+        r = Response('Hello')
+
+        async def view(request):
+            return r
+
+        result = self.config.derive_view(view)
+        response = result(None, self._makeRequest())
+        self.assertEqual(response, r)
+
+    def test_coroutine_function_with_renderer(self):
+        from pyramid.response import Response
+
+        async def view(request):
+            return {'a': '1'}
+
+        result = self.config.derive_view(view, renderer='json')
+        request = self._makeRequest()
+        request.response = Response()
+        response = result(None, request)
+        self.assertEqual(response.body, b'{"a": "1"}')
+
+    def test_coroutine_class_view_with_attr(self):
+        response = DummyResponse()
+
+        class AView:
+            def __init__(self, request):
+                pass
+
+            async def index(self):
+                return response
+
+        result = self.config.derive_view(AView, attr='index')
+        self.assertEqual(result(None, self._makeRequest()), response)
+        self.assertEqual(
+            result.__text__,
+            'method index of class %s' % ('tests.test_viewderivers.AView'),
+        )
+
+    def test_coroutine_instance_view(self):
+        response = DummyResponse()
+
+        class AView:
+            async def __call__(self, context, request):
+                return response
+
+        result = self.config.derive_view(AView())
+        self.assertEqual(result(None, self._makeRequest()), response)
+
+    def test_coroutine_view_secured_view_raises_forbidden(self):
+        from pyramid.httpexceptions import HTTPForbidden
+
+        called = []
+
+        async def view(request):  # pragma: no cover
+            called.append(True)
+
+        self.config.registry.settings = {}
+        self._registerSecurityPolicy(False)
+        result = self.config._derive_view(view, permission='view')
+        request = self._makeRequest()
+        request.view_name = 'view_name'
+        request.url = 'url'
+        self.assertRaises(HTTPForbidden, result, None, request)
+        self.assertEqual(called, [])
+
+    def test_coroutine_view_csrf_view_fails_with_bad_POST_token(self):
+        from pyramid.exceptions import BadCSRFToken
+
+        async def inner_view(request):  # pragma: no cover
+            pass
+
+        request = self._makeRequest()
+        request.scheme = "http"
+        request.method = 'POST'
+        request.session = DummySession({'csrf_token': 'foo'})
+        request.POST = {'csrf_token': 'bar'}
+        view = self.config._derive_view(inner_view, require_csrf=True)
+        self.assertRaises(BadCSRFToken, lambda: view(None, request))
+
+    def test_coroutine_view_raises(self):
+        async def view(request):
+            raise ZeroDivisionError
+
+        result = self.config.derive_view(view)
+        self.assertRaises(ZeroDivisionError, result, None, self._makeRequest())
+
     def test_requestonly_default_method_returns_non_adaptable(self):
         request = DummyRequest()
 
@@ -232,6 +321,31 @@ class TestDeriveView(unittest.TestCase):
         context = testing.DummyResource()
         self.assertEqual(result(context, request).body, b'moo')
 
+    def test_function_with_renderer_factory_called_once(self):
+        created = []
+
+        def moo(info):
+            created.append(info)
+
+            def inner(value, system):
+                return value
+
+            return inner
+
+        def view(request):
+            return b'OK'
+
+        self.config.add_renderer('moo', moo)
+        result = self.config.derive_view(view, renderer='moo')
+        context = testing.DummyResource()
+        self.assertEqual(result(context, self._makeRequest()).body, b'OK')
+        self.assertEqual(result(context, self._makeRequest()).body, b'OK')
+        self.assertEqual(len(created), 1)
+        request = self._makeRequest()
+        request.override_renderer = 'moo'
+        self.assertEqual(result(context, request).body, b'OK')
+        self.assertEqual(len(created), 2)
+
     def test_requestonly_function_with_renderer_request_has_view(self):
         response = DummyResponse()
 
@@ -851,6 +965,20 @@ class TestDeriveView(unittest.TestCase):
         self.assertEqual(next, True)
         self.assertEqual(predicates, [True, True])
 
+    def test_with_predicates_predicated_view(self):
+        response = DummyResponse()
+        view = lambda *arg: response
+        predicates = []
+
+        def predicate(context, request):
+            predicates.append(True)
+            return False
+
+        result = self.config._derive_view(view, predicates=[predicate])
+        self.assertEqual(result.__predicates__, [predicate])
+        self.assertEqual(result.__predicated_view__(None, None), response)
+        self.assertEqual(predicates, [])
+
     def test_with_predicates_notall(self):
         from pyramid.httpexceptions import HTTPNotFound
 
@@ -1189,6 +1317,20 @@ class TestDeriveView(unittest.TestCase):
         result = self.config._derive_view(view, phash='nondefault')
         self.assertNotEqual(result, view)
 
+    def test_attr_wrapped_view_original_view_not_decorated(self):
+        from pyramid.renderers import null_renderer
+
+        def view(context, request):
+            return 'OK'
+
+        result = self.config._derive_view(
+            view, phash='nondefault', renderer=null_renderer
+        )
+        self.assertIs(result.__wraps__, view)
+        self.assertEqual(result.__phash__, 'nondefault')
+        self.assertFalse(hasattr(view, '__phash__'))
+        self.assertEqual(result(None, None), 'OK')
+
     def test_http_cached_view_integer(self):
         import datetime
 